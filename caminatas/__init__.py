@@ -0,0 +1,2 @@
+# Código común a una_dimension, dos_dimensiones y n_dimensiones: generadores,
+# motor de caminatas en Z^d, caché, perfilador, progreso y modo distribuido.
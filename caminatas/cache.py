@@ -0,0 +1,358 @@
+import hashlib
+import json
+import os
+import struct
+import tempfile
+from collections import OrderedDict
+
+import numpy as np
+
+from caminatas.generador import GAMMA, GENERADORES, GeneradorCongruenciaLineal
+
+SEMILLAS_POR_PAGINA = 4096  # Semillas consecutivas guardadas en cada archivo
+TAMANO_MAXIMO = 256 * 10**6  # Bytes en disco antes de descartar páginas
+PAGINAS_EN_MEMORIA = 64  # Páginas que se conservan en memoria
+
+_MAGICO = b"CAMINATAS-CACHE1"
+_EXTENSION = ".pagina"
+
+
+def _parametros_generador(generador: str):
+    """Parámetros que determinan la secuencia del generador indicado."""
+    if generador not in GENERADORES:
+        raise ValueError(f"Generador desconocido: {generador}")
+
+    referencia = GENERADORES[generador](0)
+    parametros = {"nombre": generador, "m": referencia.m}
+    if isinstance(referencia, GeneradorCongruenciaLineal):
+        parametros.update(a=referencia.a, c=referencia.c)
+    else:
+        parametros["gamma"] = GAMMA
+    return parametros
+
+
+class CacheResultados:
+    """
+    Caché en disco, con un frente en memoria, de las posiciones finales de
+    caminatas ya simuladas.
+
+    Cada resultado se identifica por (parámetros del generador, semilla,
+    pasos, dimensión): la posición final de la caminata con esa semilla
+    después de esos pasos. Como una caminata más larga empieza igual que una
+    más corta con la misma semilla, la posición en un paso k de cualquier
+    caminata es la posición final de la caminata de k pasos; así, los puntos
+    de control también se guardan y consultan como posiciones finales.
+
+    Los resultados se agrupan en páginas de SEMILLAS_POR_PAGINA semillas
+    consecutivas con los mismos pasos. El nombre del archivo de cada página
+    es el hash SHA-256 de su clave.
+
+    Attributes
+    ----------
+    --> directorio (str): Carpeta donde se guardan las páginas.
+    --> dimension (int): Dimensión de las posiciones guardadas.
+    --> tamano_maximo (int): Bytes en disco a partir de los cuales se
+        descartan las páginas usadas hace más tiempo.
+    --> paginas_en_memoria (int): Páginas que se conservan en memoria.
+
+    Methods
+    -------
+    obtener(semillas, pasos, generador="lcg")
+        Busca las posiciones finales guardadas de varias caminatas.
+
+    guardar(semillas, pasos, posiciones, generador="lcg")
+        Guarda las posiciones finales de varias caminatas.
+
+    consultar(semillas, pasos, puntos_control=(), generador="lcg")
+        Arma un resultado como el de `caminatas_en_lote` si todo está guardado.
+
+    guardar_resultado(semillas, pasos, resultado, puntos_control=(), generador="lcg")
+        Guarda un resultado de `caminatas_en_lote`.
+
+    limpiar()
+        Borra todas las páginas, en memoria y en disco.
+
+    Notes
+    -----
+    - Cada archivo incluye su clave y un hash SHA-256 del contenido. Un
+      archivo dañado o de otra clave se borra y se trata como ausente.
+    - Las páginas se escriben en un archivo temporal que luego reemplaza al
+      anterior, por lo que una interrupción nunca deja una página a medias.
+    - El orden de uso en disco es la fecha de modificación de cada archivo,
+      que se actualiza al leerlo.
+    """
+
+    def __init__(
+        self,
+        directorio,
+        dimension: int,
+        tamano_maximo: int = TAMANO_MAXIMO,
+        paginas_en_memoria: int = PAGINAS_EN_MEMORIA,
+    ):
+        """
+        Crear la caché sobre una carpeta, que se crea si no existe.
+
+        Parameters
+        ----------
+        directorio : str or os.PathLike
+            Carpeta donde se guardan las páginas. Puede compartirse entre
+            dimensiones: la dimensión es parte de la clave.
+        dimension : int
+            Dimensión de las posiciones guardadas.
+        tamano_maximo : int, optional
+            Bytes en disco a partir de los cuales se descartan páginas.
+        paginas_en_memoria : int, optional
+            Páginas que se conservan en memoria.
+        """
+        self.directorio = os.fspath(directorio)
+        self.dimension = dimension
+        self.tamano_maximo = tamano_maximo
+        self.paginas_en_memoria = paginas_en_memoria
+        self._memoria = OrderedDict()  # Nombre de página -> (presentes, posiciones)
+        os.makedirs(self.directorio, exist_ok=True)
+
+    def _clave(self, generador: str, pasos: int, pagina: int):
+        """Texto que identifica una página; su hash es el nombre del archivo."""
+        return json.dumps(
+            {
+                "generador": _parametros_generador(generador),
+                "dimension": self.dimension,
+                "pasos": int(pasos),
+                "pagina": int(pagina),
+                "semillas_por_pagina": SEMILLAS_POR_PAGINA,
+            },
+            sort_keys=True,
+        ).encode()
+
+    def _ruta(self, nombre: str):
+        return os.path.join(self.directorio, nombre + _EXTENSION)
+
+    def _leer(self, nombre: str, clave: bytes):
+        """Leer una página del disco; None si no existe o no es válida."""
+        ruta = self._ruta(nombre)
+        try:
+            with open(ruta, "rb") as archivo:
+                contenido = archivo.read()
+        except FileNotFoundError:
+            return None
+
+        cabecera = len(_MAGICO) + 32
+        cuerpo = contenido[cabecera:]
+        valida = (
+            contenido[: len(_MAGICO)] == _MAGICO
+            and hashlib.sha256(cuerpo).digest() == contenido[len(_MAGICO) : cabecera]
+        )
+        if valida:
+            (largo_clave,) = struct.unpack_from("<I", cuerpo)
+            datos = cuerpo[4 + largo_clave :]
+            valida = cuerpo[4 : 4 + largo_clave] == clave and len(datos) == (
+                SEMILLAS_POR_PAGINA * (1 + 8 * self.dimension)
+            )
+        if not valida:
+            os.remove(ruta)
+            return None
+
+        os.utime(ruta)  # Marcarla como usada recientemente
+        presentes = np.frombuffer(datos, dtype=np.bool_, count=SEMILLAS_POR_PAGINA)
+        posiciones = np.frombuffer(
+            datos, dtype="<i8", offset=SEMILLAS_POR_PAGINA
+        ).reshape(SEMILLAS_POR_PAGINA, self.dimension)
+        return presentes.copy(), posiciones.astype(np.int64)
+
+    def _escribir(self, nombre: str, clave: bytes, presentes, posiciones):
+        """Escribir una página en disco de forma atómica."""
+        cuerpo = (
+            struct.pack("<I", len(clave))
+            + clave
+            + presentes.tobytes()
+            + posiciones.astype("<i8").tobytes()
+        )
+        descriptor, temporal = tempfile.mkstemp(dir=self.directorio, suffix=".tmp")
+        with os.fdopen(descriptor, "wb") as archivo:
+            archivo.write(_MAGICO + hashlib.sha256(cuerpo).digest() + cuerpo)
+        os.replace(temporal, self._ruta(nombre))
+
+    def _pagina(self, generador: str, pasos: int, pagina: int, crear: bool):
+        """
+        Devolver (nombre, clave, presentes, posiciones) de una página.
+
+        Se busca primero en memoria y luego en disco. Si no existe, se
+        devuelve una página vacía si `crear` es True, o None si no.
+        """
+        clave = self._clave(generador, pasos, pagina)
+        nombre = hashlib.sha256(clave).hexdigest()
+        if nombre in self._memoria:
+            self._memoria.move_to_end(nombre)
+            return (nombre, clave, *self._memoria[nombre])
+
+        leida = self._leer(nombre, clave)
+        if leida is None:
+            if not crear:
+                return None
+            leida = (
+                np.zeros(SEMILLAS_POR_PAGINA, dtype=np.bool_),
+                np.zeros((SEMILLAS_POR_PAGINA, self.dimension), dtype=np.int64),
+            )
+
+        self._memoria[nombre] = leida
+        if len(self._memoria) > self.paginas_en_memoria:
+            self._memoria.popitem(last=False)
+        return (nombre, clave, *leida)
+
+    def obtener(self, semillas, pasos: int, generador: str = "lcg"):
+        """
+        Buscar las posiciones finales guardadas de varias caminatas.
+
+        Parameters
+        ----------
+        semillas : array-like of int
+            Semilla de cada caminata.
+        pasos : int
+            Pasos de las caminatas.
+        generador : str, optional
+            Generador de números pseudoaleatorios ("lcg" o "splitmix").
+
+        Returns
+        -------
+        tuple of numpy.ndarray
+            (posiciones, encontradas): arreglo int64 de forma
+            (caminatas, dimension) con la posición final de cada caminata y
+            arreglo bool que indica cuáles estaban guardadas. Las posiciones
+            de las caminatas no encontradas no tienen significado.
+        """
+        semillas = np.atleast_1d(np.asarray(semillas, dtype=np.uint64))
+        posiciones = np.zeros((len(semillas), self.dimension), dtype=np.int64)
+        encontradas = np.zeros(len(semillas), dtype=np.bool_)
+
+        paginas = semillas // SEMILLAS_POR_PAGINA
+        desplazamientos = (semillas % SEMILLAS_POR_PAGINA).astype(np.intp)
+        for pagina in np.unique(paginas).tolist():
+            leida = self._pagina(generador, pasos, pagina, crear=False)
+            if leida is None:
+                continue
+            _, _, presentes, guardadas = leida
+            en_pagina = paginas == pagina
+            posiciones[en_pagina] = guardadas[desplazamientos[en_pagina]]
+            encontradas[en_pagina] = presentes[desplazamientos[en_pagina]]
+
+        return posiciones, encontradas
+
+    def guardar(self, semillas, pasos: int, posiciones, generador: str = "lcg"):
+        """
+        Guardar las posiciones finales de varias caminatas.
+
+        Parameters
+        ----------
+        semillas : array-like of int
+            Semilla de cada caminata.
+        pasos : int
+            Pasos de las caminatas.
+        posiciones : array-like of int
+            Posición final de cada caminata, de forma (caminatas,) o
+            (caminatas, dimension).
+        generador : str, optional
+            Generador de números pseudoaleatorios ("lcg" o "splitmix").
+        """
+        semillas = np.atleast_1d(np.asarray(semillas, dtype=np.uint64))
+        posiciones = np.asarray(posiciones, dtype=np.int64).reshape(
+            len(semillas), self.dimension
+        )
+
+        paginas = semillas // SEMILLAS_POR_PAGINA
+        desplazamientos = (semillas % SEMILLAS_POR_PAGINA).astype(np.intp)
+        for pagina in np.unique(paginas).tolist():
+            nombre, clave, presentes, guardadas = self._pagina(
+                generador, pasos, pagina, crear=True
+            )
+            en_pagina = paginas == pagina
+            presentes[desplazamientos[en_pagina]] = True
+            guardadas[desplazamientos[en_pagina]] = posiciones[en_pagina]
+            self._escribir(nombre, clave, presentes, guardadas)
+
+        self._recortar()
+
+    def consultar(self, semillas, pasos: int, puntos_control=(), generador="lcg"):
+        """
+        Armar un resultado como el de `caminatas_en_lote` con lo guardado.
+
+        Parameters
+        ----------
+        semillas : array-like of int
+            Semilla de cada caminata.
+        pasos : int
+            Pasos de las caminatas.
+        puntos_control : sequence of int, optional
+            Pasos en los que se necesita la posición.
+        generador : str, optional
+            Generador de números pseudoaleatorios ("lcg" o "splitmix").
+
+        Returns
+        -------
+        dict or None
+            - "final": arreglo int64 de forma (caminatas, dimension).
+            - "puntos_control": arreglo int64 de forma
+              (caminatas, len(puntos_control), dimension).
+
+            None si falta alguna caminata o algún punto de control.
+        """
+        finales, encontradas = self.obtener(semillas, pasos, generador)
+        if not encontradas.all():
+            return None
+
+        registro = np.zeros(
+            (len(finales), len(puntos_control), self.dimension), dtype=np.int64
+        )
+        for indice, paso in enumerate(puntos_control):
+            registro[:, indice], encontradas = self.obtener(semillas, paso, generador)
+            if not encontradas.all():
+                return None
+        return {"final": finales, "puntos_control": registro}
+
+    def guardar_resultado(
+        self, semillas, pasos: int, resultado, puntos_control=(), generador="lcg"
+    ):
+        """
+        Guardar las posiciones de un resultado de `caminatas_en_lote`.
+
+        Parameters
+        ----------
+        semillas : array-like of int
+            Semilla de cada caminata.
+        pasos : int
+            Pasos de las caminatas.
+        resultado : dict
+            Resultado con las claves "final" y "puntos_control".
+        puntos_control : sequence of int, optional
+            Pasos de las columnas de resultado["puntos_control"].
+        generador : str, optional
+            Generador de números pseudoaleatorios ("lcg" o "splitmix").
+        """
+        semillas = np.atleast_1d(np.asarray(semillas, dtype=np.uint64))
+        self.guardar(semillas, pasos, resultado["final"], generador)
+        for indice, paso in enumerate(puntos_control):
+            self.guardar(
+                semillas, paso, resultado["puntos_control"][:, indice], generador
+            )
+
+    def _recortar(self):
+        """Borrar las páginas usadas hace más tiempo hasta no superar el límite."""
+        archivos = [
+            entrada
+            for entrada in os.scandir(self.directorio)
+            if entrada.name.endswith(_EXTENSION)
+        ]
+        estados = [(entrada, entrada.stat()) for entrada in archivos]
+        total = sum(estado.st_size for _, estado in estados)
+        for entrada, estado in sorted(estados, key=lambda par: par[1].st_mtime_ns):
+            if total <= self.tamano_maximo:
+                break
+            os.remove(entrada.path)
+            self._memoria.pop(entrada.name[: -len(_EXTENSION)], None)
+            total -= estado.st_size
+
+    def limpiar(self):
+        """Borrar todas las páginas, en memoria y en disco."""
+        self._memoria.clear()
+        for entrada in os.scandir(self.directorio):
+            if entrada.name.endswith(_EXTENSION):
+                os.remove(entrada.path)
@@ -0,0 +1,523 @@
+import argparse
+import multiprocessing
+import threading
+import time
+from collections import deque
+from multiprocessing.managers import BaseManager
+
+import numpy as np
+
+from caminatas.motor import caminatas_en_lote
+from caminatas.progreso import Progreso, avanzar
+
+CAMINATAS_POR_FRAGMENTO = 2**16  # Caminatas de cada fragmento de semillas
+MAXIMO_INTENTOS = 3  # Fallos de un mismo fragmento antes de abortar
+ESPERA = 0.5  # Segundos entre consultas del coordinador al tablero
+PUERTO = 50000
+CLAVE = b"caminatas-aleatorias"  # Clave de autenticación por defecto
+
+_tablero = None  # Tablero del proceso servidor (ver `_iniciar_tablero`)
+
+
+def resumir_fragmento(
+    semilla_base: int,
+    inicio: int,
+    fin: int,
+    pasos: int,
+    dimension: int,
+    paso_objetivo: int,
+    generador: str = "lcg",
+):
+    """
+    Simular las caminatas [inicio, fin) y devolver solo su resumen.
+
+    Parameters
+    ----------
+    semilla_base : int
+        Semilla de la caminata 0; la caminata i usa semilla_base + i.
+    inicio, fin : int
+        Índices de las caminatas del fragmento.
+    pasos : int
+        Número de pasos de cada caminata.
+    dimension : int
+        Dimensión d de la red.
+    paso_objetivo : int
+        Paso en el que se cuenta cuántas caminatas están en el origen.
+    generador : str, optional
+        Generador de números pseudoaleatorios (ver `motor.caminatas_en_lote`).
+
+    Returns
+    -------
+    dict
+        - "caminatas": cantidad de caminatas del fragmento.
+        - "en_origen": cuántas están en el origen en `paso_objetivo`.
+        - "sitios": arreglo int64 de forma (sitios, d) con las posiciones
+          finales distintas, en orden lexicográfico.
+        - "conteos": arreglo int64 con cuántas caminatas terminan en cada
+          sitio.
+    """
+    semillas = semilla_base + np.arange(inicio, fin, dtype=np.uint64)
+    resultado = caminatas_en_lote(
+        semillas, pasos, dimension, puntos_control=[paso_objetivo], generador=generador
+    )
+    en_origen = ~resultado["puntos_control"][:, 0].any(axis=1)
+    sitios, conteos = np.unique(resultado["final"], axis=0, return_counts=True)
+    return {
+        "caminatas": fin - inicio,
+        "en_origen": int(np.count_nonzero(en_origen)),
+        "sitios": sitios,
+        "conteos": conteos.astype(np.int64),
+    }
+
+
+def fusionar_parciales(parciales, dimension: int):
+    """
+    Combinar los resultados de `resumir_fragmento` en uno solo.
+
+    Parameters
+    ----------
+    parciales : iterable of dict
+        Resultados de fragmentos distintos.
+    dimension : int
+        Dimensión d de la red.
+
+    Returns
+    -------
+    dict
+        Mismo formato que `resumir_fragmento`, con los conteos sumados y
+        los sitios de todos los fragmentos.
+    """
+    parciales = list(parciales)
+    sitios = np.zeros((0, dimension), dtype=np.int64)
+    conteos = np.zeros(0, dtype=np.int64)
+    if parciales:
+        sitios, inversos = np.unique(
+            np.concatenate([parcial["sitios"] for parcial in parciales]),
+            axis=0,
+            return_inverse=True,
+        )
+        conteos = np.bincount(
+            inversos.reshape(-1),
+            weights=np.concatenate([parcial["conteos"] for parcial in parciales]),
+            minlength=len(sitios),
+        ).astype(np.int64)
+    return {
+        "caminatas": sum(parcial["caminatas"] for parcial in parciales),
+        "en_origen": sum(parcial["en_origen"] for parcial in parciales),
+        "sitios": sitios,
+        "conteos": conteos,
+    }
+
+
+class Tablero:
+    """
+    Reparto de los fragmentos de una simulación entre los trabajadores.
+
+    Vive en el proceso servidor del coordinador; los trabajadores lo usan a
+    través de un proxy de `multiprocessing.managers`, así que todos sus
+    métodos toman un cerrojo.
+
+    Attributes
+    ----------
+    --> tarea (dict): Argumentos comunes de `resumir_fragmento` (semilla
+        base, pasos, dimensión, paso objetivo y generador).
+
+    Methods
+    -------
+    pedir()
+        Asigna un fragmento a un trabajador.
+
+    entregar(indice, parcial)
+        Registra el resultado de un fragmento.
+
+    fallar(indice, mensaje)
+        Devuelve a la cola un fragmento cuyo trabajador falló.
+
+    esperar(segundos)
+        Espera a que termine la simulación.
+
+    Notes
+    -----
+    - Cuando no quedan fragmentos pendientes, un trabajador libre recibe el
+      fragmento en curso asignado hace más tiempo, que puede estar en un
+      trabajador lento o caído. Gana la primera entrega y las demás se
+      descartan; como cada fragmento se define por sus semillas, todas las
+      entregas de un fragmento son idénticas.
+    - Un fragmento que falla `maximo_intentos` veces aborta la simulación,
+      porque el error se repetiría en cualquier trabajador.
+    """
+
+    def __init__(self, tarea: dict, limites, maximo_intentos: int = MAXIMO_INTENTOS):
+        """
+        Crear el tablero con todos los fragmentos pendientes.
+
+        Parameters
+        ----------
+        tarea : dict
+            Argumentos comunes de `resumir_fragmento`.
+        limites : list of tuple
+            (inicio, fin) de cada fragmento.
+        maximo_intentos : int, optional
+            Fallos permitidos por fragmento.
+        """
+        self.tarea = tarea
+        self.maximo_intentos = maximo_intentos
+        self._limites = list(limites)
+        self._pendientes = deque(range(len(self._limites)))
+        self._en_curso = {}  # Índice -> instante de su última asignación
+        self._intentos = [0] * len(self._limites)
+        self._parciales = {}
+        self._error = None
+        self._cerrojo = threading.Lock()
+        self._terminado = threading.Event()
+        if not self._limites:
+            self._terminado.set()
+
+    def pedir(self):
+        """
+        Asignar un fragmento a un trabajador.
+
+        Returns
+        -------
+        tuple or None
+            (indice, argumentos) donde `argumentos` son los de
+            `resumir_fragmento`, o None si ya no queda trabajo.
+        """
+        with self._cerrojo:
+            if self._terminado.is_set():
+                return None
+            if self._pendientes:
+                indice = self._pendientes.popleft()
+            else:
+                # Robar el fragmento en curso más antiguo
+                indice = min(self._en_curso, key=self._en_curso.get)
+            self._en_curso[indice] = time.monotonic()
+
+        inicio, fin = self._limites[indice]
+        return indice, {**self.tarea, "inicio": inicio, "fin": fin}
+
+    def entregar(self, indice: int, parcial: dict):
+        """Registrar el resultado de un fragmento (solo la primera entrega)."""
+        with self._cerrojo:
+            if indice in self._parciales or self._terminado.is_set():
+                return
+            self._parciales[indice] = parcial
+            self._en_curso.pop(indice, None)
+            if indice in self._pendientes:
+                self._pendientes.remove(indice)
+            if len(self._parciales) == len(self._limites):
+                self._terminado.set()
+
+    def fallar(self, indice: int, mensaje: str):
+        """Devolver a la cola un fragmento cuyo trabajador falló."""
+        with self._cerrojo:
+            if indice in self._parciales or self._terminado.is_set():
+                return
+            self._intentos[indice] += 1
+            if self._intentos[indice] >= self.maximo_intentos:
+                inicio, fin = self._limites[indice]
+                self._error = (
+                    f"El fragmento [{inicio}, {fin}) falló "
+                    f"{self._intentos[indice]} veces: {mensaje}"
+                )
+                self._terminado.set()
+                return
+            self._en_curso.pop(indice, None)
+            if indice not in self._pendientes:
+                self._pendientes.appendleft(indice)
+
+    def esperar(self, segundos: float):
+        """Esperar hasta `segundos` a que termine; devolver si terminó."""
+        return self._terminado.wait(segundos)
+
+    def completadas(self):
+        """Cantidad de caminatas de los fragmentos ya entregados."""
+        with self._cerrojo:
+            return sum(parcial["caminatas"] for parcial in self._parciales.values())
+
+    def error(self):
+        """Mensaje del fragmento que abortó la simulación, o None."""
+        return self._error
+
+    def parciales(self):
+        """Resultados entregados, en el orden de los fragmentos."""
+        with self._cerrojo:
+            return [self._parciales[indice] for indice in sorted(self._parciales)]
+
+
+def _iniciar_tablero(tarea, limites, maximo_intentos):
+    """Crear el tablero en el proceso servidor del coordinador."""
+    global _tablero
+    _tablero = Tablero(tarea, limites, maximo_intentos)
+
+
+def _obtener_tablero():
+    return _tablero
+
+
+class _Administrador(BaseManager):
+    pass
+
+
+_Administrador.register("tablero", callable=_obtener_tablero)
+
+
+def trabajar(direccion, clave: bytes = CLAVE):
+    """
+    Pedir y simular fragmentos al coordinador hasta que no quede trabajo.
+
+    Parameters
+    ----------
+    direccion : tuple
+        (host, puerto) del coordinador.
+    clave : bytes, optional
+        Clave de autenticación del coordinador.
+
+    Returns
+    -------
+    int
+        Cantidad de fragmentos simulados por este trabajador.
+
+    Notes
+    -----
+    - Un error de sistema, de memoria o de argumentos (OSError,
+      MemoryError o ValueError) al simular un fragmento se informa al
+      coordinador, que lo vuelve a asignar, y el trabajador sigue con el
+      siguiente. Cualquier otra excepción es un error de programación y
+      detiene al trabajador.
+    - Si el coordinador se cierra, el trabajador termina sin error.
+    """
+    administrador = _Administrador(address=tuple(direccion), authkey=clave)
+    administrador.connect()
+    tablero = administrador.tablero()
+
+    simulados = 0
+    try:
+        while (asignacion := tablero.pedir()) is not None:
+            indice, argumentos = asignacion
+            try:
+                parcial = resumir_fragmento(**argumentos)
+            except (OSError, MemoryError, ValueError) as error:
+                tablero.fallar(indice, repr(error))
+                continue
+            tablero.entregar(indice, parcial)
+            simulados += 1
+    except (EOFError, ConnectionError):
+        pass
+    return simulados
+
+
+def coordinar(
+    numero_simulaciones: int,
+    semilla_base: int,
+    pasos: int,
+    dimension: int,
+    paso_objetivo: int,
+    generador: str = "lcg",
+    direccion=("", PUERTO),
+    clave: bytes = CLAVE,
+    caminatas_por_fragmento: int = CAMINATAS_POR_FRAGMENTO,
+    trabajadores_locales: int = 0,
+    maximo_intentos: int = MAXIMO_INTENTOS,
+):
+    """
+    Repartir una simulación entre trabajadores y combinar sus resultados.
+
+    Las caminatas con semillas semilla_base + i se dividen en fragmentos de
+    índices consecutivos [inicio, fin). El coordinador los sirve con
+    `multiprocessing.managers` en `direccion`; cada trabajador (`trabajar`,
+    en esta u otra máquina) pide fragmentos, los simula con
+    `resumir_fragmento` y entrega solo su resumen.
+
+    Parameters
+    ----------
+    numero_simulaciones : int
+        Cantidad de caminatas a simular.
+    semilla_base : int
+        Semilla de la primera caminata.
+    pasos : int
+        Número de pasos de cada caminata.
+    dimension : int
+        Dimensión d de la red.
+    paso_objetivo : int
+        Paso en el que se cuenta cuántas caminatas están en el origen.
+    generador : str, optional
+        Generador de números pseudoaleatorios ("lcg" o "splitmix").
+    direccion : tuple, optional
+        (host, puerto) donde escucha el coordinador. Con puerto 0 se elige
+        uno libre.
+    clave : bytes, optional
+        Clave de autenticación que deben presentar los trabajadores.
+    caminatas_por_fragmento : int, optional
+        Cantidad de caminatas de cada fragmento.
+    trabajadores_locales : int, optional
+        Procesos trabajadores a lanzar en esta máquina, además de los que
+        se conecten desde otras.
+    maximo_intentos : int, optional
+        Fallos permitidos por fragmento (ver `Tablero`).
+
+    Returns
+    -------
+    dict
+        Resultado de `fusionar_parciales` con todos los fragmentos, idéntico
+        al de simular todas las caminatas en un solo proceso.
+
+    Raises
+    ------
+    RuntimeError
+        Si algún fragmento falla `maximo_intentos` veces.
+
+    Notes
+    -----
+    - Los resultados viajan serializados con pickle: use una clave propia
+      y solo en redes de confianza.
+    - El avance se informa con `progreso.avanzar` a medida que llegan los
+      fragmentos.
+    """
+    caminatas_por_fragmento = max(1, caminatas_por_fragmento)
+    limites = [
+        (inicio, min(inicio + caminatas_por_fragmento, numero_simulaciones))
+        for inicio in range(0, numero_simulaciones, caminatas_por_fragmento)
+    ]
+    tarea = {
+        "semilla_base": semilla_base,
+        "pasos": pasos,
+        "dimension": dimension,
+        "paso_objetivo": paso_objetivo,
+        "generador": generador,
+    }
+
+    administrador = _Administrador(address=tuple(direccion), authkey=clave)
+    administrador.start(_iniciar_tablero, (tarea, limites, maximo_intentos))
+    locales = []
+    try:
+        tablero = administrador.tablero()
+        for _ in range(trabajadores_locales):
+            proceso = multiprocessing.Process(
+                target=trabajar, args=(administrador.address, clave), daemon=True
+            )
+            proceso.start()
+            locales.append(proceso)
+
+        completadas = 0
+        while True:
+            terminado = tablero.esperar(ESPERA)
+            nuevas = tablero.completadas()
+            avanzar((nuevas - completadas) * pasos, nuevas - completadas)
+            completadas = nuevas
+            if terminado:
+                break
+
+        error = tablero.error()
+        if error is not None:
+            raise RuntimeError(error)
+        parciales = tablero.parciales()
+    finally:
+        administrador.shutdown()
+        for proceso in locales:
+            proceso.join()
+
+    return fusionar_parciales(parciales, dimension)
+
+
+def crear_parser(descripcion: str, dimension=None):
+    """
+    Crear el analizador de la línea de comandos de los programas distribuidos.
+
+    Parameters
+    ----------
+    descripcion : str
+        Descripción que muestra la ayuda.
+    dimension : int, optional
+        Dimensión fija del programa. Si no se indica, se agrega la opción
+        --dimension.
+
+    Returns
+    -------
+    argparse.ArgumentParser
+        Analizador con las opciones del coordinador y del trabajador, al que
+        cada programa puede agregar las suyas.
+    """
+    parser = argparse.ArgumentParser(description=descripcion)
+    parser.add_argument("modo", choices=["coordinador", "trabajador"])
+    parser.add_argument(
+        "--host", default="", help="dirección del coordinador (o donde escucha)"
+    )
+    parser.add_argument("--puerto", type=int, default=PUERTO)
+    parser.add_argument("--clave", default=CLAVE.decode())
+    if dimension is None:
+        parser.add_argument("--dimension", type=int, default=3)
+    parser.add_argument("--simulaciones", type=int, default=100)
+    parser.add_argument("--pasos", type=int, default=1000000)
+    parser.add_argument("--paso-objetivo", type=int, default=4)
+    parser.add_argument(
+        "--semilla",
+        type=int,
+        help="semilla base fija (por defecto se genera con la hora actual)",
+    )
+    parser.add_argument("--generador", choices=["lcg", "splitmix"], default="lcg")
+    parser.add_argument(
+        "--caminatas-por-fragmento", type=int, default=CAMINATAS_POR_FRAGMENTO
+    )
+    parser.add_argument(
+        "--trabajadores-locales",
+        type=int,
+        default=0,
+        help="procesos trabajadores a lanzar junto al coordinador",
+    )
+    parser.add_argument(
+        "--silencioso", action="store_true", help="no informar el avance"
+    )
+    return parser
+
+
+def ejecutar(argumentos, dimension=None):
+    """
+    Ejecutar el modo elegido en la línea de comandos.
+
+    Parameters
+    ----------
+    argumentos : argparse.Namespace
+        Opciones leídas con el analizador de `crear_parser`.
+    dimension : int, optional
+        Dimensión fija del programa; si no se indica, se usa la de
+        --dimension.
+
+    Returns
+    -------
+    dict or None
+        En el coordinador, el resultado de `coordinar`; en un trabajador,
+        None (solo se informa cuántos fragmentos simuló).
+    """
+    clave = argumentos.clave.encode()
+    if dimension is None:
+        dimension = argumentos.dimension
+
+    if argumentos.modo == "trabajador":
+        simulados = trabajar((argumentos.host, argumentos.puerto), clave)
+        print(f"{simulados} fragmentos simulados")
+        return None
+
+    if argumentos.semilla is not None:
+        semilla_base = argumentos.semilla
+    else:
+        # Generar semilla única basada en el tiempo actual
+        semilla_base = int(time.time() * 1000000) % (2**32 - 1)
+
+    with Progreso(
+        argumentos.simulaciones,
+        argumentos.pasos,
+        silencioso=argumentos.silencioso,
+    ):
+        return coordinar(
+            argumentos.simulaciones,
+            semilla_base,
+            argumentos.pasos,
+            dimension,
+            argumentos.paso_objetivo,
+            argumentos.generador,
+            (argumentos.host, argumentos.puerto),
+            clave,
+            argumentos.caminatas_por_fragmento,
+            argumentos.trabajadores_locales,
+        )
@@ -0,0 +1,751 @@
+from abc import ABC, abstractmethod
+from functools import cache
+
+import numpy as np
+
+TAMANO_BLOQUE = 2**16  # Cantidad de números generados por bloque vectorizado
+
+# Constantes de SplitMix64 (Steele, Lea y Flood, 2014)
+GAMMA = 0x9E3779B97F4A7C15  # Incremento del contador: parte fraccionaria de φ · 2^64
+MASCARA_64 = 2**64 - 1
+
+
+@cache
+def _coeficientes_bloque(a: int, c: int, tamano: int):
+    """
+    Calcular los coeficientes del salto afín para un bloque de la secuencia.
+
+    Para j = 1, 2, ..., tamano se cumple X_{n+j} = (A_j * X_n + C_j) mod 2^32,
+    por lo que un bloque completo se obtiene a partir de X_n con una sola
+    multiplicación y una suma vectorizadas.
+
+    Parameters
+    ----------
+    a : int
+        Multiplicador del generador.
+    c : int
+        Incremento del generador.
+    tamano : int
+        Cantidad de coeficientes a calcular.
+
+    Returns
+    -------
+    tuple of numpy.ndarray
+        Arreglos (A, C) de tipo uint32 y longitud `tamano`.
+
+    Notes
+    -----
+    - Los coeficientes se construyen por duplicación: conociendo los
+      primeros n, los siguientes n son A_{n+k} = A_k * A_n y
+      C_{n+k} = A_k * C_n + C_k.
+    - La aritmética uint32 de NumPy desborda de forma modular, lo que
+      equivale a reducir módulo 2^32.
+    - Los arreglos se comparten entre llamadas y son de solo lectura.
+    """
+    A = np.array([a], dtype=np.uint32)
+    C = np.array([c], dtype=np.uint32)
+
+    while len(A) < tamano:
+        A_n, C_n = A[-1], C[-1]
+        A, C = np.concatenate((A, A * A_n)), np.concatenate((C, A * C_n + C))
+
+    A, C = A[:tamano], C[:tamano]
+    A.flags.writeable = False
+    C.flags.writeable = False
+    return A, C
+
+
+def _coeficientes_salto(a: int, c: int, m: int, k: int):
+    """
+    Calcular los coeficientes del salto afín de k pasos en tiempo O(log k).
+
+    Compone la transformación X -> (a * X + c) mod m consigo misma por
+    exponenciación binaria, de modo que X_{n+k} = (A * X_n + C) mod m.
+
+    Parameters
+    ----------
+    a : int
+        Multiplicador del generador.
+    c : int
+        Incremento del generador.
+    m : int
+        Módulo del generador.
+    k : int
+        Cantidad de pasos a saltar (k >= 0).
+
+    Returns
+    -------
+    tuple of int
+        Coeficientes (A, C) del salto de k pasos.
+    """
+    A_salto, C_salto = 1, 0  # Transformación identidad
+    A_base, C_base = a % m, c % m
+
+    while k > 0:
+        if k & 1:
+            A_salto, C_salto = (A_base * A_salto) % m, (A_base * C_salto + C_base) % m
+        A_base, C_base = (A_base * A_base) % m, (A_base * C_base + C_base) % m
+        k >>= 1
+
+    return A_salto, C_salto
+
+
+class GeneradorAleatorio(ABC):
+    """
+    Interfaz común de los generadores de números pseudoaleatorios.
+
+    Los motores de simulación solo usan estos métodos, por lo que cualquier
+    generador que los implemente puede reemplazar al de congruencia lineal.
+    Las subclases deben implementar `siguiente_Ri`, `generar_Xi`, `saltar` y
+    `bloques_Xi`; `generar_Ri` se obtiene de `generar_Xi`.
+    Los valores enteros X_i están en [0, m) con m = 2^32 y R_i = X_i / m.
+
+    Methods
+    -------
+    siguiente_Ri()
+        Genera el siguiente número pseudoaleatorio uniforme en [0, 1).
+
+    generar_Xi(pasos)
+        Genera los siguientes `pasos` enteros X_i como arreglo uint32.
+
+    generar_Ri(pasos)
+        Genera los siguientes `pasos` números R_i como arreglo float64.
+
+    saltar(k)
+        Avanza la secuencia k pasos.
+
+    bloques_Xi(semillas, pasos, tamano_bloque)
+        Genera por bloques los X_i de varias caminatas a la vez.
+    """
+
+    m = 2**32  # Módulo: los X_i están en [0, m)
+
+    @abstractmethod
+    def siguiente_Ri(self):
+        """Generar el siguiente número pseudoaleatorio uniforme en [0, 1)."""
+
+    @abstractmethod
+    def generar_Xi(self, pasos: int, tamano_bloque: int = TAMANO_BLOQUE):
+        """Generar los siguientes `pasos` enteros X_i como arreglo uint32."""
+
+    def generar_Ri(self, pasos: int, tamano_bloque: int = TAMANO_BLOQUE):
+        """
+        Generar una secuencia de números pseudoaleatorios uniformes en [0, 1).
+
+        Parameters
+        ----------
+        pasos : int
+            Cantidad de números pseudoaleatorios a generar.
+        tamano_bloque : int, optional
+            Cantidad de números calculados en cada operación vectorizada.
+
+        Returns
+        -------
+        numpy.ndarray of float64
+            Arreglo con números pseudoaleatorios R_i = X_i / m, que coinciden
+            bit a bit con los de `siguiente_Ri`.
+        """
+        secuencia_Ri = self.generar_Xi(pasos, tamano_bloque).astype(np.float64)
+        secuencia_Ri /= self.m
+        return secuencia_Ri
+
+    @abstractmethod
+    def saltar(self, k: int):
+        """Avanzar la secuencia k pasos sin generar los números intermedios."""
+
+    @classmethod
+    @abstractmethod
+    def bloques_Xi(cls, semillas, pasos: int, tamano_bloque: int, desde: int = 0):
+        """
+        Generar en bloques los X_i de varias caminatas a la vez.
+
+        Parameters
+        ----------
+        semillas : array-like of int
+            Semilla de cada caminata.
+        pasos : int
+            Cantidad total de números a generar por caminata.
+        tamano_bloque : int
+            Cantidad máxima de columnas de cada bloque.
+        desde : int, optional
+            Cantidad de números que se consideran ya generados; los bloques
+            empiezan en el paso desde+1 sin generar los anteriores.
+
+        Yields
+        ------
+        tuple
+            (inicio, bloque) donde `bloque` es un arreglo uint32 de forma
+            (caminatas, columnas) cuya fila i contiene los X_i de los pasos
+            inicio+1 ... inicio+columnas del generador creado con semillas[i].
+        """
+
+
+class GeneradorCongruenciaLineal(GeneradorAleatorio):
+    """
+    Generador de números pseudoaleatorios usando el método de Congruencia Lineal.
+
+    Fórmula: X_{n+1} = (a * X_n + c) mod m
+
+    Attributes
+    ----------
+    --> semilla (int): Valor inicial para la secuencia pseudoaleatoria (X_0).
+    --> a (int): Multiplicador (1664525, valor recomendado por Numerical Recipes).
+    --> c (int): Incremento (1013904223).
+    --> m (int): Módulo (2^32, rango máximo de valores).
+    --> Método Formal: Ri = Xi / m
+
+
+    Methods
+    -------
+    siguiente_Ri()
+        Genera el siguiente número pseudoaleatorio uniforme en [0, 1).
+
+    generar_Xi(pasos)
+        Genera una secuencia de números enteros pseudoaleatorios X_i.
+
+    generar_Ri(pasos)
+        Genera una secuencia de números pseudoaleatorios uniformes en [0, 1).
+
+    saltar(k)
+        Avanza la secuencia k pasos en tiempo O(log k).
+
+    subflujos(numero, longitud)
+        Divide la secuencia en subflujos consecutivos que no se solapan.
+
+    bloques_Xi(semillas, pasos, tamano_bloque)
+        Genera por bloques los X_i de varias caminatas a la vez.
+
+    Notes
+    -----
+    - Los parámetros (a, c, m) están optimizados según Numerical Recipes
+    - La semilla debe ser un entero positivo menor que m
+    - La secuencia es determinista: misma semilla = misma secuencia
+    """
+
+    def __init__(self, semilla):
+        """
+        Inicializar el generador con una semilla específica.
+
+        Parameters
+        ----------
+        semilla : int
+            Valor inicial para la secuencia pseudoaleatoria. Debe ser un
+            entero no negativo menor que 2^32.
+        """
+        self.semilla = semilla  # Semilla
+        self.a = 1664525  # Multiplicador
+        self.c = 1013904223  # Incremento
+        self.m = 2**32  # Módulo
+
+    def siguiente_Ri(self):
+        """
+        Genera el siguiente número pseudoaleatorio R_i en el rango [0, 1).
+
+        Aplica la fórmula de congruencia lineal para actualizar el estado
+        interno (self.semilla) y devuelve el número normalizado R_i.
+
+        Returns
+        -------
+        float
+            El siguiente número pseudoaleatorio R_i en el rango [0, 1).
+
+        Notes
+        -----
+        - Cada llamada a este método avanza la secuencia y modifica el estado
+          interno del generador.
+        - El valor devuelto es siempre >= 0 y < 1.
+        """
+        siguiente_Xi = (
+            self.a * self.semilla + self.c
+        ) % self.m  # Calcular el siguiente X_i usando la fórmula de congruencia lineal
+        self.semilla = siguiente_Xi
+        Ri_normalizado = (
+            siguiente_Xi / self.m
+        )  # Normalizar X_i para obtener R_i en el rango [0, 1)
+        return Ri_normalizado
+
+    def generar_Xi(self, pasos: int, tamano_bloque: int = TAMANO_BLOQUE):
+        """
+        Generar una secuencia de números enteros pseudoaleatorios.
+
+        Calcula la misma secuencia que llamadas sucesivas a la fórmula de
+        congruencia lineal, pero por bloques vectorizados: cada bloque se
+        obtiene del último X_i del bloque anterior mediante los coeficientes
+        de salto de `_coeficientes_bloque`.
+
+        Parameters
+        ----------
+        pasos : int
+            Cantidad de números pseudoaleatorios a generar.
+        tamano_bloque : int, optional
+            Cantidad de números calculados en cada operación vectorizada.
+
+        Returns
+        -------
+        numpy.ndarray of uint32
+            Arreglo con los números enteros X_i generados.
+
+        Notes
+        -----
+        Este método modifica el estado interno (self.semilla) igual que
+        `pasos` llamadas a `siguiente_Ri`, por lo que llamadas sucesivas
+        continuarán la secuencia desde el último valor.
+        """
+        A, C = _coeficientes_bloque(self.a, self.c, tamano_bloque)
+        secuencia_Xi = np.empty(pasos, dtype=np.uint32)
+        x_actual = np.uint32(self.semilla % self.m)
+
+        for inicio in range(0, pasos, tamano_bloque):
+            bloque = secuencia_Xi[inicio : inicio + tamano_bloque]
+            n = len(bloque)
+            np.multiply(A[:n], x_actual, out=bloque)
+            np.add(bloque, C[:n], out=bloque)
+            x_actual = bloque[-1]
+
+        if pasos > 0:
+            self.semilla = int(x_actual)
+        return secuencia_Xi
+
+    def generar_Ri(self, pasos: int, tamano_bloque: int = TAMANO_BLOQUE):
+        """
+        Generar una secuencia de números pseudoaleatorios uniformes en [0, 1).
+
+        Genera números enteros X_i y los normaliza dividiéndolos por m para
+        obtener valores en el intervalo [0, 1).
+
+        Parameters
+        ----------
+        pasos : int
+            Cantidad de números pseudoaleatorios a generar.
+        tamano_bloque : int, optional
+            Cantidad de números calculados en cada operación vectorizada.
+
+        Returns
+        -------
+        numpy.ndarray of float64
+            Arreglo con números pseudoaleatorios R_i en el rango [0, 1).
+
+        Notes
+        -----
+        - Cada R_i se calcula como: R_i = X_i / m
+        - Como m es potencia de 2 la división es exacta, por lo que los
+          valores coinciden bit a bit con los de `siguiente_Ri`
+        - Este método también modifica el estado interno del generador
+        """
+        secuencia_Ri = self.generar_Xi(pasos, tamano_bloque).astype(np.float64)
+        secuencia_Ri /= self.m
+        return secuencia_Ri
+
+    def saltar(self, k: int):
+        """
+        Avanzar la secuencia k pasos sin generar los valores intermedios.
+
+        Deja al generador en el mismo estado que k llamadas a
+        `siguiente_Ri`, pero con O(log k) operaciones.
+
+        Parameters
+        ----------
+        k : int
+            Cantidad de pasos a avanzar. Debe ser un entero no negativo.
+
+        Raises
+        ------
+        ValueError
+            Si k es negativo.
+        """
+        if k < 0:
+            raise ValueError("La cantidad de pasos a saltar debe ser no negativa")
+
+        A_salto, C_salto = _coeficientes_salto(self.a, self.c, self.m, k)
+        self.semilla = (A_salto * self.semilla + C_salto) % self.m
+
+    def subflujos(self, numero: int, longitud: int):
+        """
+        Dividir la secuencia en subflujos consecutivos que no se solapan.
+
+        El subflujo i comienza donde terminaría el subflujo i - 1 después de
+        `longitud` números, es decir, en la posición i * longitud de la
+        secuencia de este generador. Concatenar las salidas de los subflujos
+        reproduce exactamente la secuencia original.
+
+        Parameters
+        ----------
+        numero : int
+            Cantidad de subflujos a crear.
+        longitud : int
+            Cantidad de números que consumirá cada subflujo.
+
+        Returns
+        -------
+        list of GeneradorCongruenciaLineal
+            Generadores independientes, uno por subflujo.
+
+        Notes
+        -----
+        El estado interno de este generador no se modifica.
+        """
+        generadores = []
+        estado = self.semilla % self.m
+        A_salto, C_salto = _coeficientes_salto(self.a, self.c, self.m, longitud)
+
+        for _ in range(numero):
+            generadores.append(GeneradorCongruenciaLineal(estado))
+            estado = (A_salto * estado + C_salto) % self.m
+
+        return generadores
+
+    @classmethod
+    def bloques_Xi(cls, semillas, pasos: int, tamano_bloque: int, desde: int = 0):
+        """
+        Generar en bloques los X_i de varias secuencias a la vez.
+
+        Cada fila continúa la secuencia del generador con la semilla
+        correspondiente, exactamente como lo haría `siguiente_Ri`: cada
+        bloque se obtiene del último X_i del bloque anterior con los
+        coeficientes de `_coeficientes_bloque`.
+
+        Parameters
+        ----------
+        semillas : array-like of int
+            Semilla de cada caminata.
+        pasos : int
+            Cantidad total de números a generar por caminata.
+        tamano_bloque : int
+            Cantidad máxima de columnas de cada bloque.
+        desde : int, optional
+            Cantidad de números que se consideran ya generados.
+
+        Yields
+        ------
+        tuple
+            (inicio, bloque) donde `bloque` es un arreglo uint32 de forma
+            (caminatas, columnas) con los X_i de los pasos inicio+1 ... inicio+columnas.
+        """
+        referencia = cls(0)
+        A, C = _coeficientes_bloque(referencia.a, referencia.c, tamano_bloque)
+
+        # La conversión a uint32 reduce cada semilla módulo 2^32
+        estados = np.asarray(semillas, dtype=np.uint64).astype(np.uint32)
+        if desde:
+            # Saltar los primeros `desde` números en O(log desde)
+            A_salto, C_salto = _coeficientes_salto(
+                referencia.a, referencia.c, referencia.m, desde
+            )
+            estados = estados * np.uint32(A_salto) + np.uint32(C_salto)
+
+        for inicio in range(desde, pasos, tamano_bloque):
+            columnas = min(tamano_bloque, pasos - inicio)
+            bloque = np.multiply.outer(estados, A[:columnas])
+            bloque += C[:columnas]
+            estados = bloque[:, -1].copy()
+            yield inicio, bloque
+
+
+def _mezclar(z):
+    """
+    Función de mezcla de SplitMix64 sobre un entero de Python de 64 bits.
+
+    Es una biyección de [0, 2^64), por lo que contadores distintos producen
+    salidas distintas.
+    """
+    z = ((z ^ (z >> 30)) * 0xBF58476D1CE4E5B9) & MASCARA_64
+    z = ((z ^ (z >> 27)) * 0x94D049BB133111EB) & MASCARA_64
+    return z ^ (z >> 31)
+
+
+def _mezclar_arreglo(z):
+    """Aplicar `_mezclar` elemento a elemento a un arreglo uint64 (en el lugar)."""
+    z ^= z >> np.uint64(30)
+    z *= np.uint64(0xBF58476D1CE4E5B9)
+    z ^= z >> np.uint64(27)
+    z *= np.uint64(0x94D049BB133111EB)
+    z ^= z >> np.uint64(31)
+    return z
+
+
+def _claves_splitmix(semillas, caminatas):
+    """Calcular la clave de 64 bits de cada par (semilla, caminata)."""
+    semillas = np.asarray(semillas, dtype=np.uint64)
+    caminatas = np.asarray(caminatas, dtype=np.uint64)
+    claves = _mezclar_arreglo(semillas.copy())
+    claves += caminatas * np.uint64(GAMMA)
+    return _mezclar_arreglo(claves)
+
+
+class GeneradorSplitMix(GeneradorAleatorio):
+    """
+    Generador basado en contador: cada X_i es un hash de (semilla, caminata, paso).
+
+    Fórmula: X_k = mezcla(clave + k * GAMMA) >> 32, con
+    clave = mezcla(mezcla(semilla) + caminata * GAMMA)
+
+    donde `mezcla` es la función de SplitMix64. Como X_k no depende de los
+    valores anteriores, cualquier rango de pasos de cualquier caminata se
+    calcula directamente y de forma vectorizada, sin recorrer la secuencia
+    ni coordinarse con otros procesos.
+
+    Attributes
+    ----------
+    --> semilla (int): Semilla común del experimento.
+    --> caminata (int): Índice de la caminata (flujo) dentro del experimento.
+    --> paso (int): Cantidad de números ya generados (el contador).
+    --> m (int): Módulo (2^32); R_i = X_i / m.
+
+    Methods
+    -------
+    siguiente_Ri()
+        Genera el siguiente número pseudoaleatorio uniforme en [0, 1).
+
+    generar_Xi(pasos)
+        Genera una secuencia de números enteros pseudoaleatorios X_i.
+
+    generar_Ri(pasos)
+        Genera una secuencia de números pseudoaleatorios uniformes en [0, 1).
+
+    saltar(k)
+        Avanza el contador k pasos en tiempo O(1).
+
+    subflujos(numero, longitud)
+        Divide la secuencia en subflujos consecutivos que no se solapan.
+
+    Xi_en(semilla, caminatas, inicio, columnas)
+        Calcula los X_i de un rango de pasos de varias caminatas.
+
+    salidas_en(semilla, caminatas, inicio, columnas)
+        Calcula las salidas completas de 64 bits de un rango de pasos.
+
+    generar_salidas(numero)
+        Genera las siguientes `numero` salidas completas de 64 bits.
+
+    bloques_Xi(semillas, pasos, tamano_bloque)
+        Genera por bloques los X_i de varias caminatas a la vez.
+
+    Notes
+    -----
+    - Se usan los 32 bits altos de cada salida de 64 bits, que tienen buena
+      calidad estadística (a diferencia de los bits bajos de una congruencia
+      lineal).
+    - La secuencia es distinta de la de `GeneradorCongruenciaLineal` con la
+      misma semilla.
+    """
+
+    def __init__(self, semilla, caminata: int = 0, paso: int = 0):
+        """
+        Inicializar el generador en un paso de un flujo.
+
+        Parameters
+        ----------
+        semilla : int
+            Semilla común del experimento (entero no negativo menor que 2^64).
+        caminata : int, optional
+            Índice del flujo; cada caminata de un experimento usa uno distinto.
+        paso : int, optional
+            Cantidad de números que se consideran ya generados.
+        """
+        self.semilla = semilla
+        self.caminata = caminata
+        self.paso = paso
+        self._clave = int(_claves_splitmix(semilla, caminata))
+
+    def siguiente_Ri(self):
+        """
+        Genera el siguiente número pseudoaleatorio R_i en el rango [0, 1).
+
+        Returns
+        -------
+        float
+            El siguiente número pseudoaleatorio R_i en el rango [0, 1).
+        """
+        self.paso += 1
+        siguiente_Xi = _mezclar((self._clave + self.paso * GAMMA) & MASCARA_64) >> 32
+        return siguiente_Xi / self.m
+
+    @staticmethod
+    def salidas_en(semilla, caminatas, inicio: int, columnas: int):
+        """
+        Calcular las salidas de 64 bits de los pasos inicio+1 ... inicio+columnas.
+
+        Parameters
+        ----------
+        semilla : int or array-like of int
+            Semilla del experimento, o una por caminata.
+        caminatas : int or array-like of int
+            Índices de las caminatas.
+        inicio : int
+            Cantidad de pasos anteriores al rango.
+        columnas : int
+            Cantidad de pasos del rango.
+
+        Returns
+        -------
+        numpy.ndarray of uint64
+            Arreglo de forma (caminatas, columnas). Todos sus bits tienen
+            buena calidad, por lo que pueden usarse por separado.
+        """
+        claves = np.atleast_1d(_claves_splitmix(semilla, caminatas))
+        contadores = np.arange(inicio + 1, inicio + columnas + 1, dtype=np.uint64)
+        contadores *= np.uint64(GAMMA)
+        return _mezclar_arreglo(np.add.outer(claves, contadores))
+
+    @staticmethod
+    def Xi_en(semilla, caminatas, inicio: int, columnas: int):
+        """
+        Calcular los X_i de los pasos inicio+1 ... inicio+columnas de varias caminatas.
+
+        Parameters
+        ----------
+        semilla : int or array-like of int
+            Semilla del experimento, o una por caminata.
+        caminatas : int or array-like of int
+            Índices de las caminatas.
+        inicio : int
+            Cantidad de pasos anteriores al rango.
+        columnas : int
+            Cantidad de pasos del rango.
+
+        Returns
+        -------
+        numpy.ndarray of uint32
+            Arreglo de forma (caminatas, columnas).
+        """
+        salidas = GeneradorSplitMix.salidas_en(semilla, caminatas, inicio, columnas)
+        return (salidas >> np.uint64(32)).astype(np.uint32)
+
+    def generar_salidas(self, numero: int, tamano_bloque: int = TAMANO_BLOQUE):
+        """
+        Generar las siguientes salidas completas de 64 bits.
+
+        Sirve para extraer varios valores pequeños de cada salida (por
+        ejemplo, un bit por paso de una caminata) en lugar de un X_i.
+
+        Parameters
+        ----------
+        numero : int
+            Cantidad de salidas a generar.
+        tamano_bloque : int, optional
+            Cantidad de salidas calculadas en cada operación vectorizada.
+
+        Returns
+        -------
+        numpy.ndarray of uint64
+            Arreglo con las salidas generadas.
+
+        Notes
+        -----
+        Cada salida avanza el contador un paso, igual que `siguiente_Ri`; el
+        X_i del mismo paso son sus 32 bits altos.
+        """
+        salidas = np.empty(numero, dtype=np.uint64)
+        for inicio in range(0, numero, tamano_bloque):
+            columnas = min(tamano_bloque, numero - inicio)
+            salidas[inicio : inicio + columnas] = self.salidas_en(
+                self.semilla, self.caminata, self.paso + inicio, columnas
+            )[0]
+
+        self.paso += numero
+        return salidas
+
+    def generar_Xi(self, pasos: int, tamano_bloque: int = TAMANO_BLOQUE):
+        """
+        Generar una secuencia de números enteros pseudoaleatorios.
+
+        Parameters
+        ----------
+        pasos : int
+            Cantidad de números pseudoaleatorios a generar.
+        tamano_bloque : int, optional
+            Cantidad de números calculados en cada operación vectorizada.
+
+        Returns
+        -------
+        numpy.ndarray of uint32
+            Arreglo con los números enteros X_i generados.
+
+        Notes
+        -----
+        Avanza el contador igual que `pasos` llamadas a `siguiente_Ri`.
+        """
+        secuencia_Xi = np.empty(pasos, dtype=np.uint32)
+        for inicio in range(0, pasos, tamano_bloque):
+            columnas = min(tamano_bloque, pasos - inicio)
+            secuencia_Xi[inicio : inicio + columnas] = self.Xi_en(
+                self.semilla, self.caminata, self.paso + inicio, columnas
+            )[0]
+
+        self.paso += pasos
+        return secuencia_Xi
+
+    def saltar(self, k: int):
+        """
+        Avanzar la secuencia k pasos sin generar los valores intermedios.
+
+        Parameters
+        ----------
+        k : int
+            Cantidad de pasos a avanzar. Debe ser un entero no negativo.
+
+        Raises
+        ------
+        ValueError
+            Si k es negativo.
+        """
+        if k < 0:
+            raise ValueError("La cantidad de pasos a saltar debe ser no negativa")
+        self.paso += k
+
+    def subflujos(self, numero: int, longitud: int):
+        """
+        Dividir la secuencia en subflujos consecutivos que no se solapan.
+
+        Parameters
+        ----------
+        numero : int
+            Cantidad de subflujos a crear.
+        longitud : int
+            Cantidad de números que consumirá cada subflujo.
+
+        Returns
+        -------
+        list of GeneradorSplitMix
+            Generadores del mismo flujo que comienzan en los pasos
+            paso + i * longitud.
+        """
+        return [
+            GeneradorSplitMix(self.semilla, self.caminata, self.paso + i * longitud)
+            for i in range(numero)
+        ]
+
+    @classmethod
+    def bloques_Xi(cls, semillas, pasos: int, tamano_bloque: int, desde: int = 0):
+        """
+        Generar en bloques los X_i de varias caminatas a la vez.
+
+        La fila i usa el flujo (semillas[i], caminata 0), igual que
+        `GeneradorSplitMix(semillas[i])`. Cada bloque se calcula solo a
+        partir de su posición, sin estado entre bloques.
+
+        Parameters
+        ----------
+        semillas : array-like of int
+            Semilla de cada caminata.
+        pasos : int
+            Cantidad total de números a generar por caminata.
+        tamano_bloque : int
+            Cantidad máxima de columnas de cada bloque.
+        desde : int, optional
+            Cantidad de números que se consideran ya generados.
+
+        Yields
+        ------
+        tuple
+            (inicio, bloque) donde `bloque` es un arreglo uint32 de forma
+            (caminatas, columnas) con los X_i de los pasos inicio+1 ... inicio+columnas.
+        """
+        semillas = np.atleast_1d(np.asarray(semillas, dtype=np.uint64))
+        for inicio in range(desde, pasos, tamano_bloque):
+            columnas = min(tamano_bloque, pasos - inicio)
+            yield inicio, cls.Xi_en(semillas, 0, inicio, columnas)
+
+
+# Generadores disponibles para los motores de simulación, por nombre
+GENERADORES = {"lcg": GeneradorCongruenciaLineal, "splitmix": GeneradorSplitMix}
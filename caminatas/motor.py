@@ -0,0 +1,856 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from caminatas.generador import GENERADORES
+from caminatas.perfilador import fase
+from caminatas.progreso import avanzar
+
+ELEMENTOS_POR_BLOQUE = 2**22  # Tamaño objetivo (caminatas × pasos × d) de cada bloque
+ELEMENTOS_POR_RESPALDO = 2**26  # Pasos (caminatas × pasos) entre dos respaldos
+M = 2**32  # Módulo del generador: X_i = R_i · M
+
+# Estadísticas que pueden acumularse mientras avanzan las caminatas
+ESTADISTICAS = (
+    "maxima_distancia",
+    "paso_maxima_distancia",
+    "visitas_origen",
+    "primer_retorno",
+    "ultimo_cero",
+)
+
+
+def _validar_dimension(dimension: int):
+    """Comprobar que la dimensión sea un entero positivo."""
+    if dimension < 1:
+        raise ValueError("La dimensión debe ser un entero positivo")
+
+
+@lru_cache
+def umbrales(dimension: int):
+    """
+    Umbrales enteros sobre X_i que separan las 2d direcciones.
+
+    El intervalo [0, 1) de R_i se divide en 2d partes iguales; el umbral j
+    es el mayor X_i con R_i <= j / 2d, es decir floor(j · M / 2d).
+
+    Parameters
+    ----------
+    dimension : int
+        Dimensión d de la red Z^d.
+
+    Returns
+    -------
+    numpy.ndarray of uint32
+        Arreglo de solo lectura con los 2d - 1 umbrales en orden creciente.
+    """
+    _validar_dimension(dimension)
+    direcciones = 2 * dimension
+    resultado = np.array(
+        [j * M // direcciones for j in range(1, direcciones)], dtype=np.uint32
+    )
+    resultado.flags.writeable = False
+    return resultado
+
+
+@lru_cache
+def movimientos(dimension: int):
+    """
+    Tabla de desplazamientos de cada una de las 2d direcciones.
+
+    La dirección 2k mueve el eje k hacia -1 y la 2k + 1 hacia +1, salvo en
+    los ejes k >= 1, donde el orden se invierte. Así las direcciones 0-3
+    coinciden con izquierda, derecha, arriba y abajo de `dos_dimensiones`.
+
+    Parameters
+    ----------
+    dimension : int
+        Dimensión d de la red Z^d.
+
+    Returns
+    -------
+    numpy.ndarray of int8
+        Arreglo de solo lectura de forma (2d, d).
+    """
+    _validar_dimension(dimension)
+    tabla = np.zeros((2 * dimension, dimension), dtype=np.int8)
+    for eje in range(dimension):
+        primero, segundo = (-1, 1) if eje == 0 else (1, -1)
+        tabla[2 * eje, eje] = primero
+        tabla[2 * eje + 1, eje] = segundo
+    tabla.flags.writeable = False
+    return tabla
+
+
+def indices_direccion(Xi, dimension: int):
+    """
+    Calcular la dirección de cada paso a partir de sus X_i.
+
+    El índice es la cantidad de umbrales que X_i supera, contada con una
+    comparación vectorizada por umbral. En 1D se conserva la comparación
+    `R_i < 0.5` de `una_dimension` (el umbral cuenta como superado si X_i
+    es igual a él) y en d >= 2 las comparaciones `<=` de `dos_dimensiones`,
+    por lo que ambas caminatas se reproducen exactamente.
+
+    Parameters
+    ----------
+    Xi : array-like of uint32
+        Valores X_i del generador, de cualquier forma.
+    dimension : int
+        Dimensión d de la red Z^d.
+
+    Returns
+    -------
+    numpy.ndarray of int8 or int16
+        Índices entre 0 y 2d - 1, con la misma forma que `Xi`.
+    """
+    Xi = np.asarray(Xi, dtype=np.uint32)
+    supera = np.greater_equal if dimension == 1 else np.greater
+    indices = np.zeros(Xi.shape, dtype=np.int8 if dimension < 64 else np.int16)
+    for umbral in umbrales(dimension):
+        indices += supera(Xi, umbral)
+    return indices
+
+
+def elegir_tamano_bloque(numero_caminatas: int, pasos: int, dimension: int):
+    """
+    Elegir cuántos pasos avanzar por bloque según la cantidad de caminatas.
+
+    Se usa una potencia de 2 para que los coeficientes de salto en caché
+    (ver `_coeficientes_bloque`) se reutilicen entre ejecuciones.
+    """
+    tamano = max(1, ELEMENTOS_POR_BLOQUE // max(1, numero_caminatas * dimension))
+    tamano = 1 << (tamano.bit_length() - 1)
+    return max(1, min(tamano, pasos))
+
+
+def bloques_Xi(
+    semillas, pasos: int, tamano_bloque: int, generador: str = "lcg", desde: int = 0
+):
+    """
+    Generar en bloques los X_i de varias secuencias a la vez.
+
+    Cada fila contiene la secuencia del generador indicado con la semilla
+    correspondiente, exactamente como lo haría su `siguiente_Ri`.
+
+    Parameters
+    ----------
+    semillas : array-like of int
+        Semilla de cada caminata.
+    pasos : int
+        Cantidad total de números a generar por caminata.
+    tamano_bloque : int
+        Cantidad máxima de columnas de cada bloque.
+    generador : str, optional
+        Nombre del generador en `GENERADORES` ("lcg" o "splitmix").
+    desde : int, optional
+        Pasos ya simulados; el primer bloque empieza en el paso desde+1.
+
+    Yields
+    ------
+    tuple
+        (inicio, bloque) donde `bloque` es un arreglo uint32 de forma
+        (caminatas, columnas) con los X_i de los pasos inicio+1 ... inicio+columnas.
+
+    Raises
+    ------
+    ValueError
+        Si el generador es desconocido.
+    """
+    if generador not in GENERADORES:
+        raise ValueError(f"Generador desconocido: {generador}")
+
+    numero_caminatas = len(np.atleast_1d(semillas))
+    bloques = GENERADORES[generador].bloques_Xi(semillas, pasos, tamano_bloque, desde)
+    for inicio in range(desde, pasos, tamano_bloque):
+        columnas = min(tamano_bloque, pasos - inicio)
+        with fase("generacion", pasos=numero_caminatas * columnas):
+            _, bloque = next(bloques)
+        yield inicio, bloque
+
+
+def caminata(semilla: int, pasos: int, dimension: int, generador: str = "lcg"):
+    """
+    Realiza una caminata aleatoria en la red Z^d.
+
+    En cada paso se elige una de las 2d direcciones con probabilidad
+    1 / 2d. Los X_i se generan por bloques y cada bloque se convierte en
+    posiciones con una búsqueda de umbrales y una suma acumulada, sin
+    bucles por paso. Con d = 1 y d = 2 se obtienen exactamente las
+    caminatas de `una_dimension` y `dos_dimensiones` con la misma semilla.
+
+    Parameters
+    ----------
+    semilla : int
+        Semilla inicial para el generador de números pseudoaleatorios.
+    pasos : int
+        Número de pasos (movimientos) a simular en la caminata.
+    dimension : int
+        Dimensión d de la red.
+    generador : str, optional
+        Generador de números pseudoaleatorios, tomado de
+        `generador.GENERADORES` ("lcg" por defecto o "splitmix").
+
+    Returns
+    -------
+    numpy.ndarray of int64
+        Arreglo de forma (pasos + 1, d) con la posición en cada paso,
+        incluyendo el origen en la fila 0.
+    """
+    tabla = movimientos(dimension)
+    trayectoria = np.zeros((pasos + 1, dimension), dtype=np.int64)
+
+    for inicio, bloque in bloques_Xi(
+        [semilla], pasos, elegir_tamano_bloque(1, pasos, dimension), generador
+    ):
+        fin = inicio + bloque.shape[1]
+        with fase("caminata", pasos=bloque.shape[1], caminatas=int(fin == pasos)):
+            desplazamientos = tabla[indices_direccion(bloque[0], dimension)]
+            tramo = trayectoria[inicio + 1 : fin + 1]
+            np.cumsum(desplazamientos, axis=0, dtype=np.int64, out=tramo)
+            tramo += trayectoria[inicio]
+
+    return trayectoria
+
+
+def _actualizar_maximo(valores, inicio: int, maximo, paso_maximo):
+    """
+    Actualizar el máximo de cada fila y el primer paso en que se alcanza.
+
+    `valores` tiene forma (caminatas, columnas) y corresponde a los pasos
+    inicio+1 ... inicio+columnas. Solo se actualizan las filas que superan
+    estrictamente su máximo anterior, por lo que se conserva el primer paso.
+    """
+    columnas_maximo = valores.argmax(axis=1)
+    maximos = np.take_along_axis(valores, columnas_maximo[:, None], axis=1)[:, 0]
+    mejora = maximos > maximo
+    maximo[mejora] = maximos[mejora]
+    paso_maximo[mejora] = inicio + 1 + columnas_maximo[mejora]
+
+
+def _actualizar_origen(en_origen, inicio: int, primer_retorno, ultimo_cero):
+    """
+    Actualizar el primer y el último paso en el origen de cada fila.
+
+    `en_origen` es un arreglo booleano (caminatas, columnas) de los pasos
+    inicio+1 ... inicio+columnas. `primer_retorno` vale -1 mientras la
+    caminata no haya vuelto al origen.
+    """
+    visitan = en_origen.any(axis=1)
+    if not visitan.any():
+        return
+
+    pendientes = visitan & (primer_retorno < 0)
+    primer_retorno[pendientes] = inicio + 1 + en_origen[pendientes].argmax(axis=1)
+    ultimas = en_origen[visitan, ::-1].argmax(axis=1)
+    ultimo_cero[visitan] = inicio + en_origen.shape[1] - ultimas
+
+
+def _pasos_del_estado(
+    estado, semillas, pasos: int, dimension: int, estadisticas, generador: str
+):
+    """
+    Comprobar que un estado guardado puede continuarse y devolver sus pasos.
+
+    El estado debe ser de las mismas semillas, dimensión y generador, no tener
+    más pasos que los pedidos y, si ya avanzó, acumular las estadísticas
+    solicitadas desde el paso 0.
+    """
+    desde = int(estado["pasos"])
+    if estado["generador"] != generador:
+        raise ValueError(
+            f"El estado se simuló con el generador {estado['generador']!r}, "
+            f"no con {generador!r}"
+        )
+    if not np.array_equal(estado["semillas"], semillas):
+        raise ValueError("Las semillas no coinciden con las del estado")
+    if estado["final"].shape[1:] != (dimension,):
+        raise ValueError(f"El estado no es de caminatas en {dimension} dimensiones")
+    if pasos < desde:
+        raise ValueError(f"El estado ya tiene {desde} pasos; no llega hasta {pasos}")
+    faltantes = set(estadisticas) - set(estado["estadisticas"])
+    if desde and faltantes:
+        raise ValueError(
+            f"Estadísticas no acumuladas en el estado: {sorted(faltantes)}"
+        )
+    return desde
+
+
+def guardar_estado(ruta: str, estado: dict):
+    """
+    Guardar en disco el estado de `caminatas_en_lote`.
+
+    Se escribe primero un archivo temporal que luego reemplaza a `ruta`, así
+    una interrupción durante la escritura no deja un estado a medias.
+
+    Parameters
+    ----------
+    ruta : str
+        Archivo de destino (formato .npz de NumPy).
+    estado : dict
+        Estado actualizado por `caminatas_en_lote`.
+    """
+    temporal = ruta + ".tmp"
+    with open(temporal, "wb") as archivo:
+        np.savez(
+            archivo,
+            **{**estado, "estadisticas": np.array(estado["estadisticas"], dtype=str)},
+        )
+    os.replace(temporal, ruta)
+
+
+def cargar_estado(ruta: str):
+    """
+    Leer un estado guardado con `guardar_estado`.
+
+    Parameters
+    ----------
+    ruta : str
+        Archivo escrito por `guardar_estado`.
+
+    Returns
+    -------
+    dict
+        Estado listo para pasarlo a `caminatas_en_lote`.
+    """
+    with np.load(ruta) as archivo:
+        estado = {clave: archivo[clave] for clave in archivo.files}
+    estado["pasos"] = int(estado["pasos"])
+    estado["generador"] = str(estado["generador"])
+    estado["estadisticas"] = estado["estadisticas"].tolist()
+    return estado
+
+
+def caminatas_en_lote(
+    semillas,
+    pasos: int,
+    dimension: int,
+    puntos_control=(),
+    estadisticas=(),
+    tamano_bloque=None,
+    generador="lcg",
+    estado=None,
+    salida=None,
+):
+    """
+    Simular varias caminatas aleatorias en Z^d al mismo tiempo.
+
+    Todas las caminatas avanzan juntas en bloques (caminatas × pasos × d)
+    de NumPy, con las mismas direcciones que `caminata` para cada semilla.
+
+    Parameters
+    ----------
+    semillas : array-like of int
+        Semilla de cada caminata.
+    pasos : int
+        Número de pasos a simular en cada caminata.
+    dimension : int
+        Dimensión d de la red.
+    puntos_control : sequence of int, optional
+        Pasos (entre 0 y `pasos`) en los que se registra la posición.
+    estadisticas : sequence of str, optional
+        Estadísticas adicionales a acumular, tomadas de `ESTADISTICAS`.
+    tamano_bloque : int, optional
+        Cantidad de pasos por bloque. Por defecto se elige según la
+        cantidad de caminatas y la dimensión para acotar la memoria usada.
+    generador : str, optional
+        Generador de números pseudoaleatorios, tomado de
+        `generador.GENERADORES`. Con "lcg" (por defecto) los resultados
+        coinciden con `caminata`; "splitmix" calcula cada bloque sin estado,
+        a partir de (semilla, paso).
+
+    estado : dict, optional
+        Estado de una ejecución anterior con las mismas semillas, que se
+        actualiza en el lugar al terminar. Si ya tiene N pasos, las
+        caminatas continúan desde el paso N y solo se simulan los pasos
+        N+1 ... `pasos`. Un diccionario vacío empieza desde el paso 0.
+    salida : dict, optional
+        Arreglos donde escribir el resultado, con las claves, formas y tipos
+        del diccionario devuelto. Las caminatas se acumulan directamente en
+        ellos y el resultado devuelto los contiene, sin copias; así
+        `caminatas_en_paralelo` escribe en la memoria compartida.
+
+    Returns
+    -------
+    dict
+        - "final": arreglo int64 de forma (caminatas, d) con la posición
+          final.
+        - "puntos_control": arreglo int64 de forma
+          (caminatas, len(puntos_control), d) con la posición en cada paso
+          solicitado.
+
+        - Una entrada por cada estadística solicitada (ver Notes).
+
+    Raises
+    ------
+    ValueError
+        Si la dimensión no es positiva, si algún punto de control está fuera
+        del rango [0, pasos], si se solicita una estadística desconocida o si
+        `estado` no puede continuarse con estos argumentos.
+
+    Notes
+    -----
+    - Las trayectorias nunca se guardan completas: la memoria usada depende
+      solo del tamaño de bloque, no de `pasos`.
+    - "visitas_origen" cuenta los pasos (sin incluir el paso 0) en los que
+      la caminata está en el origen.
+    - "maxima_distancia" es la mayor distancia euclidiana al origen
+      alcanzada (float64).
+    - "primer_retorno" es el primer paso k >= 1 en el origen, o -1 si la
+      caminata no vuelve al origen.
+    - "ultimo_cero" es el último paso en el origen (0 si no vuelve).
+    - "paso_maxima_distancia" es el primer paso en que se alcanza
+      "maxima_distancia".
+    - Todas se actualizan bloque a bloque mientras avanzan las caminatas.
+    - Al continuar un estado, el generador salta directamente al paso N
+      (ver `_coeficientes_salto`) y las estadísticas siguen acumulándose
+      desde sus valores guardados, así que el resultado es el mismo que el
+      de una sola ejecución de `pasos` pasos. Los puntos de control hasta
+      el paso N deben ser 0, N o alguno ya registrado en el estado.
+    - El estado contiene una fila por caminata, no las trayectorias:
+      `guardar_estado` y `cargar_estado` lo llevan a disco y de vuelta.
+    """
+    _validar_dimension(dimension)
+    semillas = np.atleast_1d(np.asarray(semillas, dtype=np.uint64))
+    puntos_control = [int(paso) for paso in puntos_control]
+    if any(paso < 0 or paso > pasos for paso in puntos_control):
+        raise ValueError(f"Los puntos de control deben estar entre 0 y {pasos}")
+    desconocidas = set(estadisticas) - set(ESTADISTICAS)
+    if desconocidas:
+        raise ValueError(f"Estadísticas desconocidas: {sorted(desconocidas)}")
+
+    numero_caminatas = len(semillas)
+    tabla = movimientos(dimension)
+    if salida is None:
+        salida = {}
+    posicion_actual = salida.get("final")
+    if posicion_actual is None:
+        posicion_actual = np.zeros((numero_caminatas, dimension), dtype=np.int64)
+    else:
+        posicion_actual[...] = 0
+    acumuladas = {
+        "maxima_distancia2": np.zeros(numero_caminatas, dtype=np.int64),  # |x|^2
+        "paso_maxima_distancia": np.zeros(numero_caminatas, dtype=np.int64),
+        "visitas_origen": np.zeros(numero_caminatas, dtype=np.int64),
+        "primer_retorno": np.full(numero_caminatas, -1, dtype=np.int64),
+        "ultimo_cero": np.zeros(numero_caminatas, dtype=np.int64),
+    }
+    guardados = {}  # Paso -> posición de cada caminata, ya registrada en `estado`
+    seguidas = list(estadisticas)
+    desde = 0
+    if estado:
+        desde = _pasos_del_estado(
+            estado, semillas, pasos, dimension, estadisticas, generador
+        )
+        posicion_actual[...] = estado["final"]
+        for nombre in acumuladas:
+            acumuladas[nombre] = estado[nombre].copy()
+        guardados = dict(
+            zip(estado["puntos_control"].tolist(), estado["registro"].swapaxes(0, 1))
+        )
+        seguidas = list(estado["estadisticas"])
+        seguidas += [nombre for nombre in estadisticas if nombre not in seguidas]
+
+    # Los acumuladores se escriben en `salida` si allí hay un arreglo para ellos
+    for nombre in acumuladas.keys() & salida.keys():
+        salida[nombre][...] = acumuladas[nombre]
+        acumuladas[nombre] = salida[nombre]
+    registro = salida.get("puntos_control")
+    if registro is None:
+        registro = np.zeros(
+            (numero_caminatas, len(puntos_control), dimension), dtype=np.int64
+        )
+    disponibles = {
+        **guardados,
+        0: np.zeros_like(posicion_actual),
+        desde: posicion_actual,
+    }
+    for indice, paso in enumerate(puntos_control):
+        if paso <= desde:
+            if paso not in disponibles:
+                raise ValueError(f"El estado no registró la posición del paso {paso}")
+            registro[:, indice] = disponibles[paso]
+
+    if tamano_bloque is None:
+        tamano_bloque = elegir_tamano_bloque(numero_caminatas, pasos - desde, dimension)
+    maxima_distancia2 = acumuladas["maxima_distancia2"]
+    paso_maxima_distancia = acumuladas["paso_maxima_distancia"]
+    visitas_origen = acumuladas["visitas_origen"]
+    primer_retorno = acumuladas["primer_retorno"]
+    ultimo_cero = acumuladas["ultimo_cero"]
+    calcular_maximo = {"maxima_distancia", "paso_maxima_distancia"} & set(seguidas)
+    calcular_origen = {"visitas_origen", "primer_retorno", "ultimo_cero"} & set(
+        seguidas
+    )
+
+    bloques = bloques_Xi(semillas, pasos, tamano_bloque, generador, desde)
+    for inicio, bloque in bloques:
+        fin = inicio + bloque.shape[1]
+        completadas = numero_caminatas if fin == pasos else 0
+        with fase("caminata", pasos=bloque.size, caminatas=completadas):
+            avanzar(bloque.size, completadas)
+            # posiciones tiene forma (caminatas, columnas, d)
+            posiciones = np.cumsum(
+                tabla[indices_direccion(bloque, dimension)], axis=1, dtype=np.int64
+            )
+            posiciones += posicion_actual[:, None, :]
+
+            for indice, paso in enumerate(puntos_control):
+                if inicio < paso <= fin:
+                    registro[:, indice] = posiciones[:, paso - inicio - 1]
+
+            if calcular_maximo:
+                distancia2 = np.einsum("wpd,wpd->wp", posiciones, posiciones)
+                _actualizar_maximo(
+                    distancia2, inicio, maxima_distancia2, paso_maxima_distancia
+                )
+            if calcular_origen:
+                en_origen = ~posiciones.any(axis=2)
+                visitas_origen += np.count_nonzero(en_origen, axis=1)
+                _actualizar_origen(en_origen, inicio, primer_retorno, ultimo_cero)
+
+            posicion_actual[...] = posiciones[:, -1]
+
+    if estado is not None:
+        for indice, paso in enumerate(puntos_control):
+            guardados[paso] = registro[:, indice]
+        puntos_guardados = sorted(guardados)
+        registro_guardado = np.zeros(
+            (numero_caminatas, len(puntos_guardados), dimension), dtype=np.int64
+        )
+        for indice, paso in enumerate(puntos_guardados):
+            registro_guardado[:, indice] = guardados[paso]
+
+        estado.update(
+            pasos=pasos,
+            generador=generador,
+            semillas=semillas,
+            final=posicion_actual.copy(),
+            estadisticas=seguidas,
+            puntos_control=np.array(puntos_guardados, dtype=np.int64),
+            registro=registro_guardado,
+            **{nombre: acumuladas[nombre].copy() for nombre in acumuladas},
+        )
+
+    resultado = {"final": posicion_actual, "puntos_control": registro}
+    calculadas = {
+        "maxima_distancia": np.sqrt(
+            maxima_distancia2, out=salida.get("maxima_distancia")
+        ),
+        "paso_maxima_distancia": paso_maxima_distancia,
+        "visitas_origen": visitas_origen,
+        "primer_retorno": primer_retorno,
+        "ultimo_cero": ultimo_cero,
+    }
+    for nombre in estadisticas:
+        resultado[nombre] = calculadas[nombre]
+    return resultado
+
+
+def caminatas_con_respaldo(
+    semillas,
+    pasos: int,
+    dimension: int,
+    ruta: str,
+    puntos_control=(),
+    estadisticas=(),
+    generador="lcg",
+):
+    """
+    Simular en lote guardando el estado en disco cada cierto número de pasos.
+
+    Las caminatas avanzan por tramos de unos `ELEMENTOS_POR_RESPALDO` pasos
+    en total y, al final de cada tramo, el estado se guarda en `ruta` con
+    `guardar_estado`. Si `ruta` ya existe, la simulación continúa desde el
+    último tramo guardado en lugar de empezar de nuevo, así que un lote
+    interrumpido solo repite el tramo en curso.
+
+    Parameters
+    ----------
+    semillas : array-like of int
+        Semilla de cada caminata.
+    pasos : int
+        Número de pasos a simular en cada caminata.
+    dimension : int
+        Dimensión d de la red.
+    ruta : str
+        Archivo del respaldo. Se conserva al terminar, por lo que una
+        ejecución posterior con más pasos solo simula los pasos nuevos.
+    puntos_control : sequence of int, optional
+        Pasos (entre 0 y `pasos`) en los que se registra la posición.
+    estadisticas : sequence of str, optional
+        Estadísticas adicionales a acumular, tomadas de `ESTADISTICAS`.
+    generador : str, optional
+        Generador de números pseudoaleatorios (ver `caminatas_en_lote`).
+
+    Returns
+    -------
+    dict
+        Mismo formato que `caminatas_en_lote`, idéntico al de una ejecución
+        sin respaldos.
+
+    Raises
+    ------
+    ValueError
+        Si el respaldo existente no puede continuarse con estos argumentos
+        (ver `caminatas_en_lote`).
+    """
+    semillas = np.atleast_1d(np.asarray(semillas, dtype=np.uint64))
+    puntos_control = [int(paso) for paso in puntos_control]
+    estado = cargar_estado(ruta) if os.path.exists(ruta) else {}
+    hechos = estado.get("pasos", 0)
+    # Los pasos ya guardados cuentan como avance de esta simulación
+    avanzar(len(semillas) * min(hechos, pasos))
+
+    tramo = max(1, ELEMENTOS_POR_RESPALDO // max(1, len(semillas)))
+    while True:
+        fin = min(hechos + tramo, pasos)
+        resultado = caminatas_en_lote(
+            semillas,
+            fin,
+            dimension,
+            [paso for paso in puntos_control if paso <= fin],
+            estadisticas,
+            generador=generador,
+            estado=estado,
+        )
+        guardar_estado(ruta, estado)
+        hechos = fin
+        if fin == pasos:
+            return resultado
+
+
+def _disposicion(plantilla):
+    """
+    Describir los arreglos de un resultado de `caminatas_en_lote`.
+
+    Devuelve una lista de (clave, forma sin el eje de las caminatas, tipo)
+    con la que `_vistas` reparte un bloque de memoria compartida.
+    """
+    return [
+        (clave, arreglo.shape[1:], arreglo.dtype.str)
+        for clave, arreglo in plantilla.items()
+    ]
+
+
+def _tamano_disposicion(numero_caminatas: int, disposicion):
+    """Bytes que ocupan los arreglos de `disposicion` para tantas caminatas."""
+    return sum(
+        numero_caminatas * int(np.prod(forma)) * np.dtype(tipo).itemsize
+        for _, forma, tipo in disposicion
+    )
+
+
+def _vistas(buffer, numero_caminatas: int, disposicion):
+    """
+    Repartir `buffer` en arreglos de NumPy, uno tras otro, sin copiarlo.
+
+    Cada arreglo tiene una fila por caminata.
+    """
+    vistas = {}
+    desplazamiento = 0
+    for clave, forma, tipo in disposicion:
+        vistas[clave] = np.ndarray(
+            (numero_caminatas, *forma), dtype=tipo, buffer=buffer, offset=desplazamiento
+        )
+        desplazamiento += vistas[clave].nbytes
+    return vistas
+
+
+def _simular_rango(
+    nombre_memoria,
+    numero_caminatas,
+    disposicion,
+    semilla_base,
+    inicio,
+    fin,
+    pasos,
+    dimension,
+    puntos_control,
+    estadisticas,
+    generador,
+):
+    """
+    Simular en lote las caminatas con índices [inicio, fin) de una tarea.
+
+    Las caminatas se acumulan directamente en las filas [inicio, fin) del
+    bloque de memoria compartida `nombre_memoria` (ver el argumento `salida`
+    de `caminatas_en_lote`); solo se devuelve la cantidad de caminatas
+    simuladas.
+    """
+    semillas = semilla_base + np.arange(inicio, fin, dtype=np.uint64)
+    memoria = shared_memory.SharedMemory(name=nombre_memoria)
+    try:
+        vistas = _vistas(memoria.buf, numero_caminatas, disposicion)
+        salida = {clave: vista[inicio:fin] for clave, vista in vistas.items()}
+        caminatas_en_lote(
+            semillas,
+            pasos,
+            dimension,
+            puntos_control,
+            estadisticas,
+            generador=generador,
+            salida=salida,
+        )
+        # Las vistas deben soltarse antes de cerrar el bloque
+        del vistas, salida
+    finally:
+        memoria.close()
+    return fin - inicio
+
+
+class ResultadoCompartido(dict):
+    """
+    Resultado de `caminatas_en_paralelo` guardado en memoria compartida.
+
+    Es el diccionario de `caminatas_en_lote`, pero sus arreglos son vistas
+    del bloque de memoria compartida donde escribieron los procesos, que
+    este objeto mantiene abierto. Se libera con `cerrar` o al salir de un
+    bloque `with`; desde entonces ni los arreglos ni sus vistas pueden
+    usarse, así que lo que deba conservarse se copia antes.
+
+    Parameters
+    ----------
+    arreglos : dict
+        Arreglos del resultado.
+    memoria : multiprocessing.shared_memory.SharedMemory, optional
+        Bloque que contiene los arreglos, si lo hay.
+    """
+
+    def __init__(self, arreglos, memoria=None):
+        super().__init__(arreglos)
+        self._memoria = memoria
+
+    def cerrar(self):
+        """Soltar los arreglos y liberar el bloque de memoria compartida."""
+        self.clear()
+        if self._memoria is not None:
+            self._memoria.close()
+            self._memoria = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, tipo, valor, traza):
+        self.cerrar()
+
+
+def caminatas_en_paralelo(
+    semilla_base,
+    numero_caminatas: int,
+    pasos: int,
+    dimension: int,
+    puntos_control=(),
+    estadisticas=(),
+    procesos=None,
+    caminatas_por_tarea=None,
+    generador="lcg",
+):
+    """
+    Simular caminatas independientes en Z^d repartidas en un grupo de procesos.
+
+    Las caminatas con semillas semilla_base + i se dividen en tareas de
+    índices consecutivos; cada proceso simula sus tareas con
+    `caminatas_en_lote` y escribe los resultados en las filas de esos
+    índices, por lo que coinciden exactamente con una ejecución en serie.
+
+    Parameters
+    ----------
+    semilla_base : int
+        Semilla de la primera caminata.
+    numero_caminatas : int
+        Cantidad de caminatas a simular.
+    pasos : int
+        Número de pasos a simular en cada caminata.
+    dimension : int
+        Dimensión d de la red.
+    puntos_control : sequence of int, optional
+        Pasos (entre 0 y `pasos`) en los que se registra la posición.
+    estadisticas : sequence of str, optional
+        Estadísticas adicionales a acumular, tomadas de `ESTADISTICAS`.
+    procesos : int, optional
+        Cantidad de procesos del grupo. Por defecto, `os.cpu_count()`.
+    caminatas_por_tarea : int, optional
+        Cantidad de caminatas por tarea. Por defecto se crean unas cuatro
+        tareas por proceso para equilibrar la carga.
+    generador : str, optional
+        Generador de números pseudoaleatorios (ver `caminatas_en_lote`).
+
+    Returns
+    -------
+    ResultadoCompartido
+        Mismo formato que `caminatas_en_lote`, con arreglos que son vistas
+        de la memoria compartida: deben dejar de usarse (o copiarse) antes
+        de llamar a su método `cerrar`.
+
+    Notes
+    -----
+    - Los resultados no vuelven serializados: el proceso principal reserva
+      un bloque de `multiprocessing.shared_memory` con un arreglo por
+      resultado (posiciones finales, puntos de control y estadísticas), y
+      cada tarea acumula sus filas directamente en él.
+    - Los arreglos devueltos no se copian fuera del bloque; el nombre del
+      bloque se libera al terminar los procesos y su memoria al cerrar el
+      resultado.
+    """
+    puntos_control = [int(paso) for paso in puntos_control]
+    estadisticas = list(estadisticas)
+    # Un resultado vacío da el tipo y la forma de cada arreglo
+    plantilla = caminatas_en_lote(
+        [],
+        0,
+        dimension,
+        [0] * len(puntos_control),
+        estadisticas,
+        generador=generador,
+    )
+    if numero_caminatas <= 0:
+        return ResultadoCompartido(plantilla)
+
+    if procesos is None:
+        procesos = os.cpu_count() or 1
+    if caminatas_por_tarea is None:
+        caminatas_por_tarea = -(-numero_caminatas // (4 * procesos))
+    caminatas_por_tarea = max(1, caminatas_por_tarea)
+
+    disposicion = _disposicion(plantilla)
+    memoria = shared_memory.SharedMemory(
+        create=True, size=max(1, _tamano_disposicion(numero_caminatas, disposicion))
+    )
+    try:
+        with ProcessPoolExecutor(max_workers=procesos) as ejecutor:
+            inicios = list(range(0, numero_caminatas, caminatas_por_tarea))
+            fines = [
+                min(inicio + caminatas_por_tarea, numero_caminatas)
+                for inicio in inicios
+            ]
+            numero_tareas = len(inicios)
+
+            # El avance se suma aquí porque los procesos hijos no lo comparten
+            for simuladas in ejecutor.map(
+                _simular_rango,
+                [memoria.name] * numero_tareas,
+                [numero_caminatas] * numero_tareas,
+                [disposicion] * numero_tareas,
+                [semilla_base] * numero_tareas,
+                inicios,
+                fines,
+                [pasos] * numero_tareas,
+                [dimension] * numero_tareas,
+                [puntos_control] * numero_tareas,
+                [estadisticas] * numero_tareas,
+                [generador] * numero_tareas,
+            ):
+                avanzar(simuladas * pasos, simuladas)
+    except BaseException:
+        memoria.close()
+        raise
+    finally:
+        # El bloque sigue accesible desde este proceso hasta cerrarlo
+        memoria.unlink()
+    return ResultadoCompartido(
+        _vistas(memoria.buf, numero_caminatas, disposicion), memoria
+    )
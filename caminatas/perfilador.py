@@ -0,0 +1,254 @@
+import json
+import os
+import sys
+import time
+from contextlib import contextmanager
+
+try:
+    import resource
+except ImportError:  # Windows no tiene el módulo resource
+    resource = None
+
+_activo = None  # Perfilador que reciben las mediciones de `fase`
+
+
+def _memoria_residente():
+    """
+    Memoria residente (RSS) actual del proceso en bytes.
+
+    En Linux se lee /proc/self/statm, que es muy barato. En otros sistemas
+    se usa el pico de `resource.getrusage` como aproximación, o 0 si no
+    está disponible.
+    """
+    try:
+        with open("/proc/self/statm") as statm:
+            return int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, AttributeError):
+        return _pico_memoria_residente()
+
+
+def _pico_memoria_residente():
+    """Pico de memoria residente del proceso en bytes (0 si no se conoce)."""
+    if resource is None:
+        return 0
+    pico = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux informa kilobytes; macOS, bytes
+    return pico if sys.platform == "darwin" else pico * 1024
+
+
+@contextmanager
+def fase(nombre: str, pasos: int = 0, caminatas: int = 0):
+    """
+    Medir una fase en el perfilador activo, si hay uno.
+
+    Sin un perfilador activo solo cuesta una comparación, por lo que puede
+    usarse dentro de los bucles por bloques de las simulaciones.
+
+    Parameters
+    ----------
+    nombre : str
+        Nombre de la fase (por ejemplo "generacion", "caminata",
+        "agregacion" o "graficas").
+    pasos : int, optional
+        Pasos simulados durante la fase, para calcular pasos/segundo.
+    caminatas : int, optional
+        Caminatas completadas durante la fase, para calcular caminatas/segundo.
+    """
+    if _activo is None:
+        yield
+        return
+
+    with _activo.fase(nombre, pasos, caminatas):
+        yield
+
+
+class Perfilador:
+    """
+    Medidor de tiempo, memoria y rendimiento por fases de una simulación.
+
+    Cada fase acumula su tiempo con `time.perf_counter_ns`, la cantidad de
+    veces que se ejecutó, los pasos y caminatas procesados y la memoria
+    residente máxima observada al terminar la fase.
+
+    Attributes
+    ----------
+    --> fases (dict): Mediciones acumuladas por nombre de fase.
+    --> rastrear_asignaciones (bool): Si se usa tracemalloc (más lento).
+
+    Methods
+    -------
+    fase(nombre, pasos=0, caminatas=0)
+        Administrador de contexto que mide una fase.
+
+    resumen()
+        Devuelve todas las mediciones como diccionario.
+
+    a_json(ruta=None)
+        Devuelve el resumen en JSON y opcionalmente lo guarda en un archivo.
+
+    imprimir()
+        Muestra el resumen en la consola.
+
+    Notes
+    -----
+    - Usado como administrador de contexto (`with Perfilador() as p:`) se
+      vuelve el perfilador activo, que recibe las mediciones de la función
+      `fase` del módulo.
+    - tracemalloc solo se activa con rastrear_asignaciones=True, porque
+      vuelve varias veces más lentas las partes que crean muchos objetos.
+    """
+
+    def __init__(self, rastrear_asignaciones: bool = False):
+        """
+        Crear un perfilador sin mediciones.
+
+        Parameters
+        ----------
+        rastrear_asignaciones : bool, optional
+            Si es True, también mide la memoria asignada por Python con
+            tracemalloc mientras el perfilador está activo.
+        """
+        self.fases = {}
+        self.rastrear_asignaciones = rastrear_asignaciones
+        self._inicio_ns = None
+        self._fin_ns = None
+        self._anterior = None
+        self._asignaciones = None
+
+    @contextmanager
+    def fase(self, nombre: str, pasos: int = 0, caminatas: int = 0):
+        """Medir una fase y acumular sus resultados bajo `nombre`."""
+        inicio = time.perf_counter_ns()
+        try:
+            yield
+        finally:
+            duracion = time.perf_counter_ns() - inicio
+            medicion = self.fases.setdefault(
+                nombre,
+                {
+                    "tiempo_ns": 0,
+                    "llamadas": 0,
+                    "pasos": 0,
+                    "caminatas": 0,
+                    "memoria_residente_max": 0,
+                },
+            )
+            medicion["tiempo_ns"] += duracion
+            medicion["llamadas"] += 1
+            medicion["pasos"] += pasos
+            medicion["caminatas"] += caminatas
+            medicion["memoria_residente_max"] = max(
+                medicion["memoria_residente_max"], _memoria_residente()
+            )
+
+    def __enter__(self):
+        global _activo
+
+        self._anterior = _activo
+        _activo = self
+        if self.rastrear_asignaciones:
+            import tracemalloc
+
+            tracemalloc.start()
+        self._inicio_ns = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, *excepcion):
+        global _activo
+
+        self._fin_ns = time.perf_counter_ns()
+        if self.rastrear_asignaciones:
+            import tracemalloc
+
+            self._asignaciones = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+        _activo = self._anterior
+
+    def resumen(self):
+        """
+        Devolver todas las mediciones como diccionario.
+
+        Returns
+        -------
+        dict
+            - "tiempo_total_s": tiempo entre la activación y la desactivación.
+            - "memoria_residente": RSS actual en bytes.
+            - "pico_memoria_residente": pico de RSS del proceso en bytes.
+            - "asignaciones": memoria actual y pico según tracemalloc, o None.
+            - "fases": por cada fase, tiempo en segundos, llamadas, pasos,
+              caminatas, pasos/segundo, caminatas/segundo y RSS máxima.
+        """
+        fin = self._fin_ns if self._fin_ns is not None else time.perf_counter_ns()
+        inicio = self._inicio_ns if self._inicio_ns is not None else fin
+
+        fases = {}
+        for nombre, medicion in self.fases.items():
+            segundos = medicion["tiempo_ns"] / 1e9
+            fases[nombre] = {
+                "tiempo_s": segundos,
+                "llamadas": medicion["llamadas"],
+                "pasos": medicion["pasos"],
+                "caminatas": medicion["caminatas"],
+                "pasos_por_segundo": medicion["pasos"] / segundos if segundos else 0.0,
+                "caminatas_por_segundo": (
+                    medicion["caminatas"] / segundos if segundos else 0.0
+                ),
+                "memoria_residente_max": medicion["memoria_residente_max"],
+            }
+
+        asignaciones = None
+        if self._asignaciones is not None:
+            actual, pico = self._asignaciones
+            asignaciones = {"actual": actual, "pico": pico}
+
+        return {
+            "tiempo_total_s": (fin - inicio) / 1e9,
+            "memoria_residente": _memoria_residente(),
+            "pico_memoria_residente": _pico_memoria_residente(),
+            "asignaciones": asignaciones,
+            "fases": fases,
+        }
+
+    def a_json(self, ruta=None):
+        """
+        Devolver el resumen en formato JSON.
+
+        Parameters
+        ----------
+        ruta : str or os.PathLike, optional
+            Si se indica, el JSON también se guarda en ese archivo.
+
+        Returns
+        -------
+        str
+            Resumen de `resumen()` serializado como JSON.
+        """
+        texto = json.dumps(self.resumen(), indent=2, ensure_ascii=False)
+        if ruta is not None:
+            with open(ruta, "w", encoding="utf-8") as archivo:
+                archivo.write(texto + "\n")
+        return texto
+
+    def imprimir(self):
+        """Mostrar en la consola el tiempo, la memoria y cada fase medida."""
+        resumen = self.resumen()
+        total = resumen["tiempo_total_s"]
+
+        print(
+            f"Tiempo de ejecución: {total:.4f} segundos. Equivalente en minutos: {total / 60:.2f} minutos"
+        )
+        print(
+            f"Memoria residente: {resumen['memoria_residente'] / 10**6:.4f} MB; Pico de memoria: {resumen['pico_memoria_residente'] / 10**6:.4f} MB"
+        )
+        if resumen["asignaciones"] is not None:
+            print(
+                f"Memoria asignada (tracemalloc): {resumen['asignaciones']['actual'] / 10**6:.4f} MB; Pico: {resumen['asignaciones']['pico'] / 10**6:.4f} MB"
+            )
+
+        for nombre, medicion in resumen["fases"].items():
+            linea = f"  {nombre}: {medicion['tiempo_s']:.4f} s en {medicion['llamadas']} llamadas"
+            if medicion["pasos"]:
+                linea += f", {medicion['pasos_por_segundo']:.3e} pasos/s"
+            if medicion["caminatas"]:
+                linea += f", {medicion['caminatas_por_segundo']:.3e} caminatas/s"
+            print(linea)
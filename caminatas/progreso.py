@@ -0,0 +1,159 @@
+import sys
+import threading
+import time
+
+_activo = None  # Progreso que recibe los avances de `avanzar`
+
+INTERVALO = 1.0  # Segundos mínimos entre dos informes
+
+
+def avanzar(pasos: int = 0, caminatas: int = 0):
+    """
+    Sumar un avance al progreso activo, si hay uno.
+
+    Solo suma enteros; el formato y la escritura de los informes ocurren en
+    el hilo del `Progreso`. Sin un progreso activo solo cuesta una
+    comparación, por lo que puede llamarse dentro de los bucles por bloques.
+
+    Parameters
+    ----------
+    pasos : int, optional
+        Pasos simulados desde el último avance (sumando todas las caminatas).
+    caminatas : int, optional
+        Caminatas completadas desde el último avance.
+    """
+    if _activo is not None:
+        _activo.pasos += pasos
+        _activo.caminatas += caminatas
+
+
+def _formatear_duracion(segundos: float):
+    """Duración en formato H:MM:SS."""
+    minutos, segundos = divmod(int(segundos), 60)
+    horas, minutos = divmod(minutos, 60)
+    return f"{horas}:{minutos:02d}:{segundos:02d}"
+
+
+class Progreso:
+    """
+    Informe periódico del avance de una simulación desde un hilo aparte.
+
+    El código de la simulación solo suma contadores con `avanzar`. Un hilo
+    en segundo plano lee esos contadores cada `intervalo` segundos y escribe
+    una línea con el porcentaje completado, las caminatas por segundo y el
+    tiempo restante estimado.
+
+    Attributes
+    ----------
+    --> total_caminatas (int): Caminatas a simular.
+    --> pasos_por_caminata (int): Pasos de cada caminata.
+    --> pasos (int): Pasos simulados hasta ahora (sumando todas las caminatas).
+    --> caminatas (int): Caminatas completadas hasta ahora.
+
+    Methods
+    -------
+    linea()
+        Devuelve el texto del informe con los contadores actuales.
+
+    Notes
+    -----
+    - Usado como administrador de contexto (`with Progreso(...):`) se vuelve
+      el progreso activo, que recibe los avances de la función `avanzar`.
+    - El porcentaje y el tiempo restante se calculan con los pasos, porque
+      los motores por lotes avanzan todas las caminatas juntas y solo las
+      completan al final; las caminatas por segundo son las equivalentes a
+      esos pasos.
+    - Con silencioso=True no se crea el hilo ni se escribe nada.
+    - Con `caminatas_en_paralelo` el avance se suma en el proceso principal
+      a medida que terminan las tareas de los procesos hijos.
+    """
+
+    def __init__(
+        self,
+        total_caminatas: int,
+        pasos_por_caminata: int,
+        intervalo: float = INTERVALO,
+        silencioso: bool = False,
+        salida=None,
+    ):
+        """
+        Crear un progreso sin avances.
+
+        Parameters
+        ----------
+        total_caminatas : int
+            Caminatas a simular.
+        pasos_por_caminata : int
+            Pasos de cada caminata.
+        intervalo : float, optional
+            Segundos entre dos informes consecutivos.
+        silencioso : bool, optional
+            Si es True, los avances se cuentan pero no se informan.
+        salida : file-like, optional
+            Dónde escribir los informes. Por defecto, `sys.stderr`.
+        """
+        self.total_caminatas = total_caminatas
+        self.pasos_por_caminata = pasos_por_caminata
+        self.intervalo = intervalo
+        self.silencioso = silencioso
+        self.salida = salida
+        self.pasos = 0
+        self.caminatas = 0
+        self._inicio = None
+        self._anterior = None
+        self._detener = threading.Event()
+        self._hilo = None
+
+    def linea(self):
+        """
+        Devolver el texto del informe con los contadores actuales.
+
+        Returns
+        -------
+        str
+            Porcentaje completado, caminatas por segundo y tiempo restante.
+        """
+        transcurrido = time.perf_counter() - self._inicio
+        pasos_totales = self.total_caminatas * self.pasos_por_caminata
+        if pasos_totales:
+            fraccion = min(self.pasos / pasos_totales, 1.0)
+            caminatas = self.pasos / self.pasos_por_caminata
+        else:  # Caminatas de 0 pasos: no hay nada que simular
+            fraccion = 1.0
+            caminatas = self.total_caminatas
+
+        velocidad = caminatas / transcurrido if transcurrido else 0.0
+        linea = f"{100 * fraccion:5.1f}% | {velocidad:.3e} caminatas/s"
+        if 0 < fraccion < 1:
+            restante = transcurrido * (1 - fraccion) / fraccion
+            linea += f" | restante {_formatear_duracion(restante)}"
+        return linea + f" | transcurrido {_formatear_duracion(transcurrido)}"
+
+    def _escribir(self):
+        print(self.linea(), file=self.salida or sys.stderr, flush=True)
+
+    def _informar(self):
+        """Escribir un informe cada `intervalo` segundos hasta terminar."""
+        while not self._detener.wait(self.intervalo):
+            self._escribir()
+
+    def __enter__(self):
+        global _activo
+        self._anterior = _activo
+        _activo = self
+        self._inicio = time.perf_counter()
+        if not self.silencioso:
+            self._hilo = threading.Thread(target=self._informar, daemon=True)
+            self._hilo.start()
+        return self
+
+    def __exit__(self, tipo, valor, traza):
+        global _activo
+        _activo = self._anterior
+        if self._hilo is not None:
+            self._detener.set()
+            self._hilo.join()
+            self._hilo = None
+            if tipo is None:
+                self._escribir()
+        return False
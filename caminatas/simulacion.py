@@ -0,0 +1,259 @@
+import math
+import time
+from statistics import NormalDist
+
+import numpy as np
+
+from caminatas.motor import caminatas_en_lote
+
+
+def planificar_pasos(
+    estadisticas,
+    disponibles,
+    pasos_por_simulacion: int,
+    paso_objetivo: int,
+    archivo=None,
+):
+    """
+    Calcular cuántos pasos hay que simular para las estadísticas solicitadas.
+
+    Cada estadística depende de las caminatas solo hasta cierto paso: la
+    probabilidad en el origen ("probabilidad") hasta `paso_objetivo`, y las
+    demás (histogramas y mapas de posiciones finales, gráficas de
+    trayectoria, posiciones finales) y el archivo de trayectorias hasta el
+    final. Las caminatas se detienen en el mayor de esos pasos.
+
+    Parameters
+    ----------
+    estadisticas : sequence of str
+        Estadísticas solicitadas, tomadas de `disponibles`.
+    disponibles : sequence of str
+        Estadísticas que admite el programa (su `ESTADISTICAS_SIMULACION`).
+    pasos_por_simulacion : int
+        Número de pasos de cada caminata completa.
+    paso_objetivo : int
+        Paso en el que se calcula la probabilidad de estar en el origen.
+    archivo : str or os.PathLike, optional
+        Archivo de trayectorias solicitado, que requiere caminatas completas.
+
+    Returns
+    -------
+    int
+        Cantidad de pasos a simular en cada caminata.
+
+    Raises
+    ------
+    ValueError
+        Si se solicita una estadística desconocida o si `paso_objetivo` está
+        fuera del rango [0, pasos_por_simulacion].
+    """
+    desconocidas = set(estadisticas) - set(disponibles)
+    if desconocidas:
+        raise ValueError(f"Estadísticas desconocidas: {sorted(desconocidas)}")
+    if not 0 <= paso_objetivo <= pasos_por_simulacion:
+        raise ValueError(
+            f"El paso objetivo debe estar entre 0 y {pasos_por_simulacion}"
+        )
+
+    if archivo is not None or set(estadisticas) - {"probabilidad"}:
+        return pasos_por_simulacion
+    if "probabilidad" in estadisticas:
+        return paso_objetivo
+    return 0
+
+
+def contar_en_origen(posiciones):
+    """
+    Contar las caminatas que están en el origen.
+
+    Parameters
+    ----------
+    posiciones : array-like of int
+        Posición de cada caminata, de forma (caminatas,) en 1D o
+        (caminatas, d) en Z^d.
+
+    Returns
+    -------
+    int
+        Cantidad de posiciones iguales al origen.
+    """
+    posiciones = np.asarray(posiciones)
+    if posiciones.ndim == 1:
+        return int(np.count_nonzero(posiciones == 0))
+    return int(np.count_nonzero(~posiciones.any(axis=1)))
+
+
+def intervalo_wilson(exitos: int, ensayos: int, confianza: float = 0.95):
+    """
+    Calcular el intervalo de confianza de Wilson de una proporción.
+
+    Parameters
+    ----------
+    exitos : int
+        Cantidad de éxitos observados.
+    ensayos : int
+        Cantidad de ensayos (mayor que 0).
+    confianza : float, optional
+        Nivel de confianza del intervalo, entre 0 y 1.
+
+    Returns
+    -------
+    tuple of float
+        (inferior, superior), siempre dentro de [0, 1].
+
+    Notes
+    -----
+    A diferencia del intervalo normal p ± z·sqrt(p(1-p)/n), el de Wilson no
+    se reduce a un punto cuando no hay éxitos, por lo que también sirve para
+    probabilidades pequeñas.
+    """
+    z = NormalDist().inv_cdf(0.5 + confianza / 2)
+    proporcion = exitos / ensayos
+    denominador = 1 + z * z / ensayos
+    centro = (proporcion + z * z / (2 * ensayos)) / denominador
+    semiancho = (
+        z
+        * math.sqrt(
+            proporcion * (1 - proporcion) / ensayos + z * z / (4 * ensayos * ensayos)
+        )
+        / denominador
+    )
+    return max(0.0, centro - semiancho), min(1.0, centro + semiancho)
+
+
+def estimar_probabilidad(
+    semilla_base: int,
+    paso_objetivo: int,
+    dimension: int,
+    precision=None,
+    precision_relativa=None,
+    confianza: float = 0.95,
+    tiempo_maximo=None,
+    maximo_caminatas=None,
+    caminatas_por_lote: int = 1000,
+    generador: str = "lcg",
+):
+    """
+    Estimar la probabilidad de estar en el origen con las caminatas justas.
+
+    Simula caminatas por lotes (semillas semilla_base + i, solo hasta
+    `paso_objetivo`) y, después de cada lote, calcula el intervalo de
+    Wilson de la probabilidad. Se detiene en cuanto se cumple el primero
+    de los criterios indicados.
+
+    Parameters
+    ----------
+    semilla_base : int
+        Semilla de la primera caminata.
+    paso_objetivo : int
+        Paso en el que se calcula la probabilidad de estar en el origen.
+    dimension : int
+        Dimensión d de la red.
+    precision : float, optional
+        Semiancho máximo del intervalo (por ejemplo, 0.001).
+    precision_relativa : float, optional
+        Semiancho máximo del intervalo como fracción de la probabilidad
+        estimada (por ejemplo, 0.05). Útil para probabilidades pequeñas;
+        no se cumple mientras no haya caminatas en el origen.
+    confianza : float, optional
+        Nivel de confianza del intervalo.
+    tiempo_maximo : float, optional
+        Segundos disponibles. Se comprueba al final de cada lote.
+    maximo_caminatas : int, optional
+        Cantidad máxima de caminatas a simular.
+    caminatas_por_lote : int, optional
+        Tamaño del primer lote y mínimo de los siguientes.
+    generador : str, optional
+        Generador de números pseudoaleatorios (ver `caminatas_en_lote`).
+
+    Returns
+    -------
+    dict
+        - "probabilidad": proporción de caminatas en el origen.
+        - "intervalo": (inferior, superior) de Wilson con `confianza`.
+        - "caminatas": cantidad de caminatas simuladas.
+        - "en_origen": cuántas estaban en el origen en `paso_objetivo`.
+        - "criterio": criterio que detuvo la estimación ("precision",
+          "precision_relativa", "tiempo" o "maximo_caminatas").
+
+    Raises
+    ------
+    ValueError
+        Si no se indica ningún criterio de parada o si `maximo_caminatas`
+        no es positivo.
+
+    Notes
+    -----
+    - Cada lote apunta a las caminatas que, según la estimación actual,
+      faltan para alcanzar la precisión, sin pasar del doble de las ya
+      simuladas; así se evita sobrepasar mucho la cantidad necesaria sin
+      pagar el costo de muchos lotes pequeños.
+    - Las caminatas usan las semillas semilla_base, semilla_base + 1, ...,
+      así que con la misma semilla base una estimación más larga extiende
+      a una más corta.
+    """
+    criterios = (precision, precision_relativa, tiempo_maximo, maximo_caminatas)
+    if all(criterio is None for criterio in criterios):
+        raise ValueError("Indique una precisión, un tiempo o un máximo de caminatas")
+    if maximo_caminatas is not None and maximo_caminatas < 1:
+        raise ValueError("El máximo de caminatas debe ser positivo")
+
+    z = NormalDist().inv_cdf(0.5 + confianza / 2)
+    inicio = time.perf_counter()
+    caminatas = en_origen = 0
+    criterio = None
+    while criterio is None:
+        # Caminatas necesarias según la aproximación normal del semiancho; sin
+        # una precisión pedida, los lotes se duplican hasta agotar el límite
+        proporcion = (en_origen + 1) / (caminatas + 2)
+        necesarias = []
+        if precision is not None:
+            necesarias.append(z * z * proporcion * (1 - proporcion) / precision**2)
+        if precision_relativa is not None:
+            necesarias.append(
+                z * z * (1 - proporcion) / (proporcion * precision_relativa**2)
+            )
+        faltantes = min(necesarias, default=math.inf) - caminatas
+        lote = int(
+            min(max(caminatas_por_lote, faltantes), max(caminatas_por_lote, caminatas))
+        )
+        if maximo_caminatas is not None:
+            lote = min(lote, maximo_caminatas - caminatas)
+
+        semillas = semilla_base + np.arange(
+            caminatas, caminatas + lote, dtype=np.uint64
+        )
+        resultado = caminatas_en_lote(
+            semillas,
+            paso_objetivo,
+            dimension,
+            puntos_control=[paso_objetivo],
+            generador=generador,
+        )
+        caminatas += lote
+        en_origen += contar_en_origen(resultado["puntos_control"][:, 0])
+
+        inferior, superior = intervalo_wilson(en_origen, caminatas, confianza)
+        semiancho = (superior - inferior) / 2
+        if precision is not None and semiancho <= precision:
+            criterio = "precision"
+        elif (
+            precision_relativa is not None
+            and en_origen > 0
+            and semiancho <= precision_relativa * en_origen / caminatas
+        ):
+            criterio = "precision_relativa"
+        elif maximo_caminatas is not None and caminatas >= maximo_caminatas:
+            criterio = "maximo_caminatas"
+        elif (
+            tiempo_maximo is not None and time.perf_counter() - inicio >= tiempo_maximo
+        ):
+            criterio = "tiempo"
+
+    return {
+        "probabilidad": en_origen / caminatas,
+        "intervalo": (inferior, superior),
+        "caminatas": caminatas,
+        "en_origen": en_origen,
+        "criterio": criterio,
+    }
@@ -0,0 +1,25 @@
+import numpy as np
+
+from caminatas.cache import SEMILLAS_POR_PAGINA, CacheResultados
+
+
+def test_pagina_danada_se_descarta(tmp_path):
+    """Una página con su contenido alterado se borra y se trata como ausente."""
+    semillas = np.arange(SEMILLAS_POR_PAGINA - 3, SEMILLAS_POR_PAGINA + 3)
+    posiciones = np.arange(2 * len(semillas)).reshape(-1, 2)
+    CacheResultados(tmp_path, 2).guardar(semillas, 50, posiciones)
+
+    # Una caché nueva lee las páginas del disco, no de su memoria
+    guardadas, encontradas = CacheResultados(tmp_path, 2).obtener(semillas, 50)
+    assert encontradas.all()
+    np.testing.assert_array_equal(guardadas, posiciones)
+
+    paginas = sorted(tmp_path.glob("*.pagina"))
+    assert len(paginas) == 2
+    contenido = bytearray(paginas[0].read_bytes())
+    contenido[-1] ^= 0xFF
+    paginas[0].write_bytes(bytes(contenido))
+
+    _, encontradas = CacheResultados(tmp_path, 2).obtener(semillas, 50)
+    assert encontradas.sum() == len(semillas) // 2
+    assert not paginas[0].exists()
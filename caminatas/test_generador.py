@@ -0,0 +1,44 @@
+import numpy as np
+import pytest
+
+from caminatas.generador import GENERADORES
+
+SEMILLAS = [0, 1, 12345, 2**32 - 1, 2**40 + 7]
+
+
+def _Xi_uno_a_uno(generador, numero: int):
+    """X_i obtenidos con llamadas sucesivas a `siguiente_Ri`."""
+    return np.array(
+        [round(generador.siguiente_Ri() * generador.m) for _ in range(numero)],
+        dtype=np.uint32,
+    )
+
+
+@pytest.mark.parametrize("nombre", sorted(GENERADORES))
+@pytest.mark.parametrize(("tamano_bloque", "desde"), [(1, 0), (7, 0), (64, 5)])
+def test_bloques_Xi_coincide_con_siguiente_Ri(nombre, tamano_bloque, desde):
+    """Los bloques de varias semillas reproducen la secuencia de cada una."""
+    clase = GENERADORES[nombre]
+    pasos = 100
+    bloques = list(clase.bloques_Xi(SEMILLAS, pasos, tamano_bloque, desde))
+    obtenidos = np.concatenate([bloque for _, bloque in bloques], axis=1)
+
+    assert [inicio for inicio, _ in bloques] == list(range(desde, pasos, tamano_bloque))
+    for fila, semilla in zip(obtenidos, SEMILLAS):
+        esperados = _Xi_uno_a_uno(clase(semilla), pasos)[desde:]
+        np.testing.assert_array_equal(fila, esperados)
+
+
+@pytest.mark.parametrize("nombre", sorted(GENERADORES))
+def test_saltar_y_subflujos_continuan_la_secuencia(nombre):
+    """Saltar k pasos y concatenar subflujos equivalen a generar uno a uno."""
+    clase = GENERADORES[nombre]
+    secuencia = _Xi_uno_a_uno(clase(2024), 90)
+
+    generador = clase(2024)
+    generador.saltar(37)
+    np.testing.assert_array_equal(_Xi_uno_a_uno(generador, 53), secuencia[37:])
+
+    subflujos = clase(2024).subflujos(3, 30)
+    concatenados = np.concatenate([_Xi_uno_a_uno(g, 30) for g in subflujos])
+    np.testing.assert_array_equal(concatenados, secuencia)
@@ -0,0 +1,122 @@
+import numpy as np
+import pytest
+
+from caminatas.generador import GENERADORES, GeneradorCongruenciaLineal
+from caminatas.motor import (
+    ESTADISTICAS,
+    caminata,
+    caminatas_en_lote,
+    caminatas_en_paralelo,
+    cargar_estado,
+    guardar_estado,
+)
+
+SEMILLA_BASE = 97
+CAMINATAS = 23
+PASOS = 300
+PUNTOS_CONTROL = [0, 4, 150, PASOS]
+
+
+def _estadisticas_de_trayectoria(trayectoria):
+    """Estadísticas de `caminatas_en_lote` calculadas sobre una trayectoria."""
+    distancia2 = (trayectoria**2).sum(axis=1)
+    retornos = np.flatnonzero(distancia2[1:] == 0) + 1
+    return {
+        "maxima_distancia": np.sqrt(distancia2.max()),
+        "paso_maxima_distancia": int(distancia2.argmax()),
+        "visitas_origen": len(retornos),
+        "primer_retorno": int(retornos[0]) if len(retornos) else -1,
+        "ultimo_cero": int(retornos[-1]) if len(retornos) else 0,
+    }
+
+
+@pytest.mark.parametrize("generador", sorted(GENERADORES))
+@pytest.mark.parametrize("dimension", [1, 2, 3])
+def test_lote_coincide_con_caminata(dimension, generador):
+    """Cada fila del lote es la caminata individual con esa semilla."""
+    semillas = SEMILLA_BASE + np.arange(CAMINATAS)
+    resultado = caminatas_en_lote(
+        semillas,
+        PASOS,
+        dimension,
+        PUNTOS_CONTROL,
+        ESTADISTICAS,
+        tamano_bloque=16,
+        generador=generador,
+    )
+
+    for i, semilla in enumerate(semillas.tolist()):
+        trayectoria = caminata(semilla, PASOS, dimension, generador)
+        np.testing.assert_array_equal(resultado["final"][i], trayectoria[-1])
+        np.testing.assert_array_equal(
+            resultado["puntos_control"][i], trayectoria[PUNTOS_CONTROL]
+        )
+        for nombre, valor in _estadisticas_de_trayectoria(trayectoria).items():
+            assert resultado[nombre][i] == valor, nombre
+
+
+def test_estado_guardado_continua_la_ejecucion(tmp_path):
+    """Continuar un estado leído de disco equivale a una sola ejecución."""
+    semillas = SEMILLA_BASE + np.arange(CAMINATAS)
+    completo = caminatas_en_lote(semillas, PASOS, 2, PUNTOS_CONTROL, ESTADISTICAS)
+
+    estado = {}
+    caminatas_en_lote(semillas, 120, 2, [0, 4], ESTADISTICAS, estado=estado)
+    ruta = str(tmp_path / "estado.npz")
+    guardar_estado(ruta, estado)
+    continuado = caminatas_en_lote(
+        semillas, PASOS, 2, PUNTOS_CONTROL, ESTADISTICAS, estado=cargar_estado(ruta)
+    )
+
+    assert continuado.keys() == completo.keys()
+    for clave in completo:
+        np.testing.assert_array_equal(continuado[clave], completo[clave])
+
+
+def test_paralelo_coincide_con_serie():
+    """Repartir las caminatas entre procesos no cambia ningún resultado."""
+    semillas = SEMILLA_BASE + np.arange(CAMINATAS)
+    serie = caminatas_en_lote(semillas, PASOS, 3, PUNTOS_CONTROL, ESTADISTICAS)
+
+    with caminatas_en_paralelo(
+        SEMILLA_BASE,
+        CAMINATAS,
+        PASOS,
+        3,
+        PUNTOS_CONTROL,
+        ESTADISTICAS,
+        procesos=2,
+        caminatas_por_tarea=5,
+    ) as paralelo:
+        assert paralelo.keys() == serie.keys()
+        for clave in serie:
+            assert paralelo[clave].dtype == serie[clave].dtype
+            np.testing.assert_array_equal(paralelo[clave], serie[clave])
+
+
+def test_dimensiones_1_y_2_siguen_las_reglas_originales():
+    """Con d = 1 y d = 2 se reproducen los pasos de los programas originales."""
+    for semilla in range(SEMILLA_BASE, SEMILLA_BASE + 5):
+        generador = GeneradorCongruenciaLineal(semilla)
+        x = 0
+        esperada = [x]
+        for _ in range(PASOS):
+            x += -1 if generador.siguiente_Ri() < 0.5 else 1
+            esperada.append(x)
+        np.testing.assert_array_equal(caminata(semilla, PASOS, 1)[:, 0], esperada)
+
+        generador = GeneradorCongruenciaLineal(semilla)
+        x = y = 0
+        esperada = [(x, y)]
+        for _ in range(PASOS):
+            Ri = generador.siguiente_Ri()
+            if Ri <= 0.25:
+                x -= 1  # izquierda
+            elif Ri <= 0.5:
+                x += 1  # derecha
+            elif Ri <= 0.75:
+                y += 1  # arriba
+            else:
+                y -= 1  # abajo
+            esperada.append((x, y))
+        np.testing.assert_array_equal(caminata(semilla, PASOS, 2), esperada)
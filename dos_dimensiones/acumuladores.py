@@ -0,0 +1,172 @@
+import numpy as np
+
+
+def _nuevos_limites(minimo, maximo, minimo_actual, maximo_actual):
+    """
+    Calcular los límites ampliados de un eje para incluir [minimo, maximo].
+
+    Al crecer se reserva un margen proporcional al rango, por lo que el
+    costo de las ampliaciones sucesivas es constante amortizado.
+    """
+    margen = (max(maximo, maximo_actual) - min(minimo, minimo_actual) + 1) // 2
+    nuevo_minimo = minimo - margen if minimo < minimo_actual else minimo_actual
+    nuevo_maximo = maximo + margen if maximo > maximo_actual else maximo_actual
+    return nuevo_minimo, nuevo_maximo
+
+
+class OcupacionAcumulada:
+    """
+    Conteo de posiciones (x, y) en una cuadrícula que se actualiza por bloques.
+
+    Guarda un conteo por cada celda entera dentro de sus límites, que crecen
+    a medida que llegan posiciones nuevas. La memoria depende del área
+    recorrida por las caminatas, no de la cantidad de caminatas.
+
+    Attributes
+    ----------
+    --> minimo_x (int): Coordenada x de la fila conteos[0, :].
+    --> minimo_y (int): Coordenada y de la columna conteos[:, 0].
+    --> conteos (numpy.ndarray): Cantidad de caminatas en cada celda (x, y).
+
+    Methods
+    -------
+    agregar(posiciones, pesos=None)
+        Suma a la cuadrícula un bloque de posiciones (x, y).
+
+    fusionar(otra)
+        Suma a la cuadrícula los conteos de otra cuadrícula.
+
+    valores()
+        Devuelve las celdas con al menos una caminata y sus conteos.
+
+    Notes
+    -----
+    - Las ocupaciones parciales (por ejemplo, de distintos procesos) se
+      combinan con `fusionar` sin volver a recorrer las posiciones.
+    - `Utils.graficar_histograma` y `Utils.graficar_heatmap` aceptan
+      directamente una OcupacionAcumulada.
+    """
+
+    def __init__(self):
+        """Crear una cuadrícula vacía."""
+        self.minimo_x = 0
+        self.minimo_y = 0
+        self.conteos = np.zeros((0, 0), dtype=np.int64)
+
+    @property
+    def total(self):
+        """Cantidad total de posiciones acumuladas."""
+        return int(self.conteos.sum())
+
+    def _ampliar(self, minimo_x, maximo_x, minimo_y, maximo_y):
+        """Asegurar que el rectángulo indicado tenga un conteo por celda."""
+        if self.conteos.size == 0:
+            self.minimo_x, self.minimo_y = minimo_x, minimo_y
+            self.conteos = np.zeros(
+                (maximo_x - minimo_x + 1, maximo_y - minimo_y + 1), dtype=np.int64
+            )
+            return
+
+        maximo_x_actual = self.minimo_x + self.conteos.shape[0] - 1
+        maximo_y_actual = self.minimo_y + self.conteos.shape[1] - 1
+        if (
+            minimo_x >= self.minimo_x
+            and maximo_x <= maximo_x_actual
+            and minimo_y >= self.minimo_y
+            and maximo_y <= maximo_y_actual
+        ):
+            return
+
+        nuevo_minimo_x, nuevo_maximo_x = _nuevos_limites(
+            minimo_x, maximo_x, self.minimo_x, maximo_x_actual
+        )
+        nuevo_minimo_y, nuevo_maximo_y = _nuevos_limites(
+            minimo_y, maximo_y, self.minimo_y, maximo_y_actual
+        )
+
+        conteos = np.zeros(
+            (nuevo_maximo_x - nuevo_minimo_x + 1, nuevo_maximo_y - nuevo_minimo_y + 1),
+            dtype=np.int64,
+        )
+        inicio_x = self.minimo_x - nuevo_minimo_x
+        inicio_y = self.minimo_y - nuevo_minimo_y
+        conteos[
+            inicio_x : inicio_x + self.conteos.shape[0],
+            inicio_y : inicio_y + self.conteos.shape[1],
+        ] = self.conteos
+        self.minimo_x, self.minimo_y, self.conteos = (
+            nuevo_minimo_x,
+            nuevo_minimo_y,
+            conteos,
+        )
+
+    def agregar(self, posiciones, pesos=None):
+        """
+        Sumar a la cuadrícula un bloque de posiciones.
+
+        Parameters
+        ----------
+        posiciones : array-like
+            Arreglo de forma (n, 2) o lista de tuplas (x, y).
+        pesos : array-like of int, optional
+            Cantidad de veces que se cuenta cada posición. Por defecto, 1.
+        """
+        posiciones = np.asarray(posiciones, dtype=np.int64).reshape(-1, 2)
+        if len(posiciones) == 0:
+            return
+
+        minimo_x, minimo_y = posiciones.min(axis=0).tolist()
+        maximo_x, maximo_y = posiciones.max(axis=0).tolist()
+        self._ampliar(minimo_x, maximo_x, minimo_y, maximo_y)
+
+        # Contar el bloque en su propio rectángulo con un solo bincount
+        alto, ancho = maximo_x - minimo_x + 1, maximo_y - minimo_y + 1
+        lineales = (posiciones[:, 0] - minimo_x) * ancho + (posiciones[:, 1] - minimo_y)
+        conteos = np.bincount(lineales, weights=pesos, minlength=alto * ancho)
+
+        inicio_x = minimo_x - self.minimo_x
+        inicio_y = minimo_y - self.minimo_y
+        self.conteos[inicio_x : inicio_x + alto, inicio_y : inicio_y + ancho] += (
+            conteos.reshape(alto, ancho).astype(np.int64)
+        )
+
+    def fusionar(self, otra):
+        """
+        Sumar a la cuadrícula los conteos de otra cuadrícula.
+
+        Parameters
+        ----------
+        otra : OcupacionAcumulada
+            Ocupación parcial a combinar. No se modifica.
+        """
+        if otra.conteos.size == 0:
+            return
+
+        alto, ancho = otra.conteos.shape
+        self._ampliar(
+            otra.minimo_x,
+            otra.minimo_x + alto - 1,
+            otra.minimo_y,
+            otra.minimo_y + ancho - 1,
+        )
+        inicio_x = otra.minimo_x - self.minimo_x
+        inicio_y = otra.minimo_y - self.minimo_y
+        self.conteos[inicio_x : inicio_x + alto, inicio_y : inicio_y + ancho] += (
+            otra.conteos
+        )
+
+    def valores(self):
+        """
+        Devolver las celdas con al menos una caminata y sus conteos.
+
+        Returns
+        -------
+        tuple of numpy.ndarray
+            Arreglos (x, y, conteos) de las celdas ocupadas.
+        """
+        indices_x, indices_y = np.nonzero(self.conteos)
+        return (
+            self.minimo_x + indices_x,
+            self.minimo_y + indices_y,
+            self.conteos[indices_x, indices_y],
+        )
@@ -0,0 +1,348 @@
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+import tracemalloc
+
+import numpy as np
+import ruta_caminatas  # noqa: F401
+from main import caminata, ejecutar_simulacion
+from motor import caminatas_en_lote, caminatas_en_paralelo
+
+from caminatas.generador import GeneradorCongruenciaLineal
+
+DIMENSION = 2
+SEMILLA = 12345  # Semilla fija para que todas las ejecuciones midan lo mismo
+
+# Malla de (caminatas, pasos) de cada medición; la rápida sirve para pruebas
+MALLA_CAMINATAS = (10, 100)
+MALLA_PASOS = (1_000, 10_000)
+MALLA_CAMINATAS_RAPIDA = (10,)
+MALLA_PASOS_RAPIDA = (1_000,)
+
+REPETICIONES = 5
+TOLERANCIA = 0.10  # Pérdida de pasos/segundo aceptada frente a la referencia
+
+RUTA_RESULTADOS = "benchmark_resultados.json"
+RUTA_REFERENCIA = "benchmark_referencia.json"
+
+CASOS = {}  # Nombre del caso -> función que prepara la medición
+
+
+def caso(nombre: str):
+    """
+    Registrar un caso de benchmark.
+
+    La función decorada recibe (numero_caminatas, pasos) y devuelve una
+    función sin argumentos que ejecuta el trabajo a medir. Los motores que
+    se agreguen más adelante solo necesitan registrar su propio caso.
+    """
+
+    def registrar(preparar):
+        CASOS[nombre] = preparar
+        return preparar
+
+    return registrar
+
+
+@caso("siguiente_Ri")
+def _caso_siguiente_ri(numero_caminatas, pasos):
+    def ejecutar():
+        generador = GeneradorCongruenciaLineal(SEMILLA)
+        for _ in range(numero_caminatas * pasos):
+            generador.siguiente_Ri()
+
+    return ejecutar
+
+
+@caso("generar_Ri")
+def _caso_generar_ri(numero_caminatas, pasos):
+    def ejecutar():
+        GeneradorCongruenciaLineal(SEMILLA).generar_Ri(numero_caminatas * pasos)
+
+    return ejecutar
+
+
+def _caso_caminata(extraccion):
+    def preparar(numero_caminatas, pasos):
+        def ejecutar():
+            for i in range(numero_caminatas):
+                caminata(SEMILLA + i, pasos, extraccion=extraccion)
+
+        return ejecutar
+
+    return preparar
+
+
+caso("caminata")(_caso_caminata("simple"))
+caso("caminata[multiple]")(_caso_caminata("multiple"))
+
+
+@caso("caminata[compilado]")
+def _caso_caminata_compilada(numero_caminatas, pasos):
+    def ejecutar():
+        for i in range(numero_caminatas):
+            caminata(SEMILLA + i, pasos, compilado=True)
+
+    return ejecutar
+
+
+def _caso_caminatas_en_lote(generador):
+    def preparar(numero_caminatas, pasos):
+        semillas = np.arange(SEMILLA, SEMILLA + numero_caminatas)
+
+        def ejecutar():
+            caminatas_en_lote(semillas, pasos, generador=generador)
+
+        return ejecutar
+
+    return preparar
+
+
+caso("caminatas_en_lote")(_caso_caminatas_en_lote("lcg"))
+caso("caminatas_en_lote[splitmix]")(_caso_caminatas_en_lote("splitmix"))
+
+
+@caso("caminatas_en_paralelo")
+def _caso_caminatas_en_paralelo(numero_caminatas, pasos):
+    def ejecutar():
+        caminatas_en_paralelo(SEMILLA, numero_caminatas, pasos).cerrar()
+
+    return ejecutar
+
+
+def _caso_ejecutar_simulacion(motor):
+    def preparar(numero_caminatas, pasos):
+        def ejecutar():
+            # Sin gráficas, mensajes ni informes de avance; con el paso objetivo en el último paso
+            # las caminatas no se detienen antes de tiempo
+            with contextlib.redirect_stdout(io.StringIO()):
+                ejecutar_simulacion(
+                    numero_caminatas,
+                    SEMILLA,
+                    pasos,
+                    pasos,
+                    motor=motor,
+                    estadisticas=("probabilidad",),
+                    silencioso=True,
+                )
+
+        return ejecutar
+
+    return preparar
+
+
+for _motor in ("escalar", "lotes", "compilado"):
+    caso(f"ejecutar_simulacion[{_motor}]")(_caso_ejecutar_simulacion(_motor))
+
+
+def medir(preparar, numero_caminatas: int, pasos: int, repeticiones: int):
+    """
+    Medir un caso en un punto de la malla.
+
+    Parameters
+    ----------
+    preparar : callable
+        Función registrada con `caso`.
+    numero_caminatas : int
+        Cantidad de caminatas simuladas en cada repetición.
+    pasos : int
+        Pasos de cada caminata.
+    repeticiones : int
+        Cantidad de repeticiones cronometradas.
+
+    Returns
+    -------
+    dict
+        Tiempos de cada repetición, su mediana, media y varianza, pasos por
+        segundo según la mediana y pico de memoria asignada en bytes.
+
+    Notes
+    -----
+    - Antes de cronometrar se hace una ejecución de calentamiento.
+    - El pico de memoria se mide con tracemalloc en una ejecución aparte, para
+      que su costo no afecte los tiempos. No incluye la memoria de los
+      procesos hijos de `caminatas_en_paralelo`.
+    """
+    ejecutar = preparar(numero_caminatas, pasos)
+    ejecutar()
+
+    tiempos = []
+    for _ in range(repeticiones):
+        inicio = time.perf_counter_ns()
+        ejecutar()
+        tiempos.append((time.perf_counter_ns() - inicio) / 1e9)
+
+    tracemalloc.start()
+    ejecutar()
+    _, pico_memoria = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    mediana = statistics.median(tiempos)
+    return {
+        "caminatas": numero_caminatas,
+        "pasos": pasos,
+        "tiempos_s": tiempos,
+        "mediana_s": mediana,
+        "media_s": statistics.fmean(tiempos),
+        "varianza_s2": statistics.variance(tiempos) if len(tiempos) > 1 else 0.0,
+        "pasos_por_segundo": numero_caminatas * pasos / mediana if mediana else 0.0,
+        "pico_memoria": pico_memoria,
+    }
+
+
+def ejecutar_benchmark(
+    casos=None,
+    malla_caminatas=MALLA_CAMINATAS,
+    malla_pasos=MALLA_PASOS,
+    repeticiones=REPETICIONES,
+):
+    """
+    Medir los casos indicados en toda la malla de caminatas y pasos.
+
+    Parameters
+    ----------
+    casos : iterable of str, optional
+        Nombres de los casos a medir. Por defecto, todos los de `CASOS`.
+    malla_caminatas, malla_pasos : iterable of int, optional
+        Valores de cantidad de caminatas y de pasos a combinar.
+    repeticiones : int, optional
+        Repeticiones cronometradas de cada medición.
+
+    Returns
+    -------
+    dict
+        Descripción del entorno y, por cada caso, la lista de mediciones.
+    """
+    casos = list(CASOS) if casos is None else list(casos)
+    desconocidos = set(casos) - set(CASOS)
+    if desconocidos:
+        raise ValueError(f"Casos desconocidos: {sorted(desconocidos)}")
+
+    resultados = {}
+    for nombre in casos:
+        resultados[nombre] = []
+        for numero_caminatas in malla_caminatas:
+            for pasos in malla_pasos:
+                medicion = medir(CASOS[nombre], numero_caminatas, pasos, repeticiones)
+                resultados[nombre].append(medicion)
+                print(
+                    f"{nombre} ({numero_caminatas} caminatas × {pasos} pasos): "
+                    f"{medicion['mediana_s']:.4f} s, "
+                    f"{medicion['pasos_por_segundo']:.3e} pasos/s, "
+                    f"pico {medicion['pico_memoria'] / 10**6:.2f} MB"
+                )
+
+    return {
+        "dimension": DIMENSION,
+        "fecha": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "entorno": {
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+            "plataforma": platform.platform(),
+            "procesadores": os.cpu_count(),
+        },
+        "repeticiones": repeticiones,
+        "casos": resultados,
+    }
+
+
+def comparar(resultados, referencia, tolerancia=TOLERANCIA):
+    """
+    Comparar unos resultados con los de referencia.
+
+    Parameters
+    ----------
+    resultados, referencia : dict
+        Resultados de `ejecutar_benchmark` (o leídos de su JSON).
+    tolerancia : float, optional
+        Fracción de pasos/segundo que se puede perder sin considerarlo una
+        regresión.
+
+    Returns
+    -------
+    list of dict
+        Por cada medición presente en ambos: caso, caminatas, pasos, pasos/s
+        de cada ejecución, su razón (actual / referencia) y si es regresión.
+    """
+    comparaciones = []
+    for nombre, mediciones in resultados["casos"].items():
+        anteriores = {
+            (m["caminatas"], m["pasos"]): m
+            for m in referencia.get("casos", {}).get(nombre, [])
+        }
+        for medicion in mediciones:
+            anterior = anteriores.get((medicion["caminatas"], medicion["pasos"]))
+            if anterior is None or not anterior["pasos_por_segundo"]:
+                continue
+
+            razon = medicion["pasos_por_segundo"] / anterior["pasos_por_segundo"]
+            comparaciones.append(
+                {
+                    "caso": nombre,
+                    "caminatas": medicion["caminatas"],
+                    "pasos": medicion["pasos"],
+                    "pasos_por_segundo": medicion["pasos_por_segundo"],
+                    "pasos_por_segundo_referencia": anterior["pasos_por_segundo"],
+                    "razon": razon,
+                    "regresion": razon < 1 - tolerancia,
+                }
+            )
+    return comparaciones
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark de caminatas en 2D")
+    parser.add_argument("--casos", nargs="+", choices=sorted(CASOS))
+    parser.add_argument("--repeticiones", type=int, default=REPETICIONES)
+    parser.add_argument(
+        "--rapido", action="store_true", help="usar una malla pequeña de prueba"
+    )
+    parser.add_argument("--resultados", metavar="RUTA", default=RUTA_RESULTADOS)
+    parser.add_argument("--referencia", metavar="RUTA", default=RUTA_REFERENCIA)
+    parser.add_argument(
+        "--guardar-referencia",
+        action="store_true",
+        help="guardar los resultados como nueva referencia",
+    )
+    parser.add_argument("--tolerancia", type=float, default=TOLERANCIA)
+    argumentos = parser.parse_args()
+
+    resultados = ejecutar_benchmark(
+        argumentos.casos,
+        MALLA_CAMINATAS_RAPIDA if argumentos.rapido else MALLA_CAMINATAS,
+        MALLA_PASOS_RAPIDA if argumentos.rapido else MALLA_PASOS,
+        argumentos.repeticiones,
+    )
+    with open(argumentos.resultados, "w", encoding="utf-8") as archivo:
+        json.dump(resultados, archivo, indent=2, ensure_ascii=False)
+
+    if argumentos.guardar_referencia:
+        with open(argumentos.referencia, "w", encoding="utf-8") as archivo:
+            json.dump(resultados, archivo, indent=2, ensure_ascii=False)
+        print(f"Referencia guardada en {argumentos.referencia}")
+        sys.exit(0)
+
+    if not os.path.exists(argumentos.referencia):
+        print(f"No hay referencia en {argumentos.referencia}; no se compara")
+        sys.exit(0)
+
+    with open(argumentos.referencia, encoding="utf-8") as archivo:
+        referencia = json.load(archivo)
+
+    regresiones = 0
+    for comparacion in comparar(resultados, referencia, argumentos.tolerancia):
+        marca = "REGRESIÓN" if comparacion["regresion"] else "ok"
+        print(
+            f"{marca}: {comparacion['caso']} ({comparacion['caminatas']} × "
+            f"{comparacion['pasos']}): {comparacion['razon']:.2f}× la referencia"
+        )
+        regresiones += comparacion["regresion"]
+
+    # Un código de salida distinto de cero permite detener un pipeline
+    sys.exit(1 if regresiones else 0)
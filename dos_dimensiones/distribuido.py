@@ -0,0 +1,33 @@
+import ruta_caminatas  # noqa: F401
+from acumuladores import OcupacionAcumulada
+from utils import Utils
+
+from caminatas.distribuido import crear_parser, ejecutar
+
+# El coordinador y los trabajadores son los de `caminatas.distribuido`, con
+# d = 2; este programa solo agrega la ocupación de las posiciones finales.
+
+if __name__ == "__main__":
+    parser = crear_parser(
+        "Caminatas aleatorias en 2D repartidas entre varias máquinas", dimension=2
+    )
+    parser.add_argument(
+        "--graficas",
+        metavar="DIRECTORIO",
+        help="guardar las gráficas en DIRECTORIO sin abrir ventanas",
+    )
+    argumentos = parser.parse_args()
+    if argumentos.graficas is not None:
+        Utils.configurar_salida(argumentos.graficas)
+
+    total = ejecutar(argumentos, dimension=2)
+    if total is not None:
+        probabilidad = total["en_origen"] / max(1, total["caminatas"])
+        print(
+            f"Probabilidad de estar en (0, 0) en el paso "
+            f"{argumentos.paso_objetivo}: {probabilidad:.4f}"
+        )
+        ocupacion = OcupacionAcumulada()
+        ocupacion.agregar(total["sitios"], total["conteos"])
+        Utils.graficar_histograma(ocupacion)
+        Utils.esperar_graficas()
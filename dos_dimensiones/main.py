@@ -1,37 +1,288 @@
+import argparse
 import time
+from contextlib import ExitStack
 
-from generador import GeneradorCongruenciaLineal
+import numpy as np
+import ruta_caminatas  # noqa: F401
+from acumuladores import OcupacionAcumulada
+from archivo import EscritorArchivo
+from motor import (
+    DIMENSION,
+    MOVIMIENTOS_X,
+    MOVIMIENTOS_Y,
+    caminatas_con_respaldo,
+    caminatas_en_lote,
+    caminatas_en_paralelo,
+    indices_direccion,
+)
+from sitios import SitiosVisitados
+from trayectoria import TrayectoriaCompacta
 from utils import Utils
 
+from caminatas.cache import CacheResultados
+from caminatas.generador import GeneradorCongruenciaLineal, GeneradorSplitMix
+from caminatas.motor import bloques_Xi, elegir_tamano_bloque
+from caminatas.motor import caminata as caminata_zd
+from caminatas.perfilador import fase
+from caminatas.progreso import Progreso, avanzar
+from caminatas.simulacion import (
+    contar_en_origen,
+    estimar_probabilidad,
+    planificar_pasos,
+)
 
-def caminata(semilla: int, pasos: int):
-    generador = GeneradorCongruenciaLineal(semilla)
 
+def caminata(
+    semilla: int,
+    pasos: int,
+    compacta: bool = False,
+    extraccion: str = "simple",
+    compilado: bool = False,
+):
+    """
+    Realiza una caminata aleatoria en dos dimensiones.
+
+    Parameters
+    ----------
+    semilla : int
+        Semilla inicial para el generador de números pseudoaleatorios.
+    pasos : int
+        Número de pasos (movimientos) a simular en la caminata.
+    compacta : bool, optional
+        Si es True, devuelve una `TrayectoriaCompacta` (2 bits por paso) en
+        lugar de las listas de coordenadas.
+    extraccion : {"simple", "multiple"}, optional
+        "simple" (por defecto) usa un R_i del generador de congruencia
+        lineal por paso. "multiple" toma 32 pasos de cada salida de 64 bits
+        de `GeneradorSplitMix` (ver `TrayectoriaCompacta.desde_salidas`),
+        con unas 32 veces menos trabajo del generador; la caminata es
+        distinta de la de "simple" con la misma semilla.
+    compilado : bool, optional
+        Si es True, las posiciones se calculan con el núcleo compilado de
+        `nucleos` (numba), con exactamente los mismos resultados. Sin numba
+        se usa un cálculo vectorizado con NumPy.
+
+    Returns
+    -------
+    tuple of list or TrayectoriaCompacta
+        Listas (trayectoria_x, trayectoria_y) con la posición en cada paso,
+        incluyendo la posición inicial (0, 0).
+    """
+    if extraccion == "multiple":
+        trayectoria = TrayectoriaCompacta.desde_salidas(
+            GeneradorSplitMix(semilla), pasos
+        )
+        if compacta:
+            return trayectoria
+        trayectoria_x, trayectoria_y = trayectoria.posiciones()
+        return (trayectoria_x.tolist(), trayectoria_y.tolist())
+    if extraccion != "simple":
+        raise ValueError(f"Extracción desconocida: {extraccion}")
+
+    if compacta:
+        return TrayectoriaCompacta.desde_generador(
+            GeneradorCongruenciaLineal(semilla), pasos
+        )
+    if compilado:
+        # Importación diferida: cargar numba solo cuando se usa
+        from nucleos import posiciones_caminata
+
+        trayectoria_x, trayectoria_y = posiciones_caminata(semilla, pasos)
+        return (trayectoria_x.tolist(), trayectoria_y.tolist())
+
+    # La caminata en Z^d con d = 2: izquierda si R_i <= 0.25, derecha si
+    # R_i <= 0.5, arriba si R_i <= 0.75 y abajo en otro caso
+    trayectoria = caminata_zd(semilla, pasos, DIMENSION)
+    return (trayectoria[:, 0].tolist(), trayectoria[:, 1].tolist())
+
+
+def caminata_resumen(
+    semilla: int,
+    pasos: int,
+    puntos_control=(),
+    estadisticas=("visitas_origen",),
+    estado=None,
+):
+    """
+    Realiza una caminata aleatoria en 2D guardando solo un resumen.
+
+    A diferencia de `caminata`, la trayectoria nunca se guarda completa: los
+    pasos se procesan por bloques y solo se conservan las estadísticas
+    solicitadas, por lo que la memoria usada no crece con `pasos`.
+
+    Parameters
+    ----------
+    semilla : int
+        Semilla inicial para el generador de números pseudoaleatorios.
+    pasos : int
+        Número de pasos a simular en la caminata.
+    puntos_control : sequence of int, optional
+        Pasos (entre 0 y `pasos`) en los que se registra la posición.
+    estadisticas : sequence of str, optional
+        Estadísticas a acumular, tomadas de `motor.ESTADISTICAS`.
+    estado : dict, optional
+        Estado de una llamada anterior con la misma semilla, que se actualiza
+        en el lugar. Si ya tiene N pasos, la caminata continúa desde el paso
+        N y solo se simulan los pasos N+1 ... `pasos` (ver
+        `motor.caminatas_en_lote`).
+
+    Returns
+    -------
+    dict
+        - "final": posición final (x, y).
+        - "puntos_control": diccionario {paso: (x, y)} con los pasos
+          solicitados.
+        - Una entrada por cada estadística solicitada, por ejemplo
+          "maxima_distancia" (distancia euclidiana) o "visitas_origen".
+    """
+    resultado = caminatas_en_lote(
+        [semilla],
+        pasos,
+        puntos_control=puntos_control,
+        estadisticas=estadisticas,
+        estado=estado,
+    )
+
+    resumen = {
+        "final": tuple(resultado["final"][0].tolist()),
+        "puntos_control": {
+            paso: tuple(posicion)
+            for paso, posicion in zip(
+                puntos_control, resultado["puntos_control"][0].tolist()
+            )
+        },
+    }
+    for nombre in estadisticas:
+        resumen[nombre] = resultado[nombre][0].item()
+    return resumen
+
+
+def caminata_sitios(semilla: int, pasos: int, generador: str = "lcg"):
+    """
+    Realiza una caminata aleatoria en 2D registrando los sitios visitados.
+
+    Como en `caminata_resumen`, la trayectoria no se guarda: cada bloque de
+    posiciones se agrega a un `SitiosVisitados` y se descarta, así que la
+    memoria depende de la cantidad de sitios distintos y no de `pasos`.
+
+    Parameters
+    ----------
+    semilla : int
+        Semilla inicial para el generador de números pseudoaleatorios.
+    pasos : int
+        Número de pasos a simular en la caminata.
+    generador : str, optional
+        Generador de números pseudoaleatorios ("lcg" o "splitmix"). Con
+        "lcg" (por defecto) la caminata es la de `caminata`.
+
+    Returns
+    -------
+    SitiosVisitados
+        Sitios visitados en los pasos 0, ..., pasos (incluido el origen) con
+        la cantidad de visitas de cada uno. `rango` es la cantidad de sitios
+        distintos y `ocupacion()` su distribución de visitas.
+    """
+    sitios = SitiosVisitados()
+    sitios.agregar([0], [0])
     x_actual = 0
     y_actual = 0
 
-    trayectoria_x = [x_actual]
-    trayectoria_y = [y_actual]
+    for inicio, bloque in bloques_Xi(
+        [semilla], pasos, elegir_tamano_bloque(1, pasos, DIMENSION), generador
+    ):
+        fin = inicio + bloque.shape[1]
+        with fase("caminata", pasos=bloque.shape[1], caminatas=int(fin == pasos)):
+            indices = indices_direccion(bloque[0])
+            posiciones_x = np.cumsum(MOVIMIENTOS_X[indices], dtype=np.int64)
+            posiciones_y = np.cumsum(MOVIMIENTOS_Y[indices], dtype=np.int64)
+            posiciones_x += x_actual
+            posiciones_y += y_actual
+            sitios.agregar(posiciones_x, posiciones_y)
+            x_actual, y_actual = int(posiciones_x[-1]), int(posiciones_y[-1])
+
+    return sitios
+
+
+def caminata_por_segmentos(semilla: int, pasos: int, numero_segmentos: int):
+    """
+    Realiza una caminata aleatoria en 2D dividida en segmentos independientes.
 
-    for _ in range(pasos):
-        siguiente_Ri = generador.siguiente_Ri()
-        if siguiente_Ri <= 0.25:
-            x_actual -= 1  # izquierda
-        elif siguiente_Ri <= 0.5:
-            x_actual += 1  # derecha
-        elif siguiente_Ri <= 0.75:
-            y_actual += 1  # arriba
-        else:
-            y_actual -= 1  # abajo
+    La secuencia del generador se divide en subflujos que no se solapan
+    (ver `GeneradorCongruenciaLineal.subflujos`). Cada segmento calcula sus
+    desplazamientos relativos sin depender de los demás y luego se unen
+    sumando la posición alcanzada al final de los segmentos anteriores.
 
-        trayectoria_x.append(x_actual)
-        trayectoria_y.append(y_actual)
+    Parameters
+    ----------
+    semilla : int
+        Semilla inicial para el generador de números pseudoaleatorios.
+    pasos : int
+        Número total de pasos a simular en la caminata.
+    numero_segmentos : int
+        Cantidad de segmentos en los que se divide la caminata.
+
+    Returns
+    -------
+    tuple of numpy.ndarray
+        Arreglos (trayectoria_x, trayectoria_y) de tipo int64, incluyendo la
+        posición inicial (0, 0). Coinciden exactamente con `caminata`.
+
+    Notes
+    -----
+    Los segmentos no comparten estado, por lo que pueden calcularse en
+    procesos distintos y unirse después con el mismo resultado.
+    """
+    longitud = -(-pasos // numero_segmentos)  # División redondeando hacia arriba
+    subflujos = GeneradorCongruenciaLineal(semilla).subflujos(
+        numero_segmentos, longitud
+    )
+
+    trayectoria_x = np.zeros(pasos + 1, dtype=np.int64)
+    trayectoria_y = np.zeros(pasos + 1, dtype=np.int64)
+    x_actual = 0
+    y_actual = 0
+
+    for indice, generador in enumerate(subflujos):
+        inicio = indice * longitud
+        fin = min(inicio + longitud, pasos)
+        if inicio >= fin:
+            break
+
+        siguiente_Ri = generador.generar_Ri(fin - inicio)
+        movimientos_x = np.select(
+            [siguiente_Ri <= 0.25, siguiente_Ri <= 0.5], [-1, 1], default=0
+        )
+        movimientos_y = np.select(
+            [siguiente_Ri <= 0.5, siguiente_Ri <= 0.75], [0, 1], default=-1
+        )
+
+        segmento_x = trayectoria_x[inicio + 1 : fin + 1]
+        segmento_y = trayectoria_y[inicio + 1 : fin + 1]
+        np.cumsum(movimientos_x, out=segmento_x)
+        np.cumsum(movimientos_y, out=segmento_y)
+        segmento_x += x_actual
+        segmento_y += y_actual
+        x_actual, y_actual = int(segmento_x[-1]), int(segmento_y[-1])
 
     return (trayectoria_x, trayectoria_y)
 
 
+# Resultados que puede producir ejecutar_simulacion
+ESTADISTICAS_SIMULACION = ("probabilidad", "histograma", "mapa_calor", "trayectoria")
+
+
 def ejecutar_simulacion(
-    numero_simulaciones, semilla, pasos_por_simulacion, paso_objetivo
+    numero_simulaciones,
+    semilla,
+    pasos_por_simulacion,
+    paso_objetivo,
+    motor="lotes",
+    procesos=None,
+    archivo=None,
+    estadisticas=ESTADISTICAS_SIMULACION,
+    silencioso=False,
+    cache=None,
+    respaldo=None,
 ):
     """
     Ejecuta múltiples caminatas aleatorias independientes y analiza los resultados.
@@ -47,63 +298,315 @@ def ejecutar_simulacion(
         Número de pasos a simular en cada caminata aleatoria.
     paso_objetivo : int
         Paso para calcular la probabilidad de estar en el origen (0, 0) en ese paso.
+    motor : {"lotes", "escalar", "compilado"}, optional
+        Forma de simular las caminatas. "lotes" (por defecto) avanza todas
+        las caminatas juntas con `caminatas_en_lote`; "escalar" ejecuta
+        `caminata` una por una; "compilado" simula cada caminata en un hilo
+        con el núcleo de numba de `nucleos.caminatas_compiladas` (o con
+        "lotes" si numba no está instalado). Todos producen los mismos
+        resultados.
+    procesos : int, optional
+        Si se indica (solo con motor="lotes"), las caminatas se reparten en
+        un grupo de ese número de procesos con `caminatas_en_paralelo`. Los
+        resultados son idénticos a la ejecución en un solo proceso.
+    archivo : str or os.PathLike, optional
+        Si se indica, la trayectoria completa de cada caminata se guarda en
+        ese archivo con `EscritorArchivo` (ver `archivo.LectorArchivo` para
+        consultarlo). En este caso las caminatas se simulan una por una con
+        `caminata(..., compacta=True)` y se ignoran `motor` y `procesos`.
+    estadisticas : sequence of str, optional
+        Resultados a producir, tomados de `ESTADISTICAS_SIMULACION`. Las
+        caminatas solo avanzan los pasos que estos necesitan (ver
+        `planificar_pasos`). Por defecto se producen todos.
+    silencioso : bool, optional
+        Si es True, no se informa el avance. Si no, un hilo en segundo plano
+        muestra cada segundo el porcentaje completado, las caminatas por
+        segundo y el tiempo restante (ver `progreso.Progreso`).
+    cache : CacheResultados, optional
+        Si se indica (con motor="lotes" o "compilado"), las posiciones de
+        caminatas ya simuladas con las mismas semillas y pasos se toman de
+        la caché sin volver a simularlas, y las nuevas se guardan en ella.
+    respaldo : str, optional
+        Si se indica (con motor="lotes"), el estado de las caminatas se
+        guarda en ese archivo cada cierto número de pasos con
+        `motor.caminatas_con_respaldo`. Si la simulación se interrumpe,
+        volver a ejecutarla con el mismo archivo continúa desde el último
+        respaldo; con más pasos que los guardados solo se simulan los
+        nuevos. Se ignora `procesos`.
 
     Returns
     -------
-    None
+    dict
+        - "pasos_simulados": pasos que se simularon en cada caminata.
+        - "posiciones_finales": lista de tuplas (x, y) con la posición final
+          de cada caminata, o None si se detuvieron antes del final.
+        - "posiciones_en_paso_objetivo": lista de tuplas (x, y) con la
+          posición de cada caminata en `paso_objetivo`.
     """
-    posiciones_finales = []
-    posiciones_en_paso_objetivo = []  # Guardar paso especifico para calcular probabilidad
+    pasos = planificar_pasos(
+        estadisticas,
+        ESTADISTICAS_SIMULACION,
+        pasos_por_simulacion,
+        paso_objetivo,
+        archivo,
+    )
+    completas = pasos == pasos_por_simulacion
+    pasos_totales = numero_simulaciones * pasos
+    trayectoria_x = trayectoria_y = None
 
-    for i in range(numero_simulaciones):
-        # Usar una semilla diferente en cada iteración
-        semilla_actual = semilla + i
+    # Los resultados en paralelo son vistas de memoria compartida que se
+    # liberan al terminar de agregarlos
+    with ExitStack() as recursos:
+        with Progreso(numero_simulaciones, pasos, silencioso=silencioso):
+            if archivo is not None:
+                posiciones_finales = []
+                posiciones_en_paso_objetivo = []
 
-        trayectoria_x, trayectoria_y = caminata(semilla_actual, pasos_por_simulacion)
+                with (
+                    fase(
+                        "caminata", pasos=pasos_totales, caminatas=numero_simulaciones
+                    ),
+                    EscritorArchivo(archivo, numero_simulaciones) as escritor,
+                ):
+                    for i in range(numero_simulaciones):
+                        semilla_actual = semilla + i
+                        trayectoria = caminata(semilla_actual, pasos, compacta=True)
+                        escritor.agregar(semilla_actual, trayectoria)
 
-        posiciones_finales.append((trayectoria_x[-1], trayectoria_y[-1]))
-        posiciones_en_paso_objetivo.append(
-            (trayectoria_x[paso_objetivo], trayectoria_y[paso_objetivo])
-        )
+                        posiciones_finales.append(trayectoria[-1])
+                        posiciones_en_paso_objetivo.append(trayectoria[paso_objetivo])
 
-        print(
-            f"Simulación {i + 1}/{numero_simulaciones} completada. Posición final: {trayectoria_x[-1], trayectoria_y[-1]}"
-        )
+                        avanzar(pasos, 1)
+
+                if numero_simulaciones > 0:
+                    trayectoria_x, trayectoria_y = trayectoria.posiciones()
+            elif motor in ("lotes", "compilado"):
+                semillas = semilla + np.arange(numero_simulaciones, dtype=np.uint64)
+                resultado = None
+                if cache is not None:
+                    resultado = cache.consultar(semillas, pasos, [paso_objetivo])
+                en_cache = resultado is not None
+
+                if en_cache:
+                    avanzar(pasos_totales, numero_simulaciones)
+                elif motor == "compilado":
+                    from nucleos import caminatas_compiladas
+
+                    with fase(
+                        "caminata", pasos=pasos_totales, caminatas=numero_simulaciones
+                    ):
+                        resultado = caminatas_compiladas(
+                            semilla, numero_simulaciones, pasos, [paso_objetivo]
+                        )
+                elif respaldo is not None:
+                    resultado = caminatas_con_respaldo(
+                        semillas, pasos, respaldo, puntos_control=[paso_objetivo]
+                    )
+                elif procesos is None:
+                    resultado = caminatas_en_lote(
+                        semillas, pasos, puntos_control=[paso_objetivo]
+                    )
+                else:
+                    with fase(
+                        "caminata", pasos=pasos_totales, caminatas=numero_simulaciones
+                    ):
+                        resultado = recursos.enter_context(
+                            caminatas_en_paralelo(
+                                semilla,
+                                numero_simulaciones,
+                                pasos,
+                                puntos_control=[paso_objetivo],
+                                procesos=procesos,
+                            )
+                        )
+                if cache is not None and not en_cache:
+                    cache.guardar_resultado(semillas, pasos, resultado, [paso_objetivo])
+                posiciones_finales = resultado["final"]
+                posiciones_en_paso_objetivo = resultado["puntos_control"][:, 0]
+
+                # Solo la última caminata necesita su trayectoria completa para graficar
+                if "trayectoria" in estadisticas:
+                    trayectoria_x, trayectoria_y = caminata_por_segmentos(
+                        semilla + numero_simulaciones - 1, pasos, 1
+                    )
+            elif motor == "escalar":
+                posiciones_finales = []
+                posiciones_en_paso_objetivo = []  # Guardar paso especifico para calcular probabilidad
+
+                with fase(
+                    "caminata", pasos=pasos_totales, caminatas=numero_simulaciones
+                ):
+                    for i in range(numero_simulaciones):
+                        # Usar una semilla diferente en cada iteración
+                        semilla_actual = semilla + i
+
+                        trayectoria_x, trayectoria_y = caminata(semilla_actual, pasos)
+
+                        posiciones_finales.append(
+                            (trayectoria_x[-1], trayectoria_y[-1])
+                        )
+                        posiciones_en_paso_objetivo.append(
+                            (trayectoria_x[paso_objetivo], trayectoria_y[paso_objetivo])
+                        )
+
+                        avanzar(pasos, 1)
+            else:
+                raise ValueError(f"Motor desconocido: {motor!r}")
+
+        if not completas:
+            print(
+                f"{numero_simulaciones} simulaciones detenidas en el paso {pasos} de {pasos_por_simulacion}"
+            )
+            posiciones_finales = None
 
         # Graficar la trayectoria de la última caminata simulada
-        if i == numero_simulaciones - 1:
-            Utils.graficar_trayectorias(trayectoria_x, trayectoria_y)
+        if "trayectoria" in estadisticas and trayectoria_x is not None:
+            with fase("graficas"):
+                Utils.graficar_trayectorias(trayectoria_x, trayectoria_y)
 
-    Utils.graficar_histograma(posiciones_finales)
-    Utils.graficar_heatmap(posiciones_finales)
+        if {"histograma", "mapa_calor"} & set(estadisticas):
+            with fase("agregacion", caminatas=numero_simulaciones):
+                ocupacion = OcupacionAcumulada()
+                ocupacion.agregar(posiciones_finales)
+            with fase("graficas"):
+                if "histograma" in estadisticas:
+                    Utils.graficar_histograma(ocupacion)
+                if "mapa_calor" in estadisticas:
+                    Utils.graficar_heatmap(ocupacion)
 
-    show_p = calcular_probabilidad(posiciones_en_paso_objetivo, paso_objetivo)
-    print(show_p)
+        if "probabilidad" in estadisticas:
+            with fase("agregacion", caminatas=numero_simulaciones):
+                show_p = calcular_probabilidad(
+                    posiciones_en_paso_objetivo, paso_objetivo
+                )
+            print(show_p)
 
+        # Las posiciones se agregan como arreglos y se devuelven como tuplas
+        if posiciones_finales is not None:
+            posiciones_finales = _como_tuplas(posiciones_finales)
+        return {
+            "pasos_simulados": pasos,
+            "posiciones_finales": posiciones_finales,
+            "posiciones_en_paso_objetivo": _como_tuplas(posiciones_en_paso_objetivo),
+        }
 
-def calcular_probabilidad(posiciones, paso_objetivo):
-    """Verifica si en el paso específico la rana estaba en el origen (0, 0)"""
 
-    contador = sum(1 for coordenada in posiciones if coordenada == (0, 0))
+def _como_tuplas(posiciones):
+    """Convertir posiciones (x, y) en una lista de tuplas de enteros."""
+    return [tuple(p) for p in np.asarray(posiciones).reshape(-1, 2).tolist()]
 
-    probabilidad = contador / len(posiciones)
 
+def calcular_probabilidad(posiciones, paso_objetivo):
+    """Verifica si en el paso específico la rana estaba en el origen (0, 0)"""
+    probabilidad = contar_en_origen(posiciones) / len(posiciones)
     return f"Probabilidad de estar en (0, 0) en el paso {paso_objetivo}: {probabilidad:.4f}"
 
 
 if __name__ == "__main__":
-    # Generar semilla única basada en el tiempo actual
-    semilla_base = int(time.time() * 1000000) % (2**32 - 1)
+    parser = argparse.ArgumentParser(description="Caminatas aleatorias en 2D")
+    parser.add_argument(
+        "--graficas",
+        metavar="DIRECTORIO",
+        help="guardar las gráficas en DIRECTORIO sin abrir ventanas",
+    )
+    parser.add_argument("--formato", choices=["png", "svg"], default="png")
+    parser.add_argument(
+        "--metricas-json",
+        metavar="RUTA",
+        help="guardar en RUTA el resumen de tiempos y memoria por fases",
+    )
+    parser.add_argument(
+        "--rastrear-asignaciones",
+        action="store_true",
+        help="medir también la memoria asignada con tracemalloc (más lento)",
+    )
+    parser.add_argument(
+        "--silencioso", action="store_true", help="no informar el avance"
+    )
+    parser.add_argument(
+        "--cache",
+        metavar="DIRECTORIO",
+        help="reutilizar las caminatas ya simuladas guardadas en DIRECTORIO",
+    )
+    parser.add_argument(
+        "--semilla",
+        type=int,
+        help="semilla base fija (por defecto se genera con la hora actual)",
+    )
+    parser.add_argument(
+        "--respaldo",
+        metavar="RUTA",
+        help="guardar el avance en RUTA y continuar desde él si ya existe",
+    )
+    parser.add_argument(
+        "--precision",
+        type=float,
+        help="estimar solo la probabilidad, hasta este semiancho del intervalo",
+    )
+    parser.add_argument(
+        "--precision-relativa",
+        type=float,
+        help="como --precision, pero relativa a la probabilidad estimada",
+    )
+    parser.add_argument(
+        "--tiempo-maximo",
+        type=float,
+        metavar="SEGUNDOS",
+        help="estimar solo la probabilidad durante a lo sumo SEGUNDOS",
+    )
+    parser.add_argument("--confianza", type=float, default=0.95)
+    argumentos = parser.parse_args()
+    if argumentos.graficas is not None:
+        Utils.configurar_salida(argumentos.graficas, argumentos.formato)
+
+    if argumentos.semilla is not None:
+        semilla_base = argumentos.semilla
+    else:
+        # Generar semilla única basada en el tiempo actual
+        semilla_base = int(time.time() * 1000000) % (2**32 - 1)
+
+    cache = None
+    if argumentos.cache is not None:
+        cache = CacheResultados(argumentos.cache, dimension=2)
 
     numero_de_simulaciones = 100
     pasos_por_simulacion = 10000
     paso_objetivo_para_probabilidad = 4
 
-    # Ejecutar simulaciones
-    Utils.metricas(
-        ejecutar_simulacion,
-        numero_de_simulaciones,
-        semilla_base,
-        pasos_por_simulacion,
-        paso_objetivo_para_probabilidad,
-    )
+    if (
+        argumentos.precision is not None
+        or argumentos.precision_relativa is not None
+        or argumentos.tiempo_maximo is not None
+    ):
+        # Modo adaptativo: tantas caminatas como pida la precisión
+        estimacion = estimar_probabilidad(
+            semilla_base,
+            paso_objetivo_para_probabilidad,
+            DIMENSION,
+            precision=argumentos.precision,
+            precision_relativa=argumentos.precision_relativa,
+            confianza=argumentos.confianza,
+            tiempo_maximo=argumentos.tiempo_maximo,
+        )
+        inferior, superior = estimacion["intervalo"]
+        print(
+            f"Probabilidad de estar en (0, 0) en el paso "
+            f"{paso_objetivo_para_probabilidad}: {estimacion['probabilidad']:.6f} "
+            f"(IC {100 * argumentos.confianza:g}%: [{inferior:.6f}, {superior:.6f}], "
+            f"{estimacion['caminatas']} caminatas, criterio: {estimacion['criterio']})"
+        )
+    else:
+        # Ejecutar simulaciones
+        Utils.metricas(
+            ejecutar_simulacion,
+            numero_de_simulaciones,
+            semilla_base,
+            pasos_por_simulacion,
+            paso_objetivo_para_probabilidad,
+            silencioso=argumentos.silencioso,
+            cache=cache,
+            respaldo=argumentos.respaldo,
+            rastrear_asignaciones=argumentos.rastrear_asignaciones,
+            ruta_json=argumentos.metricas_json,
+        )
+        Utils.esperar_graficas()
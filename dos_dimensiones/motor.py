@@ -0,0 +1,135 @@
+import ruta_caminatas  # noqa: F401
+
+from caminatas import motor as motor_zd
+
+# Las caminatas en 2D son las del motor en Z^d de `caminatas.motor` con
+# d = 2, cuyas direcciones 0-3 son izquierda, derecha, arriba y abajo.
+DIMENSION = 2
+
+# Umbrales enteros equivalentes a R_i <= 0.25, R_i <= 0.5 y R_i <= 0.75
+UMBRALES = tuple(motor_zd.umbrales(DIMENSION).tolist())
+
+# Movimiento (dx, dy) según el índice de dirección calculado con UMBRALES
+MOVIMIENTOS_X = motor_zd.movimientos(DIMENSION)[:, 0]  # izquierda, derecha
+MOVIMIENTOS_Y = motor_zd.movimientos(DIMENSION)[:, 1]  # arriba, abajo
+
+ESTADISTICAS = motor_zd.ESTADISTICAS
+
+
+def indices_direccion(bloque):
+    """
+    Calcular la dirección de cada paso a partir de los X_i de un bloque.
+
+    El índice es la cantidad de umbrales que X_i supera: 0 (izquierda),
+    1 (derecha), 2 (arriba) o 3 (abajo), igual que las comparaciones
+    `<= 0.25`, `<= 0.5` y `<= 0.75` de `caminata`.
+    """
+    return motor_zd.indices_direccion(bloque, DIMENSION)
+
+
+def caminatas_en_lote(
+    semillas,
+    pasos: int,
+    puntos_control=(),
+    estadisticas=(),
+    tamano_bloque=None,
+    generador="lcg",
+    estado=None,
+):
+    """
+    Simular varias caminatas aleatorias en 2D al mismo tiempo.
+
+    Es `caminatas.motor.caminatas_en_lote` con d = 2, por lo que el
+    resultado coincide con `caminata` para cada semilla.
+
+    Parameters
+    ----------
+    semillas : array-like of int
+        Semilla de cada caminata.
+    pasos : int
+        Número de pasos a simular en cada caminata.
+    puntos_control : sequence of int, optional
+        Pasos (entre 0 y `pasos`) en los que se registra la posición.
+    estadisticas : sequence of str, optional
+        Estadísticas adicionales a acumular, tomadas de `ESTADISTICAS`.
+    tamano_bloque : int, optional
+        Cantidad de pasos por bloque.
+    generador : str, optional
+        Generador de números pseudoaleatorios ("lcg" o "splitmix").
+    estado : dict, optional
+        Estado de una ejecución anterior con las mismas semillas, que se
+        actualiza en el lugar (ver `caminatas.motor.caminatas_en_lote`).
+
+    Returns
+    -------
+    dict
+        - "final": arreglo int64 de forma (caminatas, 2) con la posición
+          final (x, y).
+        - "puntos_control": arreglo int64 de forma
+          (caminatas, len(puntos_control), 2) con la posición en cada paso
+          solicitado.
+        - Una entrada por cada estadística solicitada; "maxima_distancia"
+          es la mayor distancia euclidiana al origen alcanzada (float64).
+
+    Raises
+    ------
+    ValueError
+        Si algún punto de control está fuera del rango [0, pasos], si se
+        solicita una estadística desconocida o si `estado` no puede
+        continuarse con estos argumentos.
+    """
+    return motor_zd.caminatas_en_lote(
+        semillas,
+        pasos,
+        DIMENSION,
+        puntos_control,
+        estadisticas,
+        tamano_bloque,
+        generador,
+        estado,
+    )
+
+
+def caminatas_con_respaldo(
+    semillas, pasos: int, ruta: str, puntos_control=(), estadisticas=(), generador="lcg"
+):
+    """
+    Simular en lote en 2D guardando el estado en disco cada cierto número de pasos.
+
+    Es `caminatas.motor.caminatas_con_respaldo` con d = 2; el resultado tiene
+    el formato de `caminatas_en_lote`.
+    """
+    return motor_zd.caminatas_con_respaldo(
+        semillas, pasos, DIMENSION, ruta, puntos_control, estadisticas, generador
+    )
+
+
+def caminatas_en_paralelo(
+    semilla_base,
+    numero_caminatas: int,
+    pasos: int,
+    puntos_control=(),
+    estadisticas=(),
+    procesos=None,
+    caminatas_por_tarea=None,
+    generador="lcg",
+):
+    """
+    Simular caminatas independientes en 2D repartidas en un grupo de procesos.
+
+    Es `caminatas.motor.caminatas_en_paralelo` con d = 2; el resultado tiene
+    el formato de `caminatas_en_lote` y coincide con una ejecución en serie.
+    Es un `caminatas.motor.ResultadoCompartido` cuyos arreglos viven en
+    memoria compartida hasta cerrarlo.
+    """
+    return motor_zd.caminatas_en_paralelo(
+        semilla_base,
+        numero_caminatas,
+        pasos,
+        DIMENSION,
+        puntos_control,
+        estadisticas,
+        procesos,
+        caminatas_por_tarea,
+        generador,
+    )
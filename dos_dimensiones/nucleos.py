@@ -0,0 +1,190 @@
+import numpy as np
+import ruta_caminatas  # noqa: F401
+from motor import (
+    MOVIMIENTOS_X,
+    MOVIMIENTOS_Y,
+    UMBRALES,
+    caminatas_en_lote,
+    indices_direccion,
+)
+
+from caminatas.generador import GeneradorCongruenciaLineal
+from caminatas.progreso import avanzar
+
+try:
+    from numba import njit, prange
+except ImportError:  # numba es opcional: sin él se usan los motores de NumPy
+    njit = None
+    prange = range
+
+NUMBA_DISPONIBLE = njit is not None
+
+# Constantes como uint64 para que el código compilado no mezcle tipos
+_REFERENCIA = GeneradorCongruenciaLineal(0)
+_A = np.uint64(_REFERENCIA.a)
+_C = np.uint64(_REFERENCIA.c)
+_MASCARA = np.uint64(_REFERENCIA.m - 1)  # X mod 2^32 == X & (2^32 - 1)
+_UMBRAL_IZQUIERDA = np.uint64(UMBRALES[0])  # R_i <= 0.25
+_UMBRAL_DERECHA = np.uint64(UMBRALES[1])  # R_i <= 0.5
+_UMBRAL_ARRIBA = np.uint64(UMBRALES[2])  # R_i <= 0.75
+
+
+def _compilar(**opciones):
+    """Compilar la función con numba si está disponible; si no, dejarla igual."""
+
+    def decorar(funcion):
+        if njit is None:
+            return funcion
+        return njit(cache=True, nogil=True, **opciones)(funcion)
+
+    return decorar
+
+
+@_compilar()
+def _mover(x, posicion_x, posicion_y):
+    """Aplicar el movimiento que corresponde a X_i, igual que `caminata`."""
+    if x <= _UMBRAL_IZQUIERDA:
+        posicion_x -= 1
+    elif x <= _UMBRAL_DERECHA:
+        posicion_x += 1
+    elif x <= _UMBRAL_ARRIBA:
+        posicion_y += 1
+    else:
+        posicion_y -= 1
+    return posicion_x, posicion_y
+
+
+@_compilar()
+def _posiciones_nucleo(semilla, pasos, posiciones_x, posiciones_y):
+    """Generar X_i, decidir el movimiento y acumular la posición en una pasada."""
+    x = semilla
+    posicion_x = 0
+    posicion_y = 0
+    posiciones_x[0] = 0
+    posiciones_y[0] = 0
+    for k in range(pasos):
+        x = (_A * x + _C) & _MASCARA
+        posicion_x, posicion_y = _mover(x, posicion_x, posicion_y)
+        posiciones_x[k + 1] = posicion_x
+        posiciones_y[k + 1] = posicion_y
+
+
+@_compilar(parallel=True)
+def _lote_nucleo(semillas, pasos, controles, finales, registro):
+    """
+    Simular cada caminata en su propio hilo sin arreglos intermedios.
+
+    `controles` debe estar ordenado; registro[i, j] recibe la posición (x, y)
+    de la caminata i en el paso controles[j].
+    """
+    for i in prange(len(semillas)):
+        x = semillas[i]
+        posicion_x = 0
+        posicion_y = 0
+        j = 0
+        while j < len(controles) and controles[j] == 0:
+            registro[i, j, 0] = 0
+            registro[i, j, 1] = 0
+            j += 1
+
+        for k in range(1, pasos + 1):
+            x = (_A * x + _C) & _MASCARA
+            posicion_x, posicion_y = _mover(x, posicion_x, posicion_y)
+            while j < len(controles) and controles[j] == k:
+                registro[i, j, 0] = posicion_x
+                registro[i, j, 1] = posicion_y
+                j += 1
+
+        finales[i, 0] = posicion_x
+        finales[i, 1] = posicion_y
+
+
+def posiciones_caminata(semilla: int, pasos: int):
+    """
+    Calcular todas las posiciones de una caminata con el núcleo compilado.
+
+    Parameters
+    ----------
+    semilla : int
+        Semilla inicial para el generador de números pseudoaleatorios.
+    pasos : int
+        Número de pasos a simular.
+
+    Returns
+    -------
+    tuple of numpy.ndarray
+        Arreglos int64 (x, y) con la posición en los pasos 0, ..., pasos;
+        idénticos a las listas de `caminata` con la misma semilla.
+
+    Notes
+    -----
+    - Sin numba se calcula con NumPy a partir de `generar_Xi`.
+    - La primera llamada compila el núcleo (o lo carga de la caché en disco).
+    """
+    posiciones_x = np.zeros(pasos + 1, dtype=np.int64)
+    posiciones_y = np.zeros(pasos + 1, dtype=np.int64)
+    if not NUMBA_DISPONIBLE:
+        indices = indices_direccion(
+            GeneradorCongruenciaLineal(semilla).generar_Xi(pasos)
+        )
+        np.cumsum(MOVIMIENTOS_X[indices], dtype=np.int64, out=posiciones_x[1:])
+        np.cumsum(MOVIMIENTOS_Y[indices], dtype=np.int64, out=posiciones_y[1:])
+        return posiciones_x, posiciones_y
+
+    _posiciones_nucleo(np.uint64(semilla) & _MASCARA, pasos, posiciones_x, posiciones_y)
+    return posiciones_x, posiciones_y
+
+
+def caminatas_compiladas(
+    semilla_base, numero_caminatas: int, pasos: int, puntos_control=()
+):
+    """
+    Simular caminatas independientes con el núcleo compilado, una por hilo.
+
+    Cada caminata fusiona en un solo bucle compilado la generación de X_i,
+    la comparación con los umbrales y la acumulación de la posición, sin
+    arreglos intermedios. Los hilos de numba reemplazan a los procesos de
+    `caminatas_en_paralelo`.
+
+    Parameters
+    ----------
+    semilla_base : int
+        Semilla de la primera caminata; la caminata i usa semilla_base + i.
+    numero_caminatas : int
+        Cantidad de caminatas a simular.
+    pasos : int
+        Número de pasos a simular en cada caminata.
+    puntos_control : sequence of int, optional
+        Pasos (entre 0 y `pasos`) en los que se registra la posición.
+
+    Returns
+    -------
+    dict
+        Mismo formato y valores que `caminatas_en_lote` (sin estadísticas).
+
+    Raises
+    ------
+    ValueError
+        Si algún punto de control está fuera del rango [0, pasos].
+
+    Notes
+    -----
+    Sin numba se usa `caminatas_en_lote`.
+    """
+    semillas = semilla_base + np.arange(numero_caminatas, dtype=np.uint64)
+    if not NUMBA_DISPONIBLE:
+        return caminatas_en_lote(semillas, pasos, puntos_control)
+
+    puntos_control = np.asarray([int(paso) for paso in puntos_control], dtype=np.int64)
+    if np.any((puntos_control < 0) | (puntos_control > pasos)):
+        raise ValueError(f"Los puntos de control deben estar entre 0 y {pasos}")
+
+    orden = np.argsort(puntos_control, kind="stable")
+    finales = np.empty((numero_caminatas, 2), dtype=np.int64)
+    registro = np.empty((numero_caminatas, len(puntos_control), 2), dtype=np.int64)
+    _lote_nucleo(semillas & _MASCARA, pasos, puntos_control[orden], finales, registro)
+    avanzar(numero_caminatas * pasos, numero_caminatas)
+
+    # Devolver los puntos de control en el orden en que se pidieron
+    registro[:, orden] = registro.copy()
+    return {"final": finales, "puntos_control": registro}
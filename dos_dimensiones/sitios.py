@@ -0,0 +1,189 @@
+import numpy as np
+
+BITS_LADO = 5  # Cada baldosa cubre 2^5 × 2^5 sitios
+LADO = 1 << BITS_LADO
+SITIOS_POR_BALDOSA = LADO * LADO
+CAPACIDAD_INICIAL = 64  # Baldosas reservadas al crear la estructura
+
+
+def _claves_baldosa(baldosas_x, baldosas_y):
+    """Empaquetar las coordenadas (x, y) de cada baldosa en un int64."""
+    return (baldosas_x << 32) | (baldosas_y & 0xFFFFFFFF)
+
+
+class SitiosVisitados:
+    """
+    Sitios de la red Z^2 visitados por una caminata y cuántas veces.
+
+    El plano se divide en baldosas de LADO × LADO sitios. Solo se reservan
+    las baldosas que la caminata toca, cada una con un conteo uint32 por
+    sitio, así que los límites crecen con la caminata sin reservar el
+    rectángulo completo que la contiene.
+
+    Attributes
+    ----------
+    --> rango (int): Cantidad de sitios distintos visitados.
+    --> total (int): Cantidad total de visitas registradas.
+    --> limites (tuple): (minimo_x, maximo_x, minimo_y, maximo_y) de los
+        sitios visitados, o None si no hay ninguno.
+
+    Methods
+    -------
+    agregar(x, y)
+        Registra una visita en cada posición (x[i], y[i]).
+
+    visitas(x, y)
+        Devuelve cuántas veces se visitó el sitio (x, y).
+
+    valores()
+        Devuelve los sitios visitados y sus conteos.
+
+    ocupacion()
+        Devuelve cuántos sitios se visitaron exactamente k veces.
+
+    Notes
+    -----
+    - Con baldosas de 32 × 32 sitios cada sitio ocupa 4 bytes, frente a más
+      de 100 bytes por sitio de un conjunto de tuplas de Python.
+    - Las posiciones se agregan por bloques con operaciones de NumPy; no hay
+      bucles de Python por paso.
+    - Los conteos son uint32: cada sitio admite hasta 2^32 - 1 visitas.
+    """
+
+    def __init__(self):
+        """Crear la estructura sin sitios visitados."""
+        self._ranuras = {}  # Clave de baldosa -> fila de _conteos
+        self._baldosas = np.zeros((CAPACIDAD_INICIAL, 2), dtype=np.int64)
+        self._conteos = np.zeros(
+            (CAPACIDAD_INICIAL, SITIOS_POR_BALDOSA), dtype=np.uint32
+        )
+        self.rango = 0
+        self.total = 0
+        self.limites = None
+
+    @property
+    def nbytes(self):
+        """Memoria reservada para los conteos y las baldosas, en bytes."""
+        return self._conteos.nbytes + self._baldosas.nbytes
+
+    def _reservar(self, claves, baldosas_x, baldosas_y):
+        """Asignar una fila de `_conteos` a cada baldosa nueva."""
+        usadas = len(self._ranuras)
+        necesarias = usadas + len(claves)
+        if necesarias > len(self._conteos):
+            capacidad = max(necesarias, 2 * len(self._conteos))
+            conteos = np.zeros((capacidad, SITIOS_POR_BALDOSA), dtype=np.uint32)
+            conteos[:usadas] = self._conteos[:usadas]
+            baldosas = np.zeros((capacidad, 2), dtype=np.int64)
+            baldosas[:usadas] = self._baldosas[:usadas]
+            self._conteos, self._baldosas = conteos, baldosas
+
+        self._baldosas[usadas:necesarias, 0] = baldosas_x
+        self._baldosas[usadas:necesarias, 1] = baldosas_y
+        self._ranuras.update(zip(claves.tolist(), range(usadas, necesarias)))
+
+    def agregar(self, x, y):
+        """
+        Registrar una visita en cada posición (x[i], y[i]).
+
+        Parameters
+        ----------
+        x, y : array-like of int
+            Coordenadas de las posiciones visitadas, por ejemplo un bloque de
+            la trayectoria. Una posición repetida cuenta varias visitas.
+        """
+        x = np.asarray(x, dtype=np.int64).reshape(-1)
+        y = np.asarray(y, dtype=np.int64).reshape(-1)
+        if len(x) == 0:
+            return
+
+        # Contar cada sitio distinto del bloque una sola vez; la clave de un
+        # sitio se empaqueta igual que la de una baldosa de lado 1
+        sitios, cuentas = np.unique(_claves_baldosa(x, y), return_counts=True)
+        sitios_x = sitios >> 32
+        sitios_y = (sitios & 0xFFFFFFFF).astype(np.int32).astype(np.int64)
+
+        claves, inversa = np.unique(
+            _claves_baldosa(sitios_x >> BITS_LADO, sitios_y >> BITS_LADO),
+            return_inverse=True,
+        )
+        nuevas = np.array([clave not in self._ranuras for clave in claves.tolist()])
+        if nuevas.any():
+            self._reservar(
+                claves[nuevas],
+                claves[nuevas] >> 32,
+                (claves[nuevas] & 0xFFFFFFFF).astype(np.int32).astype(np.int64),
+            )
+        ranuras = np.array([self._ranuras[clave] for clave in claves.tolist()])[inversa]
+        locales = ((sitios_x & (LADO - 1)) << BITS_LADO) | (sitios_y & (LADO - 1))
+
+        anteriores = self._conteos[ranuras, locales]
+        self.rango += int(np.count_nonzero(anteriores == 0))
+        self._conteos[ranuras, locales] = anteriores + cuentas.astype(np.uint32)
+        self.total += len(x)
+
+        limites = (
+            int(sitios_x.min()),
+            int(sitios_x.max()),
+            int(sitios_y.min()),
+            int(sitios_y.max()),
+        )
+        if self.limites is not None:
+            limites = (
+                min(limites[0], self.limites[0]),
+                max(limites[1], self.limites[1]),
+                min(limites[2], self.limites[2]),
+                max(limites[3], self.limites[3]),
+            )
+        self.limites = limites
+
+    def visitas(self, x: int, y: int):
+        """
+        Devolver cuántas veces se visitó el sitio (x, y).
+
+        Parameters
+        ----------
+        x, y : int
+            Coordenadas del sitio.
+
+        Returns
+        -------
+        int
+            Cantidad de visitas (0 si nunca se visitó).
+        """
+        ranura = self._ranuras.get(_claves_baldosa(x >> BITS_LADO, y >> BITS_LADO))
+        if ranura is None:
+            return 0
+        local = ((x & (LADO - 1)) << BITS_LADO) | (y & (LADO - 1))
+        return int(self._conteos[ranura, local])
+
+    def valores(self):
+        """
+        Devolver los sitios visitados y sus conteos.
+
+        Returns
+        -------
+        tuple of numpy.ndarray
+            Arreglos (x, y, conteos) de los sitios con al menos una visita,
+            con el mismo formato que `OcupacionAcumulada.valores`.
+        """
+        usadas = len(self._ranuras)
+        ranuras, locales = np.nonzero(self._conteos[:usadas])
+        x = (self._baldosas[ranuras, 0] << BITS_LADO) | (locales >> BITS_LADO)
+        y = (self._baldosas[ranuras, 1] << BITS_LADO) | (locales & (LADO - 1))
+        return x, y, self._conteos[ranuras, locales].astype(np.int64)
+
+    def ocupacion(self):
+        """
+        Devolver cuántos sitios se visitaron exactamente k veces.
+
+        Returns
+        -------
+        numpy.ndarray of int64
+            Arreglo h donde h[k] es la cantidad de sitios con k visitas
+            (h[0] es siempre 0). h.sum() es igual a `rango`.
+        """
+        conteos = self._conteos[: len(self._ranuras)]
+        ocupacion = np.bincount(conteos[conteos > 0], minlength=1)
+        ocupacion[0] = 0
+        return ocupacion
@@ -0,0 +1,255 @@
+import numpy as np
+from motor import MOVIMIENTOS_X, MOVIMIENTOS_Y, indices_direccion
+
+INTERVALO_INDICE = 1024  # Pasos entre posiciones guardadas en el índice
+TAMANO_BLOQUE = 2**20  # Pasos procesados por bloque (múltiplo de INTERVALO_INDICE)
+DESPLAZAMIENTOS_BITS = np.array([6, 4, 2, 0], dtype=np.uint8)  # 4 pasos por byte
+PASOS_POR_SALIDA = 32  # Pasos tomados de cada salida de 64 bits (2 bits por paso)
+
+# Desplazamiento neto (dx, dy) de los 4 pasos guardados en cada valor de un byte
+_INDICES_BYTE = (np.arange(256, dtype=np.uint8)[:, None] >> DESPLAZAMIENTOS_BITS) & 3
+DESPLAZAMIENTO_X_BYTE = MOVIMIENTOS_X[_INDICES_BYTE].sum(axis=1, dtype=np.int8)
+DESPLAZAMIENTO_Y_BYTE = MOVIMIENTOS_Y[_INDICES_BYTE].sum(axis=1, dtype=np.int8)
+
+
+def _empaquetar(indices):
+    """Empaquetar índices de dirección (0 a 3) con 2 bits por paso."""
+    relleno = (-len(indices)) % 4
+    if relleno:
+        indices = np.concatenate((indices, np.zeros(relleno, dtype=indices.dtype)))
+    grupos = indices.astype(np.uint8).reshape(-1, 4) << DESPLAZAMIENTOS_BITS
+    return np.bitwise_or.reduce(grupos, axis=1)
+
+
+def _desempaquetar(datos, inicio: int, fin: int):
+    """Índices de dirección de los pasos inicio + 1, ..., fin."""
+    primer_byte = inicio // 4
+    bytes_necesarios = datos[primer_byte : -(-fin // 4)]
+    indices = (bytes_necesarios[:, None] >> DESPLAZAMIENTOS_BITS) & 3
+    return indices.reshape(-1)[inicio - primer_byte * 4 : fin - primer_byte * 4]
+
+
+class TrayectoriaCompacta:
+    """
+    Trayectoria de una caminata aleatoria en 2D almacenada con 2 bits por paso.
+
+    Cada paso se guarda como su índice de dirección (0 izquierda, 1 derecha,
+    2 arriba, 3 abajo) empaquetado de a 4 pasos por byte. Las posiciones se
+    reconstruyen bajo demanda con sumas acumuladas por bloques, usando un
+    índice disperso con la posición cada `INTERVALO_INDICE` pasos.
+
+    Attributes
+    ----------
+    --> pasos (int): Número de pasos de la caminata.
+    --> datos (numpy.ndarray): Pasos empaquetados, 4 por byte.
+    --> indice (numpy.ndarray): Posición (x, y) cada INTERVALO_INDICE pasos.
+
+    Methods
+    -------
+    desde_generador(generador, pasos)
+        Construye la trayectoria consumiendo `pasos` números del generador.
+
+    desde_salidas(generador, pasos)
+        Construye la trayectoria tomando 32 pasos de cada salida de 64 bits.
+
+    posicion(k)
+        Devuelve la posición (x, y) en el paso k.
+
+    posiciones(inicio, fin)
+        Devuelve los arreglos (x, y) de los pasos inicio, ..., fin - 1.
+
+    Notes
+    -----
+    - `len(trayectoria)` es pasos + 1, igual que las listas de `caminata`.
+    - Ocupa alrededor de 1/4 de byte por paso frente a ~56-72 bytes por paso
+      de las dos listas de enteros de Python.
+    """
+
+    def __init__(self, datos, pasos: int, indice):
+        """
+        Crear la trayectoria a partir de sus datos ya empaquetados.
+
+        Parameters
+        ----------
+        datos : numpy.ndarray of uint8
+            Índices de dirección empaquetados con 2 bits por paso.
+        pasos : int
+            Número de pasos de la caminata.
+        indice : numpy.ndarray of int64
+            Arreglo de forma (pasos // INTERVALO_INDICE + 1, 2) con la
+            posición en cada múltiplo de INTERVALO_INDICE.
+        """
+        self.datos = datos
+        self.pasos = pasos
+        self.indice = indice
+
+    @classmethod
+    def desde_generador(cls, generador, pasos: int):
+        """
+        Construir la trayectoria consumiendo `pasos` números del generador.
+
+        Parameters
+        ----------
+        generador : GeneradorCongruenciaLineal
+            Generador con la semilla de la caminata. Su estado avanza `pasos`.
+        pasos : int
+            Número de pasos a simular.
+
+        Returns
+        -------
+        TrayectoriaCompacta
+            Trayectoria equivalente a la de `caminata` con la misma semilla.
+        """
+        datos = np.empty(-(-pasos // 4), dtype=np.uint8)
+        indice = np.empty((pasos // INTERVALO_INDICE + 1, 2), dtype=np.int64)
+        indice[0] = 0
+        posicion_actual = np.zeros(2, dtype=np.int64)
+
+        for inicio in range(0, pasos, TAMANO_BLOQUE):
+            n = min(TAMANO_BLOQUE, pasos - inicio)
+            indices = indices_direccion(generador.generar_Xi(n))
+            datos[inicio // 4 : (inicio + n + 3) // 4] = _empaquetar(indices)
+
+            completos = n // INTERVALO_INDICE
+            primero = inicio // INTERVALO_INDICE + 1
+            for eje, movimientos in enumerate((MOVIMIENTOS_X, MOVIMIENTOS_Y)):
+                desplazamientos = movimientos[indices]
+                sumas = desplazamientos[: completos * INTERVALO_INDICE].reshape(
+                    completos, INTERVALO_INDICE
+                )
+                acumuladas = np.cumsum(sumas.sum(axis=1, dtype=np.int64))
+                indice[primero : primero + completos, eje] = (
+                    posicion_actual[eje] + acumuladas
+                )
+                posicion_actual[eje] += desplazamientos.sum(dtype=np.int64)
+
+        return cls(datos, pasos, indice)
+
+    @classmethod
+    def desde_salidas(cls, generador, pasos: int):
+        """
+        Construir la trayectoria tomando 32 pasos de cada salida de 64 bits.
+
+        Cada par de bits es directamente un índice de dirección, así que los
+        bytes de las salidas (en orden little-endian) se usan como el
+        arreglo `datos` sin comparar ni empaquetar nada. El índice se
+        calcula con tablas del desplazamiento de cada byte.
+
+        Parameters
+        ----------
+        generador : GeneradorSplitMix
+            Generador con todos sus bits de buena calidad (los bits bajos de
+            una congruencia lineal no lo son). Avanza ceil(pasos / 32) salidas.
+        pasos : int
+            Número de pasos a simular.
+
+        Returns
+        -------
+        TrayectoriaCompacta
+            Trayectoria con los pasos tomados de los bits de las salidas.
+        """
+        salidas = generador.generar_salidas(-(-pasos // PASOS_POR_SALIDA))
+        datos = np.asarray(salidas, dtype="<u8").view(np.uint8)[: -(-pasos // 4)]
+
+        # Apagar los pasos sobrantes del último byte, igual que `_empaquetar`
+        sobrantes = -pasos % 4
+        if sobrantes:
+            datos[-1] &= (0xFF << 2 * sobrantes) & 0xFF
+
+        completos = pasos // INTERVALO_INDICE
+        bytes_completos = datos[: completos * INTERVALO_INDICE // 4]
+        indice = np.zeros((completos + 1, 2), dtype=np.int64)
+        for eje, tabla in enumerate((DESPLAZAMIENTO_X_BYTE, DESPLAZAMIENTO_Y_BYTE)):
+            sumas = tabla[bytes_completos].reshape(completos, INTERVALO_INDICE // 4)
+            indice[1:, eje] = np.cumsum(sumas.sum(axis=1, dtype=np.int64))
+
+        return cls(datos, pasos, indice)
+
+    def __len__(self):
+        return self.pasos + 1
+
+    @property
+    def nbytes(self):
+        """Memoria ocupada por los datos de la trayectoria, en bytes."""
+        return self.datos.nbytes + self.indice.nbytes
+
+    def posicion(self, k: int):
+        """
+        Devolver la posición (x, y) en el paso k.
+
+        Parte de la posición guardada en el índice más cercana por debajo de
+        k, por lo que el costo está acotado por INTERVALO_INDICE pasos.
+
+        Parameters
+        ----------
+        k : int
+            Paso a consultar (0 <= k <= pasos). Se admiten índices negativos.
+
+        Returns
+        -------
+        tuple of int
+            Posición (x, y) de la rana en el paso k.
+        """
+        if k < 0:
+            k += len(self)
+        if not 0 <= k <= self.pasos:
+            raise IndexError("Paso fuera del rango de la trayectoria")
+
+        base = (k // INTERVALO_INDICE) * INTERVALO_INDICE
+        x, y = self.indice[k // INTERVALO_INDICE].tolist()
+        if k == base:
+            return (x, y)
+
+        conteos = np.bincount(_desempaquetar(self.datos, base, k), minlength=4)
+        return (
+            x + int(conteos[1]) - int(conteos[0]),
+            y + int(conteos[2]) - int(conteos[3]),
+        )
+
+    def posiciones(self, inicio: int = 0, fin=None):
+        """
+        Reconstruir las posiciones de los pasos inicio, ..., fin - 1.
+
+        Parameters
+        ----------
+        inicio : int, optional
+            Primer paso a reconstruir.
+        fin : int, optional
+            Paso final (excluido). Por defecto, pasos + 1.
+
+        Returns
+        -------
+        tuple of numpy.ndarray
+            Arreglos (trayectoria_x, trayectoria_y) de tipo int64.
+        """
+        if fin is None:
+            fin = len(self)
+        inicio, fin = max(0, inicio), min(fin, len(self))
+        trayectoria_x = np.empty(max(0, fin - inicio), dtype=np.int64)
+        trayectoria_y = np.empty(max(0, fin - inicio), dtype=np.int64)
+        if len(trayectoria_x) == 0:
+            return (trayectoria_x, trayectoria_y)
+
+        trayectoria_x[0], trayectoria_y[0] = self.posicion(inicio)
+        for desde in range(inicio, fin - 1, TAMANO_BLOQUE):
+            hasta = min(desde + TAMANO_BLOQUE, fin - 1)
+            indices = _desempaquetar(self.datos, desde, hasta)
+            for trayectoria, movimientos in (
+                (trayectoria_x, MOVIMIENTOS_X),
+                (trayectoria_y, MOVIMIENTOS_Y),
+            ):
+                segmento = trayectoria[desde - inicio + 1 : hasta - inicio + 1]
+                np.cumsum(movimientos[indices], out=segmento)
+                segmento += trayectoria[desde - inicio]
+
+        return (trayectoria_x, trayectoria_y)
+
+    def __getitem__(self, clave):
+        if isinstance(clave, slice):
+            inicio, fin, salto = clave.indices(len(self))
+            if salto < 0:
+                trayectoria_x, trayectoria_y = self.posiciones()
+                return (trayectoria_x[clave], trayectoria_y[clave])
+            trayectoria_x, trayectoria_y = self.posiciones(inicio, fin)
+            return (trayectoria_x[::salto], trayectoria_y[::salto])
+        return self.posicion(clave)
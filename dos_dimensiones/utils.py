@@ -1,6 +1,101 @@
-import time
+import functools
+import os
+from concurrent.futures import ThreadPoolExecutor
 
-import matplotlib.pyplot as plt
+import numpy as np
+import ruta_caminatas  # noqa: F401
+from acumuladores import OcupacionAcumulada
+
+from caminatas.perfilador import Perfilador
+
+# Modo sin ventanas: si hay un directorio, las figuras se guardan en archivos
+_salida = {"directorio": None, "formato": "png", "contador": 0}
+_renderizador = None  # Hilo único que dibuja las figuras en modo sin ventanas
+_pendientes = []  # Figuras enviadas al hilo de dibujo
+
+
+def _pyplot():
+    """
+    Importar matplotlib.pyplot solo cuando se va a graficar.
+
+    En modo sin ventanas se usa el backend no interactivo "Agg", que no
+    necesita un entorno gráfico.
+    """
+    if _salida["directorio"] is not None:
+        import matplotlib
+
+        matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+
+    return plt
+
+
+def _mostrar(plt, nombre: str, block: bool = True):
+    """Mostrar la figura actual o, en modo sin ventanas, guardarla y cerrarla."""
+    if _salida["directorio"] is None:
+        plt.show(block=block)
+        return
+
+    _salida["contador"] += 1
+    ruta = os.path.join(
+        _salida["directorio"],
+        f"{_salida['contador']:03d}_{nombre}.{_salida['formato']}",
+    )
+    plt.savefig(ruta)
+    plt.close()
+
+
+def _como_ocupacion(posiciones_finales):
+    """Convertir una lista de tuplas (x, y) en una OcupacionAcumulada."""
+    if isinstance(posiciones_finales, OcupacionAcumulada):
+        return posiciones_finales
+
+    ocupacion = OcupacionAcumulada()
+    ocupacion.agregar(posiciones_finales)
+    return ocupacion
+
+
+def _en_segundo_plano(graficador):
+    """
+    Ejecutar un método de graficado en el hilo de dibujo en modo sin ventanas.
+
+    Así la simulación continúa sin esperar a que se genere la figura. Fuera
+    de ese modo, el método se ejecuta normalmente.
+    """
+
+    @functools.wraps(graficador)
+    def envoltura(*args, **kwargs):
+        if _salida["directorio"] is None:
+            return graficador(*args, **kwargs)
+        _pendientes.append(_renderizador.submit(graficador, *args, **kwargs))
+
+    return envoltura
+
+
+def _indices_extremos(valores, numero_grupos: int):
+    """
+    Índices de los valores mínimo y máximo de cada grupo de puntos consecutivos.
+
+    Divide `valores` en `numero_grupos` grupos de igual tamaño (el último
+    puede ser más corto) y devuelve, ordenados y sin repetir, los índices
+    del mínimo y del máximo de cada grupo junto con el primero y el último.
+    """
+    n = len(valores)
+    tamano = -(-n // numero_grupos)  # Redondeo hacia arriba
+    completos = n // tamano
+    cuerpo = valores[: completos * tamano].reshape(completos, tamano)
+    desplazamientos = np.arange(completos) * tamano
+
+    indices = [
+        np.array([0, n - 1]),
+        desplazamientos + cuerpo.argmin(axis=1),
+        desplazamientos + cuerpo.argmax(axis=1),
+    ]
+    resto = valores[completos * tamano :]
+    if len(resto):
+        indices.append(completos * tamano + np.array([resto.argmin(), resto.argmax()]))
+
+    return np.unique(np.concatenate(indices))
 
 
 class Utils:
@@ -15,10 +110,22 @@ class Utils:
     graficar_trayectorias(x, y)
         Grafica la trayectoria completa de una caminata aleatoria en 2D.
 
+    decimar_trayectoria(x, y, numero_grupos)
+        Reduce una trayectoria larga conservando su forma para graficarla.
+
     graficar_histograma(posiciones_finales)
         Grafica la distribución espacial de posiciones finales de múltiples
         caminatas aleatorias usando scatter plots.
 
+    graficar_heatmap(posiciones_finales)
+        Grafica un mapa de calor de las posiciones finales.
+
+    configurar_salida(directorio, formato)
+        Activa el modo sin ventanas, que guarda las figuras en archivos.
+
+    esperar_graficas()
+        Espera a que terminen de guardarse las figuras pendientes.
+
     metricas(funcion, *args, **kwargs)
         Mide y muestra el tiempo de ejecución y consumo de memoria de una
         función específica (ejecutar_simulacion() del main.py).
@@ -29,7 +136,86 @@ class Utils:
     """
 
     @staticmethod
-    def graficar_trayectorias(x, y):
+    def configurar_salida(directorio=None, formato: str = "png"):
+        """
+        Activar o desactivar el modo sin ventanas.
+
+        En modo sin ventanas las gráficas se dibujan con un backend no
+        interactivo en un hilo de fondo y se guardan como archivos
+        numerados en `directorio`, en lugar de abrir ventanas.
+
+        Parameters
+        ----------
+        directorio : str or os.PathLike, optional
+            Carpeta donde guardar las figuras (se crea si no existe). Con
+            None se vuelve a mostrar las figuras en ventanas.
+        formato : {"png", "svg"}, optional
+            Formato de los archivos de imagen.
+        """
+        global _renderizador
+
+        Utils.esperar_graficas()
+        if directorio is None:
+            _salida["directorio"] = None
+            return
+
+        os.makedirs(directorio, exist_ok=True)
+        _salida.update(directorio=directorio, formato=formato, contador=0)
+        if _renderizador is None:
+            _renderizador = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="graficas"
+            )
+
+    @staticmethod
+    def esperar_graficas():
+        """
+        Esperar a que el hilo de dibujo termine las figuras pendientes.
+
+        Raises
+        ------
+        Exception
+            La primera excepción ocurrida al dibujar alguna figura.
+        """
+        while _pendientes:
+            _pendientes.pop(0).result()
+
+    @staticmethod
+    def decimar_trayectoria(x, y, numero_grupos: int):
+        """
+        Reducir una trayectoria larga a pocos puntos conservando su forma.
+
+        Divide la trayectoria en `numero_grupos` grupos de pasos consecutivos
+        y conserva, en orden, los puntos con x mínima, x máxima, y mínima e
+        y máxima de cada grupo. Así se mantienen exactos el inicio, el final
+        y los extremos de la caminata en ambos ejes.
+
+        Parameters
+        ----------
+        x : array-like
+            Coordenadas x de la trayectoria.
+        y : array-like
+            Coordenadas y de la trayectoria.
+        numero_grupos : int
+            Cantidad de grupos, normalmente el ancho en píxeles de la gráfica.
+
+        Returns
+        -------
+        tuple of numpy.ndarray
+            Arreglos (x, y) con a lo sumo 4 * numero_grupos + 2 puntos.
+        """
+        x = np.asarray(x)
+        y = np.asarray(y)
+        if len(x) <= 4 * numero_grupos:
+            return x, y
+
+        indices = np.union1d(
+            _indices_extremos(x, numero_grupos), _indices_extremos(y, numero_grupos)
+        )
+        return x[indices], y[indices]
+
+    @staticmethod
+    @_en_segundo_plano
+    def graficar_trayectorias(x, y, decimar=True):
         """
         Graficar la trayectoria de una caminata aleatoria en una dimensión.
 
@@ -43,6 +229,10 @@ class Utils:
             Secuencia de iteraciones (números de paso).
         y : list or array-like
             Secuencia de posiciones correspondientes a cada iteración.
+        decimar : bool, optional
+            Si es True (por defecto), la trayectoria se reduce con
+            `decimar_trayectoria` al ancho en píxeles de la figura, por lo
+            que el tiempo de graficado no depende del número de pasos.
 
         Returns
         -------
@@ -55,7 +245,11 @@ class Utils:
         - El punto final se marca en rojo
         - La trayectoria completa se muestra en naranja
         """
-        plt.figure(figsize=(10, 7))
+        plt = _pyplot()
+        figura = plt.figure(figsize=(10, 7))
+        if decimar:
+            ancho_pixeles = int(figura.get_size_inches()[0] * figura.dpi)
+            x, y = Utils.decimar_trayectoria(x, y, ancho_pixeles)
 
         # Dibujar la trayectoria completa
         plt.plot(
@@ -105,24 +299,27 @@ class Utils:
         plt.grid(True, alpha=0.3)
         plt.legend(loc="best")
         plt.tight_layout()
-        plt.show(block=False)
+        _mostrar(plt, "trayectoria", block=False)
 
+    @staticmethod
+    @_en_segundo_plano
     def graficar_histograma(posiciones_finales):
-        from collections import Counter
-
         """
         Graficar la distribución espacial de posiciones finales en 2D.
+
+        Parameters
+        ----------
+        posiciones_finales : list of tuple or OcupacionAcumulada
+            Lista de tuplas (x, y) con la posición final de cada caminata, o
+            una ocupación ya acumulada con ellas.
         """
         # 1. Contar cuántas veces aparece cada coordenada
-        frecuencias = Counter(posiciones_finales)
+        x, y, frecuencias = _como_ocupacion(posiciones_finales).valores()
 
-        # 2. Separar las coordenadas X, Y y obtener las frecuencias para el tamaño
-        coords = list(frecuencias.keys())
-        x = [c[0] for c in coords]
-        y = [c[1] for c in coords]
-        # Multiplicamos la frecuencia por un factor (ej. 50) para que el punto sea visible
-        tamaños = [f * 50 for f in frecuencias.values()]
+        # 2. Multiplicamos la frecuencia por un factor (ej. 50) para que el punto sea visible
+        tamaños = frecuencias * 50
 
+        plt = _pyplot()
         plt.figure(figsize=(10, 10))
 
         # 3. Crear el gráfico de dispersión
@@ -140,22 +337,31 @@ class Utils:
         plt.grid(True, alpha=0.3)
         plt.axis("equal")
         plt.tight_layout()
-        plt.show()
+        _mostrar(plt, "histograma")
 
     @staticmethod
+    @_en_segundo_plano
     def graficar_heatmap(posiciones_finales):
         """
         Crea un mapa de calor basado en la densidad de las posiciones finales.
+
+        Parameters
+        ----------
+        posiciones_finales : list of tuple or OcupacionAcumulada
+            Lista de tuplas (x, y) con la posición final de cada caminata, o
+            una ocupación ya acumulada con ellas.
         """
-        # Extraer x e y de la lista de tuplas
-        x = [p[0] for p in posiciones_finales]
-        y = [p[1] for p in posiciones_finales]
+        # Cada celda ocupada se cuenta con su frecuencia como peso
+        x, y, frecuencias = _como_ocupacion(posiciones_finales).valores()
 
+        plt = _pyplot()
         plt.figure(figsize=(10, 8))
 
         # cmap="hot" o "viridis" son excelentes para densidad
         # bins define la "resolución" de la cuadrícula
-        counts, xedges, yedges, im = plt.hist2d(x, y, bins=30, cmap="hot")
+        counts, xedges, yedges, im = plt.hist2d(
+            x, y, bins=30, weights=frecuencias, cmap="hot"
+        )
 
         # Añadir barra de color para referencia de frecuencia
         plt.colorbar(im, label="Frecuencia de Ranas")
@@ -167,26 +373,42 @@ class Utils:
         plt.xlabel("Posición X")
         plt.ylabel("Posición Y")
 
-        plt.show()
+        _mostrar(plt, "mapa_calor")
 
     @staticmethod
-    def metricas(funcion, *args):
-        import tracemalloc
+    def metricas(funcion, *args, rastrear_asignaciones=False, ruta_json=None, **kwargs):
+        """
+        Medir tiempo de ejecución, memoria y rendimiento por fases de una función.
 
-        tracemalloc.start()
+        La función se ejecuta con un `Perfilador` activo, que mide con
+        `time.perf_counter_ns` las fases instrumentadas (generación,
+        caminata, agregación y gráficas) y toma la memoria residente del
+        proceso, lo que casi no altera el tiempo de la ejecución.
 
-        start_time = time.time()
-        resultado = funcion(*args)
-        end_time = time.time()
+        Parameters
+        ----------
+        funcion : callable
+            Función a ejecutar y medir.
+        *args
+            Argumentos posicionales a pasar a la función.
+        rastrear_asignaciones : bool, optional
+            Si es True, también mide la memoria asignada con tracemalloc,
+            que hace más lenta la ejecución.
+        ruta_json : str or os.PathLike, optional
+            Si se indica, el resumen se guarda en ese archivo como JSON.
+        **kwargs
+            Argumentos con nombre a pasar a la función.
 
-        current, peak = tracemalloc.get_traced_memory()
-        tracemalloc.stop()
+        Returns
+        -------
+        object
+            El valor devuelto por `funcion`.
+        """
+        with Perfilador(rastrear_asignaciones) as perfilador:
+            resultado = funcion(*args, **kwargs)
 
-        print(
-            f"Tiempo de ejecución: {end_time - start_time:.4f} segundos. Equivalente en minutos: {(end_time - start_time) / 60:.2f} minutos"
-        )
-        print(
-            f"Memoria utilizada: {current / 10**6:.4f} MB; Pico de memoria: {peak / 10**6:.4f} MB"
-        )
+        perfilador.imprimir()
+        if ruta_json is not None:
+            perfilador.a_json(ruta_json)
 
         return resultado
@@ -0,0 +1,17 @@
+import ruta_caminatas  # noqa: F401
+
+from caminatas.distribuido import crear_parser, ejecutar
+
+if __name__ == "__main__":
+    parser = crear_parser(
+        "Caminatas aleatorias en Z^d repartidas entre varias máquinas"
+    )
+    argumentos = parser.parse_args()
+
+    total = ejecutar(argumentos)
+    if total is not None:
+        probabilidad = total["en_origen"] / max(1, total["caminatas"])
+        print(
+            f"Probabilidad de estar en el origen en el paso "
+            f"{argumentos.paso_objetivo}: {probabilidad:.4f}"
+        )
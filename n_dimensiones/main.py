@@ -0,0 +1,274 @@
+import argparse
+import time
+from contextlib import ExitStack
+
+import numpy as np
+import ruta_caminatas  # noqa: F401
+
+from caminatas.cache import CacheResultados
+from caminatas.motor import (
+    caminatas_con_respaldo,
+    caminatas_en_lote,
+    caminatas_en_paralelo,
+)
+from caminatas.perfilador import Perfilador, fase
+from caminatas.progreso import Progreso, avanzar
+from caminatas.simulacion import (
+    contar_en_origen,
+    estimar_probabilidad,
+    planificar_pasos,
+)
+
+# Resultados que puede producir ejecutar_simulacion
+ESTADISTICAS_SIMULACION = ("probabilidad", "final")
+
+
+def ejecutar_simulacion(
+    numero_simulaciones,
+    semilla,
+    pasos_por_simulacion,
+    paso_objetivo,
+    dimension,
+    procesos=None,
+    generador="lcg",
+    silencioso=False,
+    cache=None,
+    respaldo=None,
+    estadisticas=ESTADISTICAS_SIMULACION,
+):
+    """
+    Ejecuta múltiples caminatas aleatorias independientes en Z^d.
+
+    Parameters
+    ----------
+    numero_simulaciones : int
+        Cantidad de caminatas aleatorias independientes a simular.
+    semilla : int
+        Semilla de la primera caminata; la caminata i usa semilla + i.
+    pasos_por_simulacion : int
+        Número de pasos a simular en cada caminata aleatoria.
+    paso_objetivo : int
+        Paso para calcular la probabilidad de estar en el origen.
+    dimension : int
+        Dimensión d de la red.
+    procesos : int, optional
+        Si se indica, las caminatas se reparten en un grupo de ese número de
+        procesos con `caminatas_en_paralelo`, con resultados idénticos.
+    generador : str, optional
+        Generador de números pseudoaleatorios ("lcg" o "splitmix").
+    silencioso : bool, optional
+        Si es True, no se informa el avance (ver `progreso.Progreso`).
+    cache : CacheResultados, optional
+        Si se indica, las posiciones de caminatas ya simuladas con las mismas
+        semillas, pasos, dimensión y generador se toman de la caché sin
+        volver a simularlas, y las nuevas se guardan en ella.
+    respaldo : str, optional
+        Si se indica, el estado de las caminatas se guarda en ese archivo
+        cada cierto número de pasos con `caminatas.motor.caminatas_con_respaldo`,
+        y una ejecución interrumpida continúa desde el último respaldo. Se
+        ignora `procesos`.
+    estadisticas : sequence of str, optional
+        Resultados a producir, tomados de `ESTADISTICAS_SIMULACION`:
+        "probabilidad" (probabilidad en el origen en `paso_objetivo`) y
+        "final" (posiciones finales). Las caminatas solo avanzan los pasos
+        que estos necesitan (ver `planificar_pasos`). Por defecto se
+        producen todos.
+
+    Returns
+    -------
+    dict
+        - "pasos_simulados": pasos que se simularon en cada caminata.
+        - "posiciones_finales": arreglo int64 de forma (simulaciones, d), o
+          None si las caminatas se detuvieron antes del final.
+        - "posiciones_en_paso_objetivo": arreglo int64 de forma
+          (simulaciones, d).
+    """
+    pasos = planificar_pasos(
+        estadisticas, ESTADISTICAS_SIMULACION, pasos_por_simulacion, paso_objetivo
+    )
+    semillas = semilla + np.arange(numero_simulaciones, dtype=np.uint64)
+    resultado = None
+    if cache is not None:
+        resultado = cache.consultar(semillas, pasos, [paso_objetivo], generador)
+    en_cache = resultado is not None
+
+    # Los resultados en paralelo son vistas de memoria compartida que se
+    # liberan al terminar de agregarlos
+    with ExitStack() as recursos:
+        with Progreso(numero_simulaciones, pasos, silencioso=silencioso):
+            if en_cache:
+                avanzar(numero_simulaciones * pasos, numero_simulaciones)
+            elif respaldo is not None:
+                resultado = caminatas_con_respaldo(
+                    semillas,
+                    pasos,
+                    dimension,
+                    respaldo,
+                    puntos_control=[paso_objetivo],
+                    generador=generador,
+                )
+            elif procesos is None:
+                resultado = caminatas_en_lote(
+                    semillas,
+                    pasos,
+                    dimension,
+                    puntos_control=[paso_objetivo],
+                    generador=generador,
+                )
+            else:
+                with fase(
+                    "caminata",
+                    pasos=numero_simulaciones * pasos,
+                    caminatas=numero_simulaciones,
+                ):
+                    resultado = recursos.enter_context(
+                        caminatas_en_paralelo(
+                            semilla,
+                            numero_simulaciones,
+                            pasos,
+                            dimension,
+                            puntos_control=[paso_objetivo],
+                            procesos=procesos,
+                            generador=generador,
+                        )
+                    )
+
+        if cache is not None and not en_cache:
+            cache.guardar_resultado(
+                semillas, pasos, resultado, [paso_objetivo], generador
+            )
+
+        # Lo que se devuelve se copia para que sobreviva a la memoria compartida
+        posiciones_finales = resultado["final"].copy()
+        if pasos != pasos_por_simulacion:
+            print(
+                f"{numero_simulaciones} simulaciones detenidas en el paso {pasos} de {pasos_por_simulacion}"
+            )
+            posiciones_finales = None
+
+        posiciones_en_paso_objetivo = resultado["puntos_control"][:, 0].copy()
+        if "probabilidad" in estadisticas:
+            with fase("agregacion", caminatas=numero_simulaciones):
+                probabilidad = calcular_probabilidad(
+                    posiciones_en_paso_objetivo, paso_objetivo
+                )
+            print(probabilidad)
+
+        return {
+            "pasos_simulados": pasos,
+            "posiciones_finales": posiciones_finales,
+            "posiciones_en_paso_objetivo": posiciones_en_paso_objetivo,
+        }
+
+
+def calcular_probabilidad(posiciones, paso_objetivo):
+    """Verifica si en el paso específico la rana estaba en el origen"""
+
+    probabilidad = contar_en_origen(posiciones) / len(posiciones)
+
+    return f"Probabilidad de estar en el origen en el paso {paso_objetivo}: {probabilidad:.4f}"
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Caminatas aleatorias en Z^d")
+    parser.add_argument("--dimension", type=int, default=3)
+    parser.add_argument("--simulaciones", type=int, default=100)
+    parser.add_argument("--pasos", type=int, default=1000000)
+    parser.add_argument("--paso-objetivo", type=int, default=4)
+    parser.add_argument("--procesos", type=int)
+    parser.add_argument("--generador", choices=["lcg", "splitmix"], default="lcg")
+    parser.add_argument(
+        "--estadisticas",
+        nargs="+",
+        choices=ESTADISTICAS_SIMULACION,
+        default=["probabilidad"],
+        help="resultados a producir; con solo probabilidad, las caminatas "
+        "se detienen en el paso objetivo",
+    )
+    parser.add_argument(
+        "--silencioso", action="store_true", help="no informar el avance"
+    )
+    parser.add_argument(
+        "--cache",
+        metavar="DIRECTORIO",
+        help="reutilizar las caminatas ya simuladas guardadas en DIRECTORIO",
+    )
+    parser.add_argument(
+        "--semilla",
+        type=int,
+        help="semilla base fija (por defecto se genera con la hora actual)",
+    )
+    parser.add_argument(
+        "--respaldo",
+        metavar="RUTA",
+        help="guardar el avance en RUTA y continuar desde él si ya existe",
+    )
+    parser.add_argument(
+        "--precision",
+        type=float,
+        help="estimar solo la probabilidad, hasta este semiancho del intervalo",
+    )
+    parser.add_argument(
+        "--precision-relativa",
+        type=float,
+        help="como --precision, pero relativa a la probabilidad estimada",
+    )
+    parser.add_argument(
+        "--tiempo-maximo",
+        type=float,
+        metavar="SEGUNDOS",
+        help="estimar solo la probabilidad durante a lo sumo SEGUNDOS",
+    )
+    parser.add_argument("--confianza", type=float, default=0.95)
+    argumentos = parser.parse_args()
+
+    if argumentos.semilla is not None:
+        semilla_base = argumentos.semilla
+    else:
+        # Generar semilla única basada en el tiempo actual
+        semilla_base = int(time.time() * 1000000) % (2**32 - 1)
+
+    cache = None
+    if argumentos.cache is not None:
+        cache = CacheResultados(argumentos.cache, argumentos.dimension)
+
+    with Perfilador() as perfilador:
+        if (
+            argumentos.precision is not None
+            or argumentos.precision_relativa is not None
+            or argumentos.tiempo_maximo is not None
+        ):
+            # Modo adaptativo: tantas caminatas como pida la precisión
+            estimacion = estimar_probabilidad(
+                semilla_base,
+                argumentos.paso_objetivo,
+                argumentos.dimension,
+                precision=argumentos.precision,
+                precision_relativa=argumentos.precision_relativa,
+                confianza=argumentos.confianza,
+                tiempo_maximo=argumentos.tiempo_maximo,
+                generador=argumentos.generador,
+            )
+            inferior, superior = estimacion["intervalo"]
+            print(
+                f"Probabilidad de estar en el origen en el paso "
+                f"{argumentos.paso_objetivo}: {estimacion['probabilidad']:.6f} "
+                f"(IC {100 * argumentos.confianza:g}%: "
+                f"[{inferior:.6f}, {superior:.6f}], {estimacion['caminatas']} "
+                f"caminatas, criterio: {estimacion['criterio']})"
+            )
+        else:
+            ejecutar_simulacion(
+                argumentos.simulaciones,
+                semilla_base,
+                argumentos.pasos,
+                argumentos.paso_objetivo,
+                argumentos.dimension,
+                argumentos.procesos,
+                argumentos.generador,
+                argumentos.silencioso,
+                cache,
+                argumentos.respaldo,
+                argumentos.estadisticas,
+            )
+    perfilador.imprimir()
@@ -0,0 +1,9 @@
+import sys
+from pathlib import Path
+
+# Los programas de este directorio se ejecutan desde él (python main.py), así
+# que la raíz del repositorio no está en sys.path. Importar este módulo la
+# agrega para que el paquete `caminatas` sea importable.
+RAIZ = str(Path(__file__).resolve().parent.parent)
+if RAIZ not in sys.path:
+    sys.path.append(RAIZ)
@@ -0,0 +1,118 @@
+import numpy as np
+
+
+class HistogramaAcumulado:
+    """
+    Histograma de posiciones enteras que se actualiza por bloques.
+
+    Guarda un conteo por cada posición entera entre sus límites, que crecen
+    a medida que llegan posiciones nuevas. La memoria depende del rango de
+    posiciones observado, no de la cantidad de caminatas.
+
+    Attributes
+    ----------
+    --> minimo (int): Posición correspondiente a conteos[0].
+    --> conteos (numpy.ndarray): Cantidad de caminatas en cada posición.
+
+    Methods
+    -------
+    agregar(posiciones, pesos=None)
+        Suma al histograma un bloque de posiciones.
+
+    fusionar(otro)
+        Suma al histograma los conteos de otro histograma.
+
+    valores()
+        Devuelve las posiciones con al menos una caminata y sus conteos.
+
+    Notes
+    -----
+    - Los histogramas parciales (por ejemplo, de distintos procesos) se
+      combinan con `fusionar` sin volver a recorrer las posiciones.
+    - `Utils.graficar_histograma` acepta directamente un HistogramaAcumulado.
+    """
+
+    def __init__(self):
+        """Crear un histograma vacío."""
+        self.minimo = 0
+        self.conteos = np.zeros(0, dtype=np.int64)
+
+    @property
+    def total(self):
+        """Cantidad total de posiciones acumuladas."""
+        return int(self.conteos.sum())
+
+    def _ampliar(self, minimo: int, maximo: int):
+        """
+        Asegurar que las posiciones [minimo, maximo] tengan un conteo.
+
+        Al crecer se reserva un margen proporcional al rango, por lo que el
+        costo de las ampliaciones sucesivas es constante amortizado.
+        """
+        if len(self.conteos) == 0:
+            self.minimo = minimo
+            self.conteos = np.zeros(maximo - minimo + 1, dtype=np.int64)
+            return
+
+        maximo_actual = self.minimo + len(self.conteos) - 1
+        if minimo >= self.minimo and maximo <= maximo_actual:
+            return
+
+        margen = (max(maximo, maximo_actual) - min(minimo, self.minimo) + 1) // 2
+        nuevo_minimo = minimo - margen if minimo < self.minimo else self.minimo
+        nuevo_maximo = maximo + margen if maximo > maximo_actual else maximo_actual
+
+        conteos = np.zeros(nuevo_maximo - nuevo_minimo + 1, dtype=np.int64)
+        inicio = self.minimo - nuevo_minimo
+        conteos[inicio : inicio + len(self.conteos)] = self.conteos
+        self.minimo, self.conteos = nuevo_minimo, conteos
+
+    def agregar(self, posiciones, pesos=None):
+        """
+        Sumar al histograma un bloque de posiciones.
+
+        Parameters
+        ----------
+        posiciones : array-like of int
+            Posiciones a contar.
+        pesos : array-like of int, optional
+            Cantidad de veces que se cuenta cada posición. Por defecto, 1.
+        """
+        posiciones = np.asarray(posiciones, dtype=np.int64).ravel()
+        if len(posiciones) == 0:
+            return
+
+        minimo, maximo = int(posiciones.min()), int(posiciones.max())
+        self._ampliar(minimo, maximo)
+
+        conteos = np.bincount(posiciones - minimo, weights=pesos)
+        inicio = minimo - self.minimo
+        self.conteos[inicio : inicio + len(conteos)] += conteos.astype(np.int64)
+
+    def fusionar(self, otro):
+        """
+        Sumar al histograma los conteos de otro histograma.
+
+        Parameters
+        ----------
+        otro : HistogramaAcumulado
+            Histograma parcial a combinar. No se modifica.
+        """
+        if len(otro.conteos) == 0:
+            return
+
+        self._ampliar(otro.minimo, otro.minimo + len(otro.conteos) - 1)
+        inicio = otro.minimo - self.minimo
+        self.conteos[inicio : inicio + len(otro.conteos)] += otro.conteos
+
+    def valores(self):
+        """
+        Devolver las posiciones con al menos una caminata y sus conteos.
+
+        Returns
+        -------
+        tuple of numpy.ndarray
+            Arreglos (posiciones, conteos) ordenados por posición.
+        """
+        (indices,) = np.nonzero(self.conteos)
+        return self.minimo + indices, self.conteos[indices]
@@ -0,0 +1,267 @@
+from contextlib import ExitStack
+from pathlib import Path
+
+import numpy as np
+from trayectoria import INTERVALO_INDICE, TrayectoriaCompacta
+
+DIMENSION = 1  # Dimensión de las caminatas que este módulo sabe reconstruir
+MAGIA = b"CAMINATA"
+VERSION = 1
+ALINEACION = 8  # Los bloques de datos comienzan en múltiplos de 8 bytes
+
+# Cabecera general del archivo (64 bytes)
+TIPO_CABECERA = np.dtype(
+    [
+        ("magia", "S8"),
+        ("version", "<u4"),
+        ("dimension", "<u4"),
+        ("numero_caminatas", "<u8"),
+        ("intervalo_indice", "<u8"),
+        ("reservado", "V32"),
+    ]
+)
+
+# Cabecera de cada caminata; "final" usa solo las primeras `dimension` columnas
+TIPO_CAMINATA = np.dtype(
+    [
+        ("semilla", "<u8"),
+        ("pasos", "<u8"),
+        ("dimension", "<u4"),
+        ("reservado", "<u4"),
+        ("inicio_datos", "<u8"),
+        ("bytes_datos", "<u8"),
+        ("inicio_indice", "<u8"),
+        ("final", "<i8", (2,)),
+    ]
+)
+
+
+class EscritorArchivo:
+    """
+    Escritor del archivo binario de trayectorias de caminatas aleatorias.
+
+    El archivo contiene una cabecera general, una tabla con la cabecera de
+    cada caminata (semilla, pasos, dimensión, posición final y ubicación de
+    sus datos) y, para cada caminata, sus pasos empaquetados seguidos del
+    índice de posiciones cada `INTERVALO_INDICE` pasos.
+
+    Methods
+    -------
+    agregar(semilla, trayectoria)
+        Agrega al archivo la `TrayectoriaCompacta` de una caminata.
+
+    cerrar()
+        Escribe las cabeceras y cierra el archivo.
+
+    descartar()
+        Cierra el archivo sin escribir las cabeceras y lo elimina.
+
+    Notes
+    -----
+    - La tabla de caminatas se reserva al abrir el archivo y se escribe al
+      cerrarlo, por lo que los datos de cada caminata se escriben una sola
+      vez y de forma secuencial.
+    - Puede usarse como administrador de contexto (`with`). Si el bloque
+      termina con una excepción, el archivo incompleto se cierra y se
+      elimina en lugar de escribir sus cabeceras.
+    """
+
+    def __init__(self, ruta, numero_caminatas: int):
+        """
+        Crear el archivo y reservar espacio para las cabeceras.
+
+        Parameters
+        ----------
+        ruta : str or os.PathLike
+            Ruta del archivo a crear. Si existe, se sobrescribe.
+        numero_caminatas : int
+            Cantidad máxima de caminatas que se agregarán.
+        """
+        self.numero_caminatas = numero_caminatas
+        self._tabla = np.zeros(numero_caminatas, dtype=TIPO_CAMINATA)
+        self._agregadas = 0
+        self._ruta = ruta
+
+        # El archivo queda abierto en `_pila` solo si se pudo reservar el
+        # espacio de las cabeceras, que se escriben al cerrar
+        with ExitStack() as pila:
+            self._archivo = pila.enter_context(open(ruta, "wb"))
+            self._archivo.write(bytes(TIPO_CABECERA.itemsize + self._tabla.nbytes))
+            self._pila = pila.pop_all()
+
+    def _escribir_alineado(self, datos):
+        """Escribir `datos` en la siguiente posición alineada y devolverla."""
+        posicion = self._archivo.tell()
+        relleno = (-posicion) % ALINEACION
+        self._archivo.write(bytes(relleno))
+        self._archivo.write(np.ascontiguousarray(datos).tobytes())
+        return posicion + relleno
+
+    def agregar(self, semilla: int, trayectoria: TrayectoriaCompacta):
+        """
+        Agregar al archivo la trayectoria de una caminata.
+
+        Parameters
+        ----------
+        semilla : int
+            Semilla con la que se generó la caminata.
+        trayectoria : TrayectoriaCompacta
+            Trayectoria de la caminata (ver `caminata(..., compacta=True)`).
+
+        Raises
+        ------
+        ValueError
+            Si ya se agregaron `numero_caminatas` caminatas.
+        """
+        if self._agregadas >= self.numero_caminatas:
+            raise ValueError("El archivo ya contiene todas las caminatas reservadas")
+
+        registro = self._tabla[self._agregadas]
+        registro["semilla"] = semilla
+        registro["pasos"] = trayectoria.pasos
+        registro["dimension"] = DIMENSION
+        registro["inicio_datos"] = self._escribir_alineado(trayectoria.bits)
+        registro["bytes_datos"] = trayectoria.bits.nbytes
+        registro["inicio_indice"] = self._escribir_alineado(trayectoria.indice)
+        registro["final"][:DIMENSION] = trayectoria[-1]
+        self._agregadas += 1
+
+    def cerrar(self):
+        """Escribir la cabecera general y la tabla de caminatas y cerrar."""
+        if self._archivo.closed:
+            return
+
+        cabecera = np.zeros(1, dtype=TIPO_CABECERA)
+        cabecera["magia"] = MAGIA
+        cabecera["version"] = VERSION
+        cabecera["dimension"] = DIMENSION
+        cabecera["numero_caminatas"] = self._agregadas
+        cabecera["intervalo_indice"] = INTERVALO_INDICE
+
+        with self._pila:
+            self._archivo.seek(0)
+            self._archivo.write(cabecera.tobytes())
+            self._archivo.write(self._tabla.tobytes())
+
+    def descartar(self):
+        """Cerrar el archivo sin escribir las cabeceras y eliminarlo."""
+        self._pila.close()
+        Path(self._ruta).unlink(missing_ok=True)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, tipo, valor, traza):
+        if tipo is None:
+            self.cerrar()
+        else:
+            self.descartar()
+
+
+class LectorArchivo:
+    """
+    Lector de archivos de trayectorias mapeados en memoria.
+
+    El archivo se abre con `numpy.memmap`, por lo que solo se leen del disco
+    las páginas que se consultan. Las trayectorias y las posiciones finales
+    se devuelven como vistas del mapa, sin copiar los datos.
+
+    Attributes
+    ----------
+    --> numero_caminatas (int): Cantidad de caminatas guardadas.
+    --> caminatas (numpy.ndarray): Tabla con la cabecera de cada caminata.
+
+    Methods
+    -------
+    trayectoria(i)
+        Devuelve la `TrayectoriaCompacta` de la caminata i.
+
+    posicion(i, k)
+        Devuelve la posición de la caminata i en el paso k.
+
+    posiciones_finales()
+        Devuelve la posición final de todas las caminatas.
+    """
+
+    def __init__(self, ruta):
+        """
+        Abrir y validar un archivo escrito por `EscritorArchivo`.
+
+        Parameters
+        ----------
+        ruta : str or os.PathLike
+            Ruta del archivo a leer.
+
+        Raises
+        ------
+        ValueError
+            Si el archivo no tiene el formato esperado o guarda caminatas de
+            otra dimensión.
+        """
+        self._mapa = np.memmap(ruta, dtype=np.uint8, mode="r")
+        cabecera = self._mapa[: TIPO_CABECERA.itemsize].view(TIPO_CABECERA)[0]
+
+        if cabecera["magia"] != MAGIA or cabecera["version"] != VERSION:
+            raise ValueError(f"{ruta} no es un archivo de caminatas válido")
+        if cabecera["dimension"] != DIMENSION:
+            raise ValueError(
+                f"El archivo guarda caminatas en {cabecera['dimension']}D, "
+                f"no en {DIMENSION}D"
+            )
+        if cabecera["intervalo_indice"] != INTERVALO_INDICE:
+            raise ValueError("El intervalo del índice no coincide con el actual")
+
+        self.numero_caminatas = int(cabecera["numero_caminatas"])
+        inicio_tabla = TIPO_CABECERA.itemsize
+        fin_tabla = inicio_tabla + self.numero_caminatas * TIPO_CAMINATA.itemsize
+        self.caminatas = self._mapa[inicio_tabla:fin_tabla].view(TIPO_CAMINATA)
+
+    def trayectoria(self, i: int):
+        """
+        Devolver la trayectoria de la caminata i como vista del archivo.
+
+        Parameters
+        ----------
+        i : int
+            Índice de la caminata (0 <= i < numero_caminatas).
+
+        Returns
+        -------
+        TrayectoriaCompacta
+            Trayectoria cuyos arreglos apuntan directamente al archivo.
+        """
+        registro = self.caminatas[i]
+        pasos = int(registro["pasos"])
+        inicio_datos = int(registro["inicio_datos"])
+        inicio_indice = int(registro["inicio_indice"])
+        bytes_indice = (pasos // INTERVALO_INDICE + 1) * 8 * DIMENSION
+
+        bits = self._mapa[inicio_datos : inicio_datos + int(registro["bytes_datos"])]
+        indice = self._mapa[inicio_indice : inicio_indice + bytes_indice].view(np.int64)
+        return TrayectoriaCompacta(bits, pasos, indice)
+
+    def posicion(self, i: int, k: int):
+        """Devolver la posición de la caminata i en el paso k."""
+        return self.trayectoria(i).posicion(k)
+
+    def posiciones_finales(self):
+        """
+        Devolver la posición final de todas las caminatas.
+
+        Returns
+        -------
+        numpy.ndarray of int64
+            Vista de la tabla de caminatas de forma (numero_caminatas,).
+        """
+        return self.caminatas["final"][:, 0]
+
+    def cerrar(self):
+        """Liberar el mapa en memoria del archivo."""
+        self.caminatas = None
+        self._mapa = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *excepcion):
+        self.cerrar()
@@ -0,0 +1,33 @@
+import ruta_caminatas  # noqa: F401
+from acumuladores import HistogramaAcumulado
+from utils import Utils
+
+from caminatas.distribuido import crear_parser, ejecutar
+
+# El coordinador y los trabajadores son los de `caminatas.distribuido`, con
+# d = 1; este programa solo agrega el histograma de posiciones finales.
+
+if __name__ == "__main__":
+    parser = crear_parser(
+        "Caminatas aleatorias en 1D repartidas entre varias máquinas", dimension=1
+    )
+    parser.add_argument(
+        "--graficas",
+        metavar="DIRECTORIO",
+        help="guardar las gráficas en DIRECTORIO sin abrir ventanas",
+    )
+    argumentos = parser.parse_args()
+    if argumentos.graficas is not None:
+        Utils.configurar_salida(argumentos.graficas)
+
+    total = ejecutar(argumentos, dimension=1)
+    if total is not None:
+        probabilidad = total["en_origen"] / max(1, total["caminatas"])
+        print(
+            f"Probabilidad de que en el paso {argumentos.paso_objetivo} "
+            f"la rana este en el origen: {probabilidad}"
+        )
+        histograma = HistogramaAcumulado()
+        histograma.agregar(total["sitios"][:, 0], total["conteos"])
+        Utils.graficar_histograma(histograma)
+        Utils.esperar_graficas()
@@ -1,10 +1,39 @@
+import argparse
 import time
-
-from generador import GeneradorCongruenciaLineal
+from contextlib import ExitStack
+
+import numpy as np
+import ruta_caminatas  # noqa: F401
+from acumuladores import HistogramaAcumulado
+from archivo import EscritorArchivo
+from motor import (
+    DIMENSION,
+    caminatas_con_respaldo,
+    caminatas_en_lote,
+    caminatas_en_paralelo,
+)
+from trayectoria import TrayectoriaCompacta
 from utils import Utils
 
-
-def caminata(semilla: int, pasos: int):
+from caminatas.cache import CacheResultados
+from caminatas.generador import GeneradorCongruenciaLineal, GeneradorSplitMix
+from caminatas.motor import caminata as caminata_zd
+from caminatas.perfilador import fase
+from caminatas.progreso import Progreso, avanzar
+from caminatas.simulacion import (
+    contar_en_origen,
+    estimar_probabilidad,
+    planificar_pasos,
+)
+
+
+def caminata(
+    semilla: int,
+    pasos: int,
+    compacta: bool = False,
+    extraccion: str = "simple",
+    compilado: bool = False,
+):
     """
     Realiza una caminata aleatoria en una dimensión.
 
@@ -19,33 +48,180 @@ def caminata(semilla: int, pasos: int):
         Determina la secuencia de movimientos de manera reproducible.
     pasos : int
         Número de pasos (movimientos) a simular en la caminata.
+    compacta : bool, optional
+        Si es True, devuelve una `TrayectoriaCompacta` (1 bit por paso) en
+        lugar de una lista.
+    extraccion : {"simple", "multiple"}, optional
+        "simple" (por defecto) usa un R_i del generador de congruencia
+        lineal por paso. "multiple" toma 64 pasos de cada salida de 64 bits
+        de `GeneradorSplitMix` (ver `TrayectoriaCompacta.desde_salidas`),
+        con unas 64 veces menos trabajo del generador; la caminata es
+        distinta de la de "simple" con la misma semilla.
+    compilado : bool, optional
+        Si es True, las posiciones se calculan con el núcleo compilado de
+        `nucleos` (numba), con exactamente los mismos resultados. Sin numba
+        se usa un cálculo vectorizado con NumPy.
 
     Returns
     -------
-    list of int
+    list of int or TrayectoriaCompacta
         Lista con las posiciones de la rana en cada paso, incluyendo
         la posición inicial (0).
 
     """
-    # Crear un nuevo generador con esta semilla específica
-    generador = GeneradorCongruenciaLineal(semilla)
+    if extraccion == "multiple":
+        trayectoria = TrayectoriaCompacta.desde_salidas(
+            GeneradorSplitMix(semilla), pasos
+        )
+        return trayectoria if compacta else trayectoria.posiciones().tolist()
+    if extraccion != "simple":
+        raise ValueError(f"Extracción desconocida: {extraccion}")
+
+    if compacta:
+        return TrayectoriaCompacta.desde_generador(
+            GeneradorCongruenciaLineal(semilla), pasos
+        )
+    if compilado:
+        # Importación diferida: cargar numba solo cuando se usa
+        from nucleos import posiciones_caminata
+
+        return posiciones_caminata(semilla, pasos).tolist()
+
+    # La caminata en Z^d con d = 1: izquierda (-1) si R_i < 0.5, derecha (+1)
+    return caminata_zd(semilla, pasos, DIMENSION)[:, 0].tolist()
+
+
+def caminata_resumen(
+    semilla: int,
+    pasos: int,
+    puntos_control=(),
+    estadisticas=("visitas_origen",),
+    estado=None,
+):
+    """
+    Realiza una caminata aleatoria en 1D guardando solo un resumen.
+
+    A diferencia de `caminata`, la trayectoria nunca se guarda completa: los
+    pasos se procesan por bloques y solo se conservan las estadísticas
+    solicitadas, por lo que la memoria usada no crece con `pasos`.
+
+    Parameters
+    ----------
+    semilla : int
+        Semilla inicial para el generador de números pseudoaleatorios.
+    pasos : int
+        Número de pasos a simular en la caminata.
+    puntos_control : sequence of int, optional
+        Pasos (entre 0 y `pasos`) en los que se registra la posición.
+    estadisticas : sequence of str, optional
+        Estadísticas a acumular, tomadas de `motor.ESTADISTICAS`.
+    estado : dict, optional
+        Estado de una llamada anterior con la misma semilla, que se actualiza
+        en el lugar. Si ya tiene N pasos, la caminata continúa desde el paso
+        N y solo se simulan los pasos N+1 ... `pasos` (ver
+        `motor.caminatas_en_lote`).
+
+    Returns
+    -------
+    dict
+        - "final": posición final (int).
+        - "puntos_control": diccionario {paso: posición} con los pasos
+          solicitados.
+        - Una entrada por cada estadística solicitada, por ejemplo
+          "maxima_distancia" (mayor |x|) o "visitas_origen".
+    """
+    resultado = caminatas_en_lote(
+        [semilla],
+        pasos,
+        puntos_control=puntos_control,
+        estadisticas=estadisticas,
+        estado=estado,
+    )
 
-    posicion_actual = 0
-    historial_posiciones = [posicion_actual]
+    resumen = {
+        "final": int(resultado["final"][0]),
+        "puntos_control": {
+            paso: int(posicion)
+            for paso, posicion in zip(
+                puntos_control, resultado["puntos_control"][0].tolist()
+            )
+        },
+    }
+    for nombre in estadisticas:
+        resumen[nombre] = resultado[nombre][0].item()
+    return resumen
+
+
+def caminata_por_segmentos(semilla: int, pasos: int, numero_segmentos: int):
+    """
+    Realiza una caminata aleatoria en 1D dividida en segmentos independientes.
 
-    for _ in range(pasos):
-        numero_aleatorio = generador.siguiente_Ri()
-        if numero_aleatorio < 0.5:
-            posicion_actual -= 1  # Movimiento a la izquierda
-        else:
-            posicion_actual += 1  # Movimiento a la derecha
-        historial_posiciones.append(posicion_actual)
+    La secuencia del generador se divide en subflujos que no se solapan
+    (ver `GeneradorCongruenciaLineal.subflujos`). Cada segmento calcula sus
+    posiciones relativas sin depender de los demás y luego se unen sumando
+    el desplazamiento acumulado de los segmentos anteriores.
+
+    Parameters
+    ----------
+    semilla : int
+        Semilla inicial para el generador de números pseudoaleatorios.
+    pasos : int
+        Número total de pasos a simular en la caminata.
+    numero_segmentos : int
+        Cantidad de segmentos en los que se divide la caminata.
+
+    Returns
+    -------
+    numpy.ndarray of int64
+        Posiciones de la rana en cada paso, incluyendo la posición inicial
+        (0). Coincide exactamente con el resultado de `caminata`.
+
+    Notes
+    -----
+    Los segmentos no comparten estado, por lo que pueden calcularse en
+    procesos distintos y unirse después con el mismo resultado.
+    """
+    longitud = -(-pasos // numero_segmentos)  # División redondeando hacia arriba
+    subflujos = GeneradorCongruenciaLineal(semilla).subflujos(
+        numero_segmentos, longitud
+    )
+
+    historial_posiciones = np.zeros(pasos + 1, dtype=np.int64)
+    desplazamiento = 0
+
+    for indice, generador in enumerate(subflujos):
+        inicio = indice * longitud
+        fin = min(inicio + longitud, pasos)
+        if inicio >= fin:
+            break
+
+        numeros_aleatorios = generador.generar_Ri(fin - inicio)
+        movimientos = np.where(numeros_aleatorios < 0.5, -1, 1)
+
+        segmento = historial_posiciones[inicio + 1 : fin + 1]
+        np.cumsum(movimientos, out=segmento)
+        segmento += desplazamiento
+        desplazamiento = int(segmento[-1])
 
     return historial_posiciones
 
 
+# Resultados que puede producir ejecutar_simulacion
+ESTADISTICAS_SIMULACION = ("probabilidad", "histograma", "trayectoria")
+
+
 def ejecutar_simulacion(
-    numero_simulaciones, semilla_base, pasos_por_simulacion, paso_objetivo
+    numero_simulaciones,
+    semilla_base,
+    pasos_por_simulacion,
+    paso_objetivo,
+    motor="lotes",
+    procesos=None,
+    archivo=None,
+    estadisticas=ESTADISTICAS_SIMULACION,
+    silencioso=False,
+    cache=None,
+    respaldo=None,
 ):
     """
     Ejecuta múltiples caminatas aleatorias independientes y analiza los resultados.
@@ -65,47 +241,214 @@ def ejecutar_simulacion(
         Número de pasos a simular en cada caminata aleatoria.
     paso_objetivo : int
         Paso para calcular la probabilidad de estar en el origen (0) en ese paso.
+    motor : {"lotes", "escalar", "compilado"}, optional
+        Forma de simular las caminatas. "lotes" (por defecto) avanza todas
+        las caminatas juntas con `caminatas_en_lote`; "escalar" ejecuta
+        `caminata` una por una; "compilado" simula cada caminata en un hilo
+        con el núcleo de numba de `nucleos.caminatas_compiladas` (o con
+        "lotes" si numba no está instalado). Todos producen los mismos
+        resultados.
+    procesos : int, optional
+        Si se indica (solo con motor="lotes"), las caminatas se reparten en
+        un grupo de ese número de procesos con `caminatas_en_paralelo`. Los
+        resultados son idénticos a la ejecución en un solo proceso.
+    archivo : str or os.PathLike, optional
+        Si se indica, la trayectoria completa de cada caminata se guarda en
+        ese archivo con `EscritorArchivo` (ver `archivo.LectorArchivo` para
+        consultarlo). En este caso las caminatas se simulan una por una con
+        `caminata(..., compacta=True)` y se ignoran `motor` y `procesos`.
+    estadisticas : sequence of str, optional
+        Resultados a producir, tomados de `ESTADISTICAS_SIMULACION`:
+        "probabilidad" (probabilidad en el origen en `paso_objetivo`),
+        "histograma" (de posiciones finales) y "trayectoria" (gráfica de la
+        última caminata). Por defecto se producen todos.
+    silencioso : bool, optional
+        Si es True, no se informa el avance. Si no, un hilo en segundo plano
+        muestra cada segundo el porcentaje completado, las caminatas por
+        segundo y el tiempo restante (ver `progreso.Progreso`).
+    cache : CacheResultados, optional
+        Si se indica (con motor="lotes" o "compilado"), las posiciones de
+        caminatas ya simuladas con las mismas semillas y pasos se toman de
+        la caché sin volver a simularlas, y las nuevas se guardan en ella.
+    respaldo : str, optional
+        Si se indica (con motor="lotes"), el estado de las caminatas se
+        guarda en ese archivo cada cierto número de pasos con
+        `motor.caminatas_con_respaldo`. Si la simulación se interrumpe,
+        volver a ejecutarla con el mismo archivo continúa desde el último
+        respaldo; con más pasos que los guardados solo se simulan los
+        nuevos. Se ignora `procesos`.
 
     Returns
     -------
-    None
-        La función muestra gráficas y imprime resultados.
+    dict
+        - "pasos_simulados": pasos que se simularon en cada caminata.
+        - "posiciones_finales": lista con la posición final de cada caminata,
+          o None si las caminatas se detuvieron antes del final.
+        - "posiciones_en_paso_objetivo": lista con la posición de cada
+          caminata en `paso_objetivo`.
 
     Notes
     -----
     - Genera un histograma de las posiciones finales de todas las simulaciones
     - Calcula la probabilidad de retornar al origen en el paso específico (por ejemplo, paso 4).
-    - Cada simulación realiza `pasos_por_simulacion` de pasos
+    - Cada simulación realiza solo los pasos que necesitan las estadísticas
+      solicitadas (ver `planificar_pasos`), como máximo `pasos_por_simulacion`
     """
-    posiciones_finales = []
-    posiciones_en_paso_objetivo = []
-
-    for i in range(numero_simulaciones):
-        # Usar una semilla diferente en cada iteración para independencia
-        semilla_actual = semilla_base + i
-
-        historial_posiciones = caminata(semilla_actual, pasos_por_simulacion)
-
-        posiciones_en_paso_objetivo.append(historial_posiciones[paso_objetivo])
-        posiciones_finales.append(historial_posiciones[-1])
-
-        print(
-            f"Ejecutando simulación {i + 1}/{numero_simulaciones} - Posición final: {historial_posiciones[-1]}"
-        )
-
-    # Graficar la trayectoria de la última caminata simulada
-    Utils.graficar_trayectorias(
-        list(range(len(historial_posiciones))), historial_posiciones
-    )
-
-    # Graficar el histograma de posiciones finales
-    Utils.graficar_histograma(posiciones_finales)
-
-    # Calcular y mostrar la probabilidad de estar en el origen en el paso 𝓷
-    probabilidad_origen = calcular_probabilidad(
-        posiciones_en_paso_objetivo, paso_objetivo
+    pasos = planificar_pasos(
+        estadisticas,
+        ESTADISTICAS_SIMULACION,
+        pasos_por_simulacion,
+        paso_objetivo,
+        archivo,
     )
-    print(probabilidad_origen)
+    completas = pasos == pasos_por_simulacion
+    pasos_totales = numero_simulaciones * pasos
+    historial_posiciones = None
+
+    # Los resultados en paralelo son vistas de memoria compartida que se
+    # liberan al terminar de agregarlos
+    with ExitStack() as recursos:
+        with Progreso(numero_simulaciones, pasos, silencioso=silencioso):
+            if archivo is not None:
+                posiciones_finales = []
+                posiciones_en_paso_objetivo = []
+
+                with (
+                    fase(
+                        "caminata", pasos=pasos_totales, caminatas=numero_simulaciones
+                    ),
+                    EscritorArchivo(archivo, numero_simulaciones) as escritor,
+                ):
+                    for i in range(numero_simulaciones):
+                        semilla_actual = semilla_base + i
+                        trayectoria = caminata(semilla_actual, pasos, compacta=True)
+                        escritor.agregar(semilla_actual, trayectoria)
+
+                        posiciones_en_paso_objetivo.append(trayectoria[paso_objetivo])
+                        posiciones_finales.append(trayectoria[-1])
+
+                        avanzar(pasos, 1)
+
+                if numero_simulaciones > 0:
+                    historial_posiciones = np.asarray(trayectoria)
+            elif motor in ("lotes", "compilado"):
+                semillas = semilla_base + np.arange(
+                    numero_simulaciones, dtype=np.uint64
+                )
+                resultado = None
+                if cache is not None:
+                    resultado = cache.consultar(semillas, pasos, [paso_objetivo])
+                    if resultado is not None:
+                        # En 1D las posiciones no tienen el eje de la dimensión
+                        resultado = {
+                            clave: valores[..., 0]
+                            for clave, valores in resultado.items()
+                        }
+                en_cache = resultado is not None
+
+                if en_cache:
+                    avanzar(pasos_totales, numero_simulaciones)
+                elif motor == "compilado":
+                    from nucleos import caminatas_compiladas
+
+                    with fase(
+                        "caminata", pasos=pasos_totales, caminatas=numero_simulaciones
+                    ):
+                        resultado = caminatas_compiladas(
+                            semilla_base, numero_simulaciones, pasos, [paso_objetivo]
+                        )
+                elif respaldo is not None:
+                    resultado = caminatas_con_respaldo(
+                        semillas, pasos, respaldo, puntos_control=[paso_objetivo]
+                    )
+                elif procesos is None:
+                    resultado = caminatas_en_lote(
+                        semillas, pasos, puntos_control=[paso_objetivo]
+                    )
+                else:
+                    with fase(
+                        "caminata", pasos=pasos_totales, caminatas=numero_simulaciones
+                    ):
+                        resultado = recursos.enter_context(
+                            caminatas_en_paralelo(
+                                semilla_base,
+                                numero_simulaciones,
+                                pasos,
+                                puntos_control=[paso_objetivo],
+                                procesos=procesos,
+                            )
+                        )
+                if cache is not None and not en_cache:
+                    cache.guardar_resultado(semillas, pasos, resultado, [paso_objetivo])
+                posiciones_finales = resultado["final"]
+                posiciones_en_paso_objetivo = resultado["puntos_control"][:, 0]
+
+                # Solo la última caminata necesita su trayectoria completa para graficar
+                if "trayectoria" in estadisticas:
+                    historial_posiciones = caminata_por_segmentos(
+                        semilla_base + numero_simulaciones - 1, pasos, 1
+                    )
+            elif motor == "escalar":
+                posiciones_finales = []
+                posiciones_en_paso_objetivo = []
+
+                with fase(
+                    "caminata", pasos=pasos_totales, caminatas=numero_simulaciones
+                ):
+                    for i in range(numero_simulaciones):
+                        # Usar una semilla diferente en cada iteración para independencia
+                        semilla_actual = semilla_base + i
+
+                        historial_posiciones = caminata(semilla_actual, pasos)
+
+                        posiciones_en_paso_objetivo.append(
+                            historial_posiciones[paso_objetivo]
+                        )
+                        posiciones_finales.append(historial_posiciones[-1])
+
+                        avanzar(pasos, 1)
+            else:
+                raise ValueError(f"Motor desconocido: {motor!r}")
+
+        if not completas:
+            print(
+                f"{numero_simulaciones} simulaciones detenidas en el paso {pasos} de {pasos_por_simulacion}"
+            )
+            posiciones_finales = None
+
+        # Graficar la trayectoria de la última caminata simulada
+        if "trayectoria" in estadisticas and historial_posiciones is not None:
+            with fase("graficas"):
+                Utils.graficar_trayectorias(
+                    np.arange(len(historial_posiciones)), historial_posiciones
+                )
+
+        # Graficar el histograma de posiciones finales
+        if "histograma" in estadisticas:
+            with fase("agregacion", caminatas=numero_simulaciones):
+                histograma = HistogramaAcumulado()
+                histograma.agregar(posiciones_finales)
+            with fase("graficas"):
+                Utils.graficar_histograma(histograma)
+
+        # Calcular y mostrar la probabilidad de estar en el origen en el paso 𝓷
+        if "probabilidad" in estadisticas:
+            with fase("agregacion", caminatas=numero_simulaciones):
+                probabilidad_origen = calcular_probabilidad(
+                    posiciones_en_paso_objetivo, paso_objetivo
+                )
+            print(probabilidad_origen)
+
+        # Las posiciones se agregan como arreglos y se devuelven como listas
+        if posiciones_finales is not None:
+            posiciones_finales = np.asarray(posiciones_finales).tolist()
+        return {
+            "pasos_simulados": pasos,
+            "posiciones_finales": posiciones_finales,
+            "posiciones_en_paso_objetivo": np.asarray(
+                posiciones_en_paso_objetivo
+            ).tolist(),
+        }
 
 
 def calcular_probabilidad(posiciones, paso_especifico):
@@ -114,8 +457,8 @@ def calcular_probabilidad(posiciones, paso_especifico):
 
     Parameters
     ----------
-    posiciones : list of int
-        Lista de posiciones finales en un paso específico de múltiples caminatas aleatorias.
+    posiciones : array-like of int
+        Posiciones en un paso específico de múltiples caminatas aleatorias.
     paso_especifico : int
         Índice del paso a analizar (0 = posición inicial, 1 = primer paso, etc.).
 
@@ -129,26 +472,116 @@ def calcular_probabilidad(posiciones, paso_especifico):
     Si el paso_especifico excede la longitud de algún historial, ese historial
     será ignorado al acceder al índice.
     """
-    conteo_en_origen = sum(1 for punto in posiciones if punto == 0)
-
-    probabilidad = conteo_en_origen / len(posiciones)
+    probabilidad = contar_en_origen(posiciones) / len(posiciones)
 
     return f"Probabilidad de que en el paso {paso_especifico} la rana este en el origen: {probabilidad}"
 
 
 if __name__ == "__main__":
-    # Generar semilla única basada en el tiempo actual
-    semilla_base = int(time.time() * 1000000) % (2**32 - 1)
+    parser = argparse.ArgumentParser(description="Caminatas aleatorias en 1D")
+    parser.add_argument(
+        "--graficas",
+        metavar="DIRECTORIO",
+        help="guardar las gráficas en DIRECTORIO sin abrir ventanas",
+    )
+    parser.add_argument("--formato", choices=["png", "svg"], default="png")
+    parser.add_argument(
+        "--metricas-json",
+        metavar="RUTA",
+        help="guardar en RUTA el resumen de tiempos y memoria por fases",
+    )
+    parser.add_argument(
+        "--rastrear-asignaciones",
+        action="store_true",
+        help="medir también la memoria asignada con tracemalloc (más lento)",
+    )
+    parser.add_argument(
+        "--silencioso", action="store_true", help="no informar el avance"
+    )
+    parser.add_argument(
+        "--cache",
+        metavar="DIRECTORIO",
+        help="reutilizar las caminatas ya simuladas guardadas en DIRECTORIO",
+    )
+    parser.add_argument(
+        "--semilla",
+        type=int,
+        help="semilla base fija (por defecto se genera con la hora actual)",
+    )
+    parser.add_argument(
+        "--respaldo",
+        metavar="RUTA",
+        help="guardar el avance en RUTA y continuar desde él si ya existe",
+    )
+    parser.add_argument(
+        "--precision",
+        type=float,
+        help="estimar solo la probabilidad, hasta este semiancho del intervalo",
+    )
+    parser.add_argument(
+        "--precision-relativa",
+        type=float,
+        help="como --precision, pero relativa a la probabilidad estimada",
+    )
+    parser.add_argument(
+        "--tiempo-maximo",
+        type=float,
+        metavar="SEGUNDOS",
+        help="estimar solo la probabilidad durante a lo sumo SEGUNDOS",
+    )
+    parser.add_argument("--confianza", type=float, default=0.95)
+    argumentos = parser.parse_args()
+    if argumentos.graficas is not None:
+        Utils.configurar_salida(argumentos.graficas, argumentos.formato)
+
+    if argumentos.semilla is not None:
+        semilla_base = argumentos.semilla
+    else:
+        # Generar semilla única basada en el tiempo actual
+        semilla_base = int(time.time() * 1000000) % (2**32 - 1)
+
+    cache = None
+    if argumentos.cache is not None:
+        cache = CacheResultados(argumentos.cache, dimension=1)
 
     numero_de_simulaciones = 100
     pasos_por_simulacion = 1000000
     paso_objetivo_para_probabilidad = 4
 
-    # Ejecutar simulaciones
-    Utils.metricas(
-        ejecutar_simulacion,
-        numero_de_simulaciones,
-        semilla_base,
-        pasos_por_simulacion,
-        paso_objetivo_para_probabilidad,
-    )
+    if (
+        argumentos.precision is not None
+        or argumentos.precision_relativa is not None
+        or argumentos.tiempo_maximo is not None
+    ):
+        # Modo adaptativo: tantas caminatas como pida la precisión
+        estimacion = estimar_probabilidad(
+            semilla_base,
+            paso_objetivo_para_probabilidad,
+            DIMENSION,
+            precision=argumentos.precision,
+            precision_relativa=argumentos.precision_relativa,
+            confianza=argumentos.confianza,
+            tiempo_maximo=argumentos.tiempo_maximo,
+        )
+        inferior, superior = estimacion["intervalo"]
+        print(
+            f"Probabilidad de que en el paso {paso_objetivo_para_probabilidad} la "
+            f"rana este en el origen: {estimacion['probabilidad']:.6f} "
+            f"(IC {100 * argumentos.confianza:g}%: [{inferior:.6f}, {superior:.6f}], "
+            f"{estimacion['caminatas']} caminatas, criterio: {estimacion['criterio']})"
+        )
+    else:
+        # Ejecutar simulaciones
+        Utils.metricas(
+            ejecutar_simulacion,
+            numero_de_simulaciones,
+            semilla_base,
+            pasos_por_simulacion,
+            paso_objetivo_para_probabilidad,
+            silencioso=argumentos.silencioso,
+            cache=cache,
+            respaldo=argumentos.respaldo,
+            rastrear_asignaciones=argumentos.rastrear_asignaciones,
+            ruta_json=argumentos.metricas_json,
+        )
+        Utils.esperar_graficas()
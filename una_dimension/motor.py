@@ -0,0 +1,139 @@
+import numpy as np
+import ruta_caminatas  # noqa: F401
+
+from caminatas import motor as motor_zd
+
+# Las caminatas en 1D son las del motor en Z^d de `caminatas.motor` con
+# d = 1; este módulo solo quita el eje de la dimensión de sus resultados.
+DIMENSION = 1
+UMBRAL_DERECHA = 2**31  # R_i < 0.5  <=>  X_i < 2^31
+ESTADISTICAS = motor_zd.ESTADISTICAS
+
+
+def _en_una_dimension(resultado):
+    """
+    Quitar en el lugar el eje de la dimensión de un resultado en Z^d.
+
+    Las posiciones pasan a ser vistas de forma (caminatas,) y
+    "maxima_distancia" vuelve a ser el entero |x|: la raíz cuadrada de un
+    cuadrado perfecto es exacta en float64.
+    """
+    resultado["final"] = resultado["final"][:, 0]
+    resultado["puntos_control"] = resultado["puntos_control"][..., 0]
+    if "maxima_distancia" in resultado:
+        resultado["maxima_distancia"] = resultado["maxima_distancia"].astype(np.int64)
+    return resultado
+
+
+def caminatas_en_lote(
+    semillas,
+    pasos: int,
+    puntos_control=(),
+    estadisticas=(),
+    tamano_bloque=None,
+    generador="lcg",
+    estado=None,
+):
+    """
+    Simular varias caminatas aleatorias en 1D al mismo tiempo.
+
+    Es `caminatas.motor.caminatas_en_lote` con d = 1: el movimiento de cada
+    paso se decide comparando X_i con un umbral entero equivalente a
+    `R_i < 0.5`, por lo que el resultado coincide con `caminata` para cada
+    semilla.
+
+    Parameters
+    ----------
+    semillas : array-like of int
+        Semilla de cada caminata.
+    pasos : int
+        Número de pasos a simular en cada caminata.
+    puntos_control : sequence of int, optional
+        Pasos (entre 0 y `pasos`) en los que se registra la posición.
+    estadisticas : sequence of str, optional
+        Estadísticas adicionales a acumular, tomadas de `ESTADISTICAS`.
+    tamano_bloque : int, optional
+        Cantidad de pasos por bloque.
+    generador : str, optional
+        Generador de números pseudoaleatorios ("lcg" o "splitmix").
+    estado : dict, optional
+        Estado de una ejecución anterior con las mismas semillas, que se
+        actualiza en el lugar (ver `caminatas.motor.caminatas_en_lote`).
+
+    Returns
+    -------
+    dict
+        - "final": arreglo int64 de forma (caminatas,) con la posición final.
+        - "puntos_control": arreglo int64 de forma (caminatas, len(puntos_control))
+          con la posición en cada paso solicitado.
+        - Una entrada por cada estadística solicitada; "maxima_distancia"
+          es el mayor valor de |x| alcanzado (int64).
+
+    Raises
+    ------
+    ValueError
+        Si algún punto de control está fuera del rango [0, pasos], si se
+        solicita una estadística desconocida o si `estado` no puede
+        continuarse con estos argumentos.
+    """
+    return _en_una_dimension(
+        motor_zd.caminatas_en_lote(
+            semillas,
+            pasos,
+            DIMENSION,
+            puntos_control,
+            estadisticas,
+            tamano_bloque,
+            generador,
+            estado,
+        )
+    )
+
+
+def caminatas_con_respaldo(
+    semillas, pasos: int, ruta: str, puntos_control=(), estadisticas=(), generador="lcg"
+):
+    """
+    Simular en lote en 1D guardando el estado en disco cada cierto número de pasos.
+
+    Es `caminatas.motor.caminatas_con_respaldo` con d = 1; el resultado tiene
+    el formato de `caminatas_en_lote`.
+    """
+    return _en_una_dimension(
+        motor_zd.caminatas_con_respaldo(
+            semillas, pasos, DIMENSION, ruta, puntos_control, estadisticas, generador
+        )
+    )
+
+
+def caminatas_en_paralelo(
+    semilla_base,
+    numero_caminatas: int,
+    pasos: int,
+    puntos_control=(),
+    estadisticas=(),
+    procesos=None,
+    caminatas_por_tarea=None,
+    generador="lcg",
+):
+    """
+    Simular caminatas independientes en 1D repartidas en un grupo de procesos.
+
+    Es `caminatas.motor.caminatas_en_paralelo` con d = 1; el resultado tiene
+    el formato de `caminatas_en_lote` y coincide con una ejecución en serie.
+    Es un `caminatas.motor.ResultadoCompartido` cuyos arreglos viven en
+    memoria compartida hasta cerrarlo.
+    """
+    return _en_una_dimension(
+        motor_zd.caminatas_en_paralelo(
+            semilla_base,
+            numero_caminatas,
+            pasos,
+            DIMENSION,
+            puntos_control,
+            estadisticas,
+            procesos,
+            caminatas_por_tarea,
+            generador,
+        )
+    )
@@ -0,0 +1,166 @@
+import numpy as np
+import ruta_caminatas  # noqa: F401
+from motor import UMBRAL_DERECHA, caminatas_en_lote
+
+from caminatas.generador import GeneradorCongruenciaLineal
+from caminatas.progreso import avanzar
+
+try:
+    from numba import njit, prange
+except ImportError:  # numba es opcional: sin él se usan los motores de NumPy
+    njit = None
+    prange = range
+
+NUMBA_DISPONIBLE = njit is not None
+
+# Constantes como uint64 para que el código compilado no mezcle tipos
+_REFERENCIA = GeneradorCongruenciaLineal(0)
+_A = np.uint64(_REFERENCIA.a)
+_C = np.uint64(_REFERENCIA.c)
+_MASCARA = np.uint64(_REFERENCIA.m - 1)  # X mod 2^32 == X & (2^32 - 1)
+_UMBRAL = np.uint64(UMBRAL_DERECHA)
+
+
+def _compilar(**opciones):
+    """Compilar la función con numba si está disponible; si no, dejarla igual."""
+
+    def decorar(funcion):
+        if njit is None:
+            return funcion
+        return njit(cache=True, nogil=True, **opciones)(funcion)
+
+    return decorar
+
+
+@_compilar()
+def _posiciones_nucleo(semilla, pasos, posiciones):
+    """Generar X_i, decidir el movimiento y acumular la posición en una pasada."""
+    x = semilla
+    posicion = 0
+    posiciones[0] = 0
+    for k in range(pasos):
+        x = (_A * x + _C) & _MASCARA
+        if x < _UMBRAL:
+            posicion -= 1
+        else:
+            posicion += 1
+        posiciones[k + 1] = posicion
+
+
+@_compilar(parallel=True)
+def _lote_nucleo(semillas, pasos, controles, finales, registro):
+    """
+    Simular cada caminata en su propio hilo sin arreglos intermedios.
+
+    `controles` debe estar ordenado; registro[i, j] recibe la posición de la
+    caminata i en el paso controles[j].
+    """
+    for i in prange(len(semillas)):
+        x = semillas[i]
+        posicion = 0
+        j = 0
+        while j < len(controles) and controles[j] == 0:
+            registro[i, j] = 0
+            j += 1
+
+        for k in range(1, pasos + 1):
+            x = (_A * x + _C) & _MASCARA
+            if x < _UMBRAL:
+                posicion -= 1
+            else:
+                posicion += 1
+            while j < len(controles) and controles[j] == k:
+                registro[i, j] = posicion
+                j += 1
+
+        finales[i] = posicion
+
+
+def posiciones_caminata(semilla: int, pasos: int):
+    """
+    Calcular todas las posiciones de una caminata con el núcleo compilado.
+
+    Parameters
+    ----------
+    semilla : int
+        Semilla inicial para el generador de números pseudoaleatorios.
+    pasos : int
+        Número de pasos a simular.
+
+    Returns
+    -------
+    numpy.ndarray of int64
+        Posiciones en los pasos 0, ..., pasos; idénticas a las de `caminata`
+        con la misma semilla.
+
+    Notes
+    -----
+    - Sin numba se calcula con NumPy a partir de `generar_Xi`.
+    - La primera llamada compila el núcleo (o lo carga de la caché en disco).
+    """
+    if not NUMBA_DISPONIBLE:
+        derecha = (
+            GeneradorCongruenciaLineal(semilla).generar_Xi(pasos) >= UMBRAL_DERECHA
+        )
+        posiciones = np.zeros(pasos + 1, dtype=np.int64)
+        np.cumsum(derecha.astype(np.int64) * 2 - 1, out=posiciones[1:])
+        return posiciones
+
+    posiciones = np.empty(pasos + 1, dtype=np.int64)
+    _posiciones_nucleo(np.uint64(semilla) & _MASCARA, pasos, posiciones)
+    return posiciones
+
+
+def caminatas_compiladas(
+    semilla_base, numero_caminatas: int, pasos: int, puntos_control=()
+):
+    """
+    Simular caminatas independientes con el núcleo compilado, una por hilo.
+
+    Cada caminata fusiona en un solo bucle compilado la generación de X_i,
+    la comparación con el umbral y la acumulación de la posición, sin
+    arreglos intermedios. Los hilos de numba reemplazan a los procesos de
+    `caminatas_en_paralelo`.
+
+    Parameters
+    ----------
+    semilla_base : int
+        Semilla de la primera caminata; la caminata i usa semilla_base + i.
+    numero_caminatas : int
+        Cantidad de caminatas a simular.
+    pasos : int
+        Número de pasos a simular en cada caminata.
+    puntos_control : sequence of int, optional
+        Pasos (entre 0 y `pasos`) en los que se registra la posición.
+
+    Returns
+    -------
+    dict
+        Mismo formato y valores que `caminatas_en_lote` (sin estadísticas).
+
+    Raises
+    ------
+    ValueError
+        Si algún punto de control está fuera del rango [0, pasos].
+
+    Notes
+    -----
+    Sin numba se usa `caminatas_en_lote`.
+    """
+    semillas = semilla_base + np.arange(numero_caminatas, dtype=np.uint64)
+    if not NUMBA_DISPONIBLE:
+        return caminatas_en_lote(semillas, pasos, puntos_control)
+
+    puntos_control = np.asarray([int(paso) for paso in puntos_control], dtype=np.int64)
+    if np.any((puntos_control < 0) | (puntos_control > pasos)):
+        raise ValueError(f"Los puntos de control deben estar entre 0 y {pasos}")
+
+    orden = np.argsort(puntos_control, kind="stable")
+    finales = np.empty(numero_caminatas, dtype=np.int64)
+    registro = np.empty((numero_caminatas, len(puntos_control)), dtype=np.int64)
+    _lote_nucleo(semillas & _MASCARA, pasos, puntos_control[orden], finales, registro)
+    avanzar(numero_caminatas * pasos, numero_caminatas)
+
+    # Devolver los puntos de control en el orden en que se pidieron
+    registro[:, orden] = registro.copy()
+    return {"final": finales, "puntos_control": registro}
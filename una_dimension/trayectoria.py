@@ -0,0 +1,242 @@
+import numpy as np
+from motor import UMBRAL_DERECHA
+
+INTERVALO_INDICE = 1024  # Pasos entre posiciones guardadas en el índice
+TAMANO_BLOQUE = 2**20  # Pasos procesados por bloque (múltiplo de INTERVALO_INDICE)
+PASOS_POR_SALIDA = 64  # Pasos tomados de cada salida de 64 bits (1 bit por paso)
+
+# Desplazamiento neto de los 8 pasos guardados en cada valor posible de un byte
+DESPLAZAMIENTO_BYTE = (
+    np.unpackbits(np.arange(256, dtype=np.uint8)[:, None], axis=1).sum(axis=1) * 2 - 8
+).astype(np.int8)
+
+
+class TrayectoriaCompacta:
+    """
+    Trayectoria de una caminata aleatoria en 1D almacenada con 1 bit por paso.
+
+    Cada paso se guarda como un bit (1 = derecha, 0 = izquierda) empaquetado
+    en un arreglo uint8. Las posiciones se reconstruyen bajo demanda con
+    sumas acumuladas por bloques, usando un índice disperso con la posición
+    cada `INTERVALO_INDICE` pasos.
+
+    Attributes
+    ----------
+    --> pasos (int): Número de pasos de la caminata.
+    --> bits (numpy.ndarray): Pasos empaquetados, 8 por byte.
+    --> indice (numpy.ndarray): Posición cada INTERVALO_INDICE pasos.
+
+    Methods
+    -------
+    desde_generador(generador, pasos)
+        Construye la trayectoria consumiendo `pasos` números del generador.
+
+    desde_salidas(generador, pasos)
+        Construye la trayectoria tomando 64 pasos de cada salida de 64 bits.
+
+    posicion(k)
+        Devuelve la posición en el paso k.
+
+    posiciones(inicio, fin)
+        Devuelve las posiciones de los pasos inicio, ..., fin - 1.
+
+    Notes
+    -----
+    - `len(trayectoria)` es pasos + 1, igual que la lista de `caminata`.
+    - Admite indexado con enteros y slices, y conversión con `numpy.asarray`.
+    - Ocupa alrededor de 1/8 de byte por paso frente a ~28-36 bytes por
+      entero de una lista de Python.
+    """
+
+    def __init__(self, bits, pasos: int, indice):
+        """
+        Crear la trayectoria a partir de sus datos ya empaquetados.
+
+        Parameters
+        ----------
+        bits : numpy.ndarray of uint8
+            Pasos empaquetados con `numpy.packbits` (1 = derecha).
+        pasos : int
+            Número de pasos de la caminata.
+        indice : numpy.ndarray of int64
+            Posición en cada múltiplo de INTERVALO_INDICE, comenzando en 0.
+        """
+        self.bits = bits
+        self.pasos = pasos
+        self.indice = indice
+
+    @classmethod
+    def desde_generador(cls, generador, pasos: int):
+        """
+        Construir la trayectoria consumiendo `pasos` números del generador.
+
+        Parameters
+        ----------
+        generador : GeneradorCongruenciaLineal
+            Generador con la semilla de la caminata. Su estado avanza `pasos`.
+        pasos : int
+            Número de pasos a simular.
+
+        Returns
+        -------
+        TrayectoriaCompacta
+            Trayectoria equivalente a la de `caminata` con la misma semilla.
+        """
+        bits = np.empty(-(-pasos // 8), dtype=np.uint8)
+        indice = np.empty(pasos // INTERVALO_INDICE + 1, dtype=np.int64)
+        indice[0] = 0
+        posicion_actual = 0
+
+        for inicio in range(0, pasos, TAMANO_BLOQUE):
+            n = min(TAMANO_BLOQUE, pasos - inicio)
+            derecha = generador.generar_Xi(n) >= UMBRAL_DERECHA
+            bits[inicio // 8 : (inicio + n + 7) // 8] = np.packbits(derecha)
+
+            movimientos = derecha.astype(np.int8) * 2 - 1
+            completos = n // INTERVALO_INDICE
+            sumas = movimientos[: completos * INTERVALO_INDICE].reshape(
+                completos, INTERVALO_INDICE
+            )
+            primero = inicio // INTERVALO_INDICE + 1
+            indice[primero : primero + completos] = posicion_actual + np.cumsum(
+                sumas.sum(axis=1, dtype=np.int64)
+            )
+            posicion_actual += int(movimientos.sum(dtype=np.int64))
+
+        return cls(bits, pasos, indice)
+
+    @classmethod
+    def desde_salidas(cls, generador, pasos: int):
+        """
+        Construir la trayectoria tomando 64 pasos de cada salida de 64 bits.
+
+        Los bytes de las salidas (en orden little-endian) se usan
+        directamente como el arreglo `bits`, por lo que cada paso cuesta
+        1/64 de una llamada al generador y no hay que comparar ni empaquetar
+        nada. El índice se calcula con una tabla del desplazamiento de cada
+        byte.
+
+        Parameters
+        ----------
+        generador : GeneradorSplitMix
+            Generador con todos sus bits de buena calidad (los bits bajos de
+            una congruencia lineal no lo son). Avanza ceil(pasos / 64) salidas.
+        pasos : int
+            Número de pasos a simular.
+
+        Returns
+        -------
+        TrayectoriaCompacta
+            Trayectoria con los pasos tomados de los bits de las salidas.
+        """
+        salidas = generador.generar_salidas(-(-pasos // PASOS_POR_SALIDA))
+        bits = np.asarray(salidas, dtype="<u8").view(np.uint8)[: -(-pasos // 8)]
+
+        # Apagar los bits sobrantes del último byte, igual que `numpy.packbits`
+        sobrantes = -pasos % 8
+        if sobrantes:
+            bits[-1] &= (0xFF << sobrantes) & 0xFF
+
+        completos = pasos // INTERVALO_INDICE
+        sumas = DESPLAZAMIENTO_BYTE[bits[: completos * INTERVALO_INDICE // 8]]
+        sumas = sumas.reshape(completos, INTERVALO_INDICE // 8)
+        indice = np.zeros(completos + 1, dtype=np.int64)
+        np.cumsum(sumas.sum(axis=1, dtype=np.int64), out=indice[1:])
+
+        return cls(bits, pasos, indice)
+
+    def __len__(self):
+        return self.pasos + 1
+
+    @property
+    def nbytes(self):
+        """Memoria ocupada por los datos de la trayectoria, en bytes."""
+        return self.bits.nbytes + self.indice.nbytes
+
+    def _movimientos(self, inicio: int, fin: int):
+        """Movimientos (-1 o +1) de los pasos inicio + 1, ..., fin."""
+        primer_byte = inicio // 8
+        desplazamiento = inicio - primer_byte * 8
+        derecha = np.unpackbits(
+            self.bits[primer_byte : -(-fin // 8)],
+            count=fin - primer_byte * 8,
+        )[desplazamiento:]
+        return derecha.astype(np.int8) * 2 - 1
+
+    def posicion(self, k: int):
+        """
+        Devolver la posición en el paso k.
+
+        Parte de la posición guardada en el índice más cercana por debajo de
+        k, por lo que el costo está acotado por INTERVALO_INDICE pasos.
+
+        Parameters
+        ----------
+        k : int
+            Paso a consultar (0 <= k <= pasos). Se admiten índices negativos.
+
+        Returns
+        -------
+        int
+            Posición de la rana en el paso k.
+        """
+        if k < 0:
+            k += len(self)
+        if not 0 <= k <= self.pasos:
+            raise IndexError("Paso fuera del rango de la trayectoria")
+
+        base = (k // INTERVALO_INDICE) * INTERVALO_INDICE
+        restantes = k - base
+        if restantes == 0:
+            return int(self.indice[k // INTERVALO_INDICE])
+
+        derecha = np.unpackbits(self.bits[base // 8 :], count=restantes)
+        return (
+            int(self.indice[k // INTERVALO_INDICE])
+            + 2 * int(np.count_nonzero(derecha))
+            - restantes
+        )
+
+    def posiciones(self, inicio: int = 0, fin=None):
+        """
+        Reconstruir las posiciones de los pasos inicio, ..., fin - 1.
+
+        Parameters
+        ----------
+        inicio : int, optional
+            Primer paso a reconstruir.
+        fin : int, optional
+            Paso final (excluido). Por defecto, pasos + 1.
+
+        Returns
+        -------
+        numpy.ndarray of int64
+            Posiciones solicitadas.
+        """
+        if fin is None:
+            fin = len(self)
+        inicio, fin = max(0, inicio), min(fin, len(self))
+        resultado = np.empty(max(0, fin - inicio), dtype=np.int64)
+        if len(resultado) == 0:
+            return resultado
+
+        resultado[0] = self.posicion(inicio)
+        for desde in range(inicio, fin - 1, TAMANO_BLOQUE):
+            hasta = min(desde + TAMANO_BLOQUE, fin - 1)
+            segmento = resultado[desde - inicio + 1 : hasta - inicio + 1]
+            np.cumsum(self._movimientos(desde, hasta), out=segmento)
+            segmento += resultado[desde - inicio]
+
+        return resultado
+
+    def __getitem__(self, clave):
+        if isinstance(clave, slice):
+            inicio, fin, salto = clave.indices(len(self))
+            if salto < 0:
+                return self.posiciones()[clave]
+            return self.posiciones(inicio, fin)[::salto]
+        return self.posicion(clave)
+
+    def __array__(self, dtype=None, copy=None):
+        posiciones = self.posiciones()
+        return posiciones if dtype is None else posiciones.astype(dtype)
@@ -1,7 +1,91 @@
-import time
+import functools
+import os
+from concurrent.futures import ThreadPoolExecutor
 
-import matplotlib.pyplot as plt
 import numpy as np
+import ruta_caminatas  # noqa: F401
+from acumuladores import HistogramaAcumulado
+
+from caminatas.perfilador import Perfilador
+
+# Modo sin ventanas: si hay un directorio, las figuras se guardan en archivos
+_salida = {"directorio": None, "formato": "png", "contador": 0}
+_renderizador = None  # Hilo único que dibuja las figuras en modo sin ventanas
+_pendientes = []  # Figuras enviadas al hilo de dibujo
+
+
+def _pyplot():
+    """
+    Importar matplotlib.pyplot solo cuando se va a graficar.
+
+    En modo sin ventanas se usa el backend no interactivo "Agg", que no
+    necesita un entorno gráfico.
+    """
+    if _salida["directorio"] is not None:
+        import matplotlib
+
+        matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+
+    return plt
+
+
+def _mostrar(plt, nombre: str, block: bool = True):
+    """Mostrar la figura actual o, en modo sin ventanas, guardarla y cerrarla."""
+    if _salida["directorio"] is None:
+        plt.show(block=block)
+        return
+
+    _salida["contador"] += 1
+    ruta = os.path.join(
+        _salida["directorio"],
+        f"{_salida['contador']:03d}_{nombre}.{_salida['formato']}",
+    )
+    plt.savefig(ruta)
+    plt.close()
+
+
+def _en_segundo_plano(graficador):
+    """
+    Ejecutar un método de graficado en el hilo de dibujo en modo sin ventanas.
+
+    Así la simulación continúa sin esperar a que se genere la figura. Fuera
+    de ese modo, el método se ejecuta normalmente.
+    """
+
+    @functools.wraps(graficador)
+    def envoltura(*args, **kwargs):
+        if _salida["directorio"] is None:
+            return graficador(*args, **kwargs)
+        _pendientes.append(_renderizador.submit(graficador, *args, **kwargs))
+
+    return envoltura
+
+
+def _indices_extremos(valores, numero_grupos: int):
+    """
+    Índices de los valores mínimo y máximo de cada grupo de puntos consecutivos.
+
+    Divide `valores` en `numero_grupos` grupos de igual tamaño (el último
+    puede ser más corto) y devuelve, ordenados y sin repetir, los índices
+    del mínimo y del máximo de cada grupo junto con el primero y el último.
+    """
+    n = len(valores)
+    tamano = -(-n // numero_grupos)  # Redondeo hacia arriba
+    completos = n // tamano
+    cuerpo = valores[: completos * tamano].reshape(completos, tamano)
+    desplazamientos = np.arange(completos) * tamano
+
+    indices = [
+        np.array([0, n - 1]),
+        desplazamientos + cuerpo.argmin(axis=1),
+        desplazamientos + cuerpo.argmax(axis=1),
+    ]
+    resto = valores[completos * tamano :]
+    if len(resto):
+        indices.append(completos * tamano + np.array([resto.argmin(), resto.argmax()]))
+
+    return np.unique(np.concatenate(indices))
 
 
 class Utils:
@@ -17,9 +101,18 @@ class Utils:
     graficar_trayectorias(x, y)
         Grafica la trayectoria completa de una caminata aleatoria en 1D.
 
+    decimar_trayectoria(x, y, numero_grupos)
+        Reduce una trayectoria larga conservando su forma para graficarla.
+
     graficar_histograma(posiciones_finales)
         Genera un histograma de las posiciones finales de múltiples
-        caminatas aleatorias.
+        caminatas aleatorias (lista o HistogramaAcumulado).
+
+    configurar_salida(directorio, formato)
+        Activa el modo sin ventanas, que guarda las figuras en archivos.
+
+    esperar_graficas()
+        Espera a que terminen de guardarse las figuras pendientes.
 
     metricas(funcion, *args)
         Mide y muestra el tiempo de ejecución y consumo de memoria de una
@@ -32,7 +125,84 @@ class Utils:
     """
 
     @staticmethod
-    def graficar_trayectorias(x, y):
+    def configurar_salida(directorio=None, formato: str = "png"):
+        """
+        Activar o desactivar el modo sin ventanas.
+
+        En modo sin ventanas las gráficas se dibujan con un backend no
+        interactivo en un hilo de fondo y se guardan como archivos
+        numerados en `directorio`, en lugar de abrir ventanas.
+
+        Parameters
+        ----------
+        directorio : str or os.PathLike, optional
+            Carpeta donde guardar las figuras (se crea si no existe). Con
+            None se vuelve a mostrar las figuras en ventanas.
+        formato : {"png", "svg"}, optional
+            Formato de los archivos de imagen.
+        """
+        global _renderizador
+
+        Utils.esperar_graficas()
+        if directorio is None:
+            _salida["directorio"] = None
+            return
+
+        os.makedirs(directorio, exist_ok=True)
+        _salida.update(directorio=directorio, formato=formato, contador=0)
+        if _renderizador is None:
+            _renderizador = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="graficas"
+            )
+
+    @staticmethod
+    def esperar_graficas():
+        """
+        Esperar a que el hilo de dibujo termine las figuras pendientes.
+
+        Raises
+        ------
+        Exception
+            La primera excepción ocurrida al dibujar alguna figura.
+        """
+        while _pendientes:
+            _pendientes.pop(0).result()
+
+    @staticmethod
+    def decimar_trayectoria(x, y, numero_grupos: int):
+        """
+        Reducir una trayectoria larga a pocos puntos conservando su forma.
+
+        Divide la trayectoria en `numero_grupos` grupos de pasos consecutivos
+        y conserva, en orden, el punto mínimo y el máximo de cada grupo. Así
+        se mantienen exactos el inicio, el final y los extremos de la
+        caminata, y la gráfica se ve igual que con todos los puntos.
+
+        Parameters
+        ----------
+        x : array-like
+            Secuencia de iteraciones (números de paso).
+        y : array-like
+            Secuencia de posiciones correspondientes a cada iteración.
+        numero_grupos : int
+            Cantidad de grupos, normalmente el ancho en píxeles de la gráfica.
+
+        Returns
+        -------
+        tuple of numpy.ndarray
+            Arreglos (x, y) con a lo sumo 2 * numero_grupos + 2 puntos.
+        """
+        x = np.asarray(x)
+        y = np.asarray(y)
+        if len(y) <= 2 * numero_grupos:
+            return x, y
+
+        indices = _indices_extremos(y, numero_grupos)
+        return x[indices], y[indices]
+
+    @staticmethod
+    @_en_segundo_plano
+    def graficar_trayectorias(x, y, decimar=True):
         """
         Graficar la trayectoria de una caminata aleatoria en una dimensión.
 
@@ -42,9 +212,18 @@ class Utils:
             Secuencia de iteraciones (números de paso).
         y : list or array-like
             Secuencia de posiciones correspondientes a cada iteración.
+        decimar : bool, optional
+            Si es True (por defecto), la trayectoria se reduce con
+            `decimar_trayectoria` al ancho en píxeles de la figura, por lo
+            que el tiempo de graficado no depende del número de pasos.
 
         """
-        plt.figure(figsize=(7, 7))
+        plt = _pyplot()
+        figura = plt.figure(figsize=(7, 7))
+        if decimar:
+            ancho_pixeles = int(figura.get_size_inches()[0] * figura.dpi)
+            x, y = Utils.decimar_trayectoria(x, y, ancho_pixeles)
+
         plt.plot(x, y, "o-", color="orange", linewidth=1.5, markersize=4)
         plt.axhline(y=0, color="black", linewidth=0.8)  # Línea horizontal en y=0
         plt.axvline(x=0, color="black", linewidth=0.8)  # Línea vertical en x=0
@@ -52,9 +231,10 @@ class Utils:
         plt.xlabel("Iteracion")
         plt.ylabel("Movimiento")
         plt.grid(True, alpha=0.3)
-        plt.show(block=False)
+        _mostrar(plt, "trayectoria", block=False)
 
     @staticmethod
+    @_en_segundo_plano
     def graficar_histograma(posiciones_finales):
         """
         Generar un histograma de las posiciones finales de múltiples caminatas.
@@ -62,17 +242,25 @@ class Utils:
 
         Parameters
         ----------
-        posiciones_finales : list of int
-            Lista con las posiciones finales de cada caminata aleatoria.
+        posiciones_finales : list of int or HistogramaAcumulado
+            Lista con las posiciones finales de cada caminata aleatoria, o
+            un histograma ya acumulado con ellas.
 
         """
+        histograma = posiciones_finales
+        if not isinstance(histograma, HistogramaAcumulado):
+            histograma = HistogramaAcumulado()
+            histograma.agregar(posiciones_finales)
+        posiciones, conteos = histograma.valores()
 
+        plt = _pyplot()
         plt.figure(figsize=(8, 6))
-        bins = int(np.sqrt(len(posiciones_finales)))
+        bins = int(np.sqrt(histograma.total))
 
         plt.hist(
-            posiciones_finales,
+            posiciones,
             bins=bins,
+            weights=conteos,
             color="blue",
             alpha=0.7,
             edgecolor="black",
@@ -83,12 +271,17 @@ class Utils:
         plt.ylabel("Frecuencia")
         plt.grid(True, alpha=0.2, axis="y")
         plt.tight_layout()
-        plt.show()
+        _mostrar(plt, "histograma")
 
     @staticmethod
-    def metricas(funcion, *args):
+    def metricas(funcion, *args, rastrear_asignaciones=False, ruta_json=None, **kwargs):
         """
-        Medir tiempo de ejecución y consumo de memoria (en MB) de una función.
+        Medir tiempo de ejecución, memoria y rendimiento por fases de una función.
+
+        La función se ejecuta con un `Perfilador` activo, que mide con
+        `time.perf_counter_ns` las fases instrumentadas (generación,
+        caminata, agregación y gráficas) y toma la memoria residente del
+        proceso, lo que casi no altera el tiempo de la ejecución.
 
         Parameters
         ----------
@@ -96,24 +289,24 @@ class Utils:
             Función a ejecutar y medir.
         *args
             Argumentos posicionales a pasar a la función.
+        rastrear_asignaciones : bool, optional
+            Si es True, también mide la memoria asignada con tracemalloc,
+            que hace más lenta la ejecución.
+        ruta_json : str or os.PathLike, optional
+            Si se indica, el resumen se guarda en ese archivo como JSON.
+        **kwargs
+            Argumentos con nombre a pasar a la función.
 
+        Returns
+        -------
+        object
+            El valor devuelto por `funcion`.
         """
-        import tracemalloc
-
-        tracemalloc.start()
-
-        start_time = time.time()
-        resultado = funcion(*args)
-        end_time = time.time()
+        with Perfilador(rastrear_asignaciones) as perfilador:
+            resultado = funcion(*args, **kwargs)
 
-        current, peak = tracemalloc.get_traced_memory()
-        tracemalloc.stop()
-
-        print(
-            f"Tiempo de ejecución: {end_time - start_time:.4f} segundos. Equivalente en minutos: {(end_time - start_time) / 60:.2f} minutos"
-        )
-        print(
-            f"Memoria utilizada: {current / 10**6:.4f} MB; Pico de memoria: {peak / 10**6:.4f} MB"
-        )
+        perfilador.imprimir()
+        if ruta_json is not None:
+            perfilador.a_json(ruta_json)
 
         return resultado